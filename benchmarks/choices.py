@@ -0,0 +1,67 @@
+"""Per-call cost of ``Choices`` validation.
+
+Compares the compiled, type-dispatched validator against the generic validation
+cascade (the only implementation available prior to compilation), for each
+combination of flags; and the compiled validator with a memo cache enabled.
+
+Run with::
+
+    $ python benchmarks/choices.py
+"""
+
+from timeit import repeat
+
+from travertino.colors import rgb
+from travertino.constants import BOLD, NONE, NORMAL
+from travertino.declaration import Choices
+
+CASES = [
+    ("constants", Choices(NORMAL, BOLD, NONE), [BOLD, NONE]),
+    ("string", Choices(NONE, string=True), ["Helvetica", NONE]),
+    ("integer", Choices(NONE, integer=True), [10, "10", NONE]),
+    ("number", Choices(NONE, number=True), [10, 1.5, "1.5", NONE]),
+    ("color", Choices(NONE, color=True), ["#ff0000", "red", rgb(1, 2, 3), NONE]),
+    (
+        "number+color",
+        Choices(NONE, number=True, color=True),
+        [1.5, "#ff0000", rgb(1, 2, 3), NONE],
+    ),
+    (
+        "all",
+        Choices(NONE, string=True, integer=True, number=True, color=True),
+        [10, 1.5, "Helvetica", rgb(1, 2, 3), NONE],
+    ),
+]
+
+
+def per_call(func, value, number=100_000):
+    """Return the best per-call time of ``func(value)``, in nanoseconds."""
+    return min(repeat(lambda: func(value), number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    print(
+        f"{'flags':<14} {'value':<16} {'generic':>10} {'compiled':>10} "
+        f"{'speedup':>8} {'cached':>10}"
+    )
+    for name, choices, values in CASES:
+        cached = Choices(
+            *choices.constants,
+            string=choices.string,
+            integer=choices.integer,
+            number=choices.number,
+            color=choices.color,
+            cache_size=128,
+        )
+        for value in values:
+            generic = per_call(choices._validate_generic, value)
+            compiled = per_call(choices.validate, value)
+            memo = per_call(cached.validate, value)
+            print(
+                f"{name:<14} {value!r:<16} {generic:>8.0f}ns {compiled:>8.0f}ns "
+                f"{generic / compiled:>7.1f}x {memo:>8.0f}ns"
+            )
+
+
+if __name__ == "__main__":
+    main()
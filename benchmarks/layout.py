@@ -0,0 +1,146 @@
+"""Time taken to refresh a large tree after a small change.
+
+A simple layout algorithm visits every box that needs layout; it's compared with
+the same algorithm visiting every box, as it would if boxes weren't marked dirty.
+A dashboard of tiles, each with changing contents, is also refreshed with and
+without the tiles being relayout boundaries.
+
+Run with::
+
+    $ python benchmarks/layout.py
+"""
+
+from time import perf_counter
+
+from travertino.declaration import BaseStyle
+from travertino.layout import BaseBox, Viewport
+from travertino.node import Node
+from travertino.size import BaseIntrinsicSize
+
+NODE_COUNT = 20_000
+TILE_COUNT = 200
+TILE_SIZE = 100
+CHANGED_TILES = 5
+REPEATS = 20
+
+
+def _needs_no_layout(node):
+    return not node.layout.needs_layout
+
+
+class Style(BaseStyle):
+    IntrinsicSize = BaseIntrinsicSize
+    Box = BaseBox
+
+    # Whether the layout visits every box, or only those that need layout.
+    incremental = True
+
+    def apply(self, property, value):
+        pass
+
+    def layout(self, viewport):
+        self._lay_out(self._applicator.node, viewport)
+
+    def layout_subtree(self, viewport):
+        for child in self._applicator.node.children:
+            self._lay_out(child, viewport)
+
+    def _lay_out(self, node, viewport):
+        prune = _needs_no_layout if self.incremental else None
+        for descendant in node.walk_preorder(prune=prune):
+            box = descendant.layout
+            box.content_width = descendant.intrinsic.width or viewport.width
+            box.content_height = descendant.intrinsic.height or 10
+
+
+class Applicator:
+    node = None
+
+    def set_bounds(self):
+        pass
+
+
+def tree():
+    root = Node(style=Style(), applicator=Applicator(), children=[])
+    nodes = [root]
+    for i in range(1, NODE_COUNT):
+        node = Node(style=Style(), children=[] if i < NODE_COUNT // 10 else None)
+        nodes[(i - 1) // 10].add(node)
+        nodes.append(node)
+    return nodes
+
+
+def timed(nodes, incremental):
+    # The best of several refreshes after changing a single leaf, in milliseconds.
+    root, leaf = nodes[0], nodes[-1]
+    root.style.incremental = incremental
+    viewport = Viewport(width=640, height=480)
+    root.refresh(viewport)
+
+    best = None
+    for i in range(REPEATS):
+        leaf.intrinsic.width = i + 1
+        start = perf_counter()
+        root.refresh(viewport)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def dashboard(boundaries):
+    tiles = []
+    for _ in range(TILE_COUNT):
+        tile = Node(
+            style=Style(),
+            applicator=Applicator(),
+            children=[Node(style=Style()) for _ in range(TILE_SIZE)],
+        )
+        tile.relayout_boundary = boundaries
+        tiles.append(tile)
+    root = Node(style=Style(), applicator=Applicator(), children=tiles)
+    root.style.incremental = False
+    return root, tiles
+
+
+def timed_dashboard(boundaries):
+    # The best of several refreshes after changing a leaf in some of the tiles, in
+    # milliseconds.
+    root, tiles = dashboard(boundaries)
+    viewport = Viewport(width=640, height=480)
+    root.refresh(viewport)
+
+    best = None
+    for i in range(REPEATS):
+        for tile in tiles[:CHANGED_TILES]:
+            tile.children[0].intrinsic.width = i + 1
+        start = perf_counter()
+        root.refresh(viewport)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main():
+    nodes = tree()
+    viewport = Viewport(width=640, height=480)
+
+    print(f"{NODE_COUNT} nodes, one leaf changed")
+    print(f"full layout:        {timed(nodes, incremental=False):8.3f}ms")
+    print(f"dirty boxes only:   {timed(nodes, incremental=True):8.3f}ms")
+
+    start = perf_counter()
+    nodes[0].refresh(viewport)
+    elapsed = perf_counter() - start
+    print(f"nothing changed:    {elapsed * 1000:8.3f}ms")
+
+    print()
+    print(
+        f"{TILE_COUNT} tiles of {TILE_SIZE} nodes, {CHANGED_TILES} tiles changed, "
+        "layout visiting every box"
+    )
+    print(f"no boundaries:      {timed_dashboard(boundaries=False):8.3f}ms")
+    print(f"tiles as boundaries:{timed_dashboard(boundaries=True):8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Time taken to change the children of a node with many children.
+
+Compares the bulk operations on a node with doing the same thing one child at a
+time, times removing every child of a very wide node, in various orders, and
+compares walking a tree with a recursive walk over ``children``.
+
+Run with::
+
+    $ python benchmarks/node.py
+"""
+
+from random import Random
+from time import perf_counter
+
+from travertino.declaration import BaseStyle
+from travertino.layout import BaseBox
+from travertino.node import Node
+from travertino.size import BaseIntrinsicSize
+
+CHILD_COUNT = 5_000
+WIDE_COUNT = 50_000
+TREE_COUNT = 20_000
+REPEATS = 20
+
+
+class Style(BaseStyle):
+    IntrinsicSize = BaseIntrinsicSize
+    Box = BaseBox
+
+    def apply(self, property, value):
+        pass
+
+
+def make_children(count):
+    # Each child has a child of its own, so that re-parenting it has a subtree to
+    # deal with.
+    style = Style()
+    return [Node(style=style, children=[Node(style=style)]) for _ in range(count)]
+
+
+def recursive_walk(node):
+    yield node
+    for child in node.children:
+        yield from recursive_walk(child)
+
+
+def timed(operation):
+    # The best of several runs, in milliseconds.
+    best = None
+    for _ in range(REPEATS):
+        start = perf_counter()
+        operation()
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main():
+    node = Node(style=Style(), children=[])
+    first = make_children(CHILD_COUNT)
+    # Half the rows are kept from one refresh to the next, in a different order.
+    second = first[::2][::-1] + make_children(CHILD_COUNT // 2)
+
+    def add_each():
+        node.clear()
+        for child in first:
+            node.add(child)
+
+    def extend():
+        node.clear()
+        node.extend(first)
+
+    def replace_each():
+        node.clear()
+        for child in first:
+            node.add(child)
+        node.clear()
+        for child in second:
+            node.add(child)
+
+    def replace_children():
+        node.replace_children(first)
+        node.replace_children(second)
+
+    def move_each():
+        for child in node.children[-10:]:
+            node.remove(child)
+            node.insert(0, child)
+
+    def move():
+        for child in node.children[-10:]:
+            node.move(child, 0)
+
+    print(f"{CHILD_COUNT} children")
+    print(f"add one at a time:     {timed(add_each):8.2f}ms")
+    print(f"extend:                {timed(extend):8.2f}ms")
+    print(f"clear and re-add:      {timed(replace_each):8.2f}ms")
+    print(f"replace_children:      {timed(replace_children):8.2f}ms")
+    print(f"remove and re-add 10:  {timed(move_each):8.2f}ms")
+    print(f"move 10:               {timed(move):8.2f}ms")
+
+    style = Style()
+    rows = [Node(style=style) for _ in range(WIDE_COUNT)]
+    shuffled = list(rows)
+    Random(42).shuffle(shuffled)
+    orders = {
+        "first to last": rows,
+        "last to first": rows[::-1],
+        "random order": shuffled,
+    }
+
+    print()
+    print(f"removing {WIDE_COUNT} children")
+    for name, order in orders.items():
+        node = Node(style=style, children=rows)
+        start = perf_counter()
+        for row in order:
+            node.remove(row)
+        print(f"{name + ':':22} {(perf_counter() - start) * 1000:8.1f}ms")
+
+    node = Node(style=style, children=rows)
+    start = perf_counter()
+    for row in shuffled:
+        node.index_of(row)
+    elapsed = perf_counter() - start
+    print(f"index_of every child:  {elapsed * 1000:8.1f}ms")
+
+    # A tree in which each node has up to 10 children.
+    tree = [Node(style=style, children=[]) for _ in range(TREE_COUNT // 10)]
+    tree += [Node(style=style) for _ in range(TREE_COUNT - len(tree))]
+    for index, child in enumerate(tree[1:], 1):
+        tree[(index - 1) // 10].add(child)
+
+    print()
+    print(f"walking {TREE_COUNT} nodes")
+    walks = {
+        "recursive": lambda: recursive_walk(tree[0]),
+        "walk_preorder": tree[0].walk_preorder,
+        "walk_postorder": tree[0].walk_postorder,
+        "walk_breadth_first": tree[0].walk_breadth_first,
+    }
+    for name, walk in walks.items():
+        elapsed = timed(lambda: sum(1 for _ in walk()))
+        print(f"{name + ':':22} {elapsed:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Throughput of the declaration and stylesheet parsers.
+
+Also times a stylesheet made up of a single long comment, which spans many of the
+chunks that the source is read in.
+
+Run with::
+
+    $ python benchmarks/parser.py
+"""
+
+from io import StringIO
+from time import perf_counter
+
+from travertino.declaration import (
+    BaseStyle,
+    Choices,
+    directional_property,
+    list_property,
+    validated_property,
+)
+from travertino.parser import parse_declarations, parse_stylesheet
+
+SIZE = 4_000_000
+
+
+class Style(BaseStyle):
+    padding = directional_property("padding{}")
+    padding_top = validated_property(Choices(integer=True), initial=0)
+    padding_right = validated_property(Choices(integer=True), initial=0)
+    padding_bottom = validated_property(Choices(integer=True), initial=0)
+    padding_left = validated_property(Choices(integer=True), initial=0)
+    color = validated_property(Choices(color=True))
+    font_weight = validated_property(Choices("normal", "bold"), initial="normal")
+    font_family = list_property(Choices(string=True), initial=("system",))
+
+    def apply(self, property, value):
+        pass
+
+
+DECLARATIONS = (
+    "padding: 5 10; color: #333; font-weight: bold; "
+    "font-family: 'Helvetica Neue', sans-serif"
+)
+RULE = f"/* Rule {{index}} */\nBox.toolbar Button#b{{index}} {{{{ {DECLARATIONS} }}}}\n"
+
+
+def throughput(text, parse):
+    start = perf_counter()
+    for _ in parse(StringIO(text), Style):
+        pass
+    elapsed = perf_counter() - start
+    return len(text.encode()) / elapsed / 1_000_000
+
+
+def main():
+    declarations = "; ".join([DECLARATIONS] * (SIZE // (len(DECLARATIONS) + 2)))
+    stylesheet = []
+    size = 0
+    while size < SIZE:
+        stylesheet.append(RULE.format(index=len(stylesheet)))
+        size += len(stylesheet[-1])
+    stylesheet = "".join(stylesheet)
+
+    print(f"declarations: {throughput(declarations, parse_declarations):5.1f} MB/s")
+    print(f"stylesheet:   {throughput(stylesheet, parse_stylesheet):5.1f} MB/s")
+
+    comment = f"/* {'x' * SIZE} */ Box {{ color: red }}"
+    print(f"long comment: {throughput(comment, parse_stylesheet):5.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
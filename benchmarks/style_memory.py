@@ -0,0 +1,106 @@
+"""Memory used by large numbers of style instances.
+
+Defines a style class with 60 properties, creates 10k and 100k instances with a
+handful of properties set on each, and reports the memory allocated per instance;
+both for independently constructed styles, and for copies of a template style.
+
+For comparison, the same is measured for a style that stores each value in an
+instance attribute, as styles did before values were stored in slots.
+
+Run with::
+
+    $ python benchmarks/style_memory.py
+"""
+
+import gc
+import subprocess
+import sys
+import tracemalloc
+
+from travertino.declaration import BaseStyle, Choices, validated_property
+
+CHOICES = Choices("a", "b", "c", integer=True)
+PROPERTY_COUNT = 60
+
+
+class Style(BaseStyle):
+    def apply(self, property, value):
+        pass
+
+
+for i in range(PROPERTY_COUNT):
+    prop = validated_property(CHOICES, initial="a")
+    setattr(Style, f"prop_{i}", prop)
+    prop.__set_name__(Style, f"prop_{i}")
+
+
+class DictStyle:
+    """A style that stores each value as an attribute named after its property."""
+
+    def __setitem__(self, name, value):
+        setattr(self, f"_{name}", value)
+
+    def copy(self):
+        dup = DictStyle()
+        for name, value in self.__dict__.items():
+            setattr(dup, name, value)
+        return dup
+
+
+def measure(count, set_count, copies, style_class=Style):
+    template = style_class()
+    for i in range(set_count):
+        template[f"prop_{i * 3}"] = i
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    if copies:
+        styles = [template.copy() for _ in range(count)]
+    else:
+        styles = [style_class() for _ in range(count)]
+        for style in styles:
+            for i in range(set_count):
+                style[f"prop_{i * 3}"] = i
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del styles
+    return (after - before) / count
+
+
+def main():
+    # Each measurement is made in a fresh interpreter, so that the layout of instance
+    # dictionaries isn't influenced by previous measurements.
+    def run(*args):
+        result = subprocess.run(
+            [sys.executable, __file__, *map(str, args)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return float(result.stdout)
+
+    print(
+        f"{'styles':>8} {'set':>4} {'bytes/style':>12} {'(dict)':>8} "
+        f"{'bytes/copy':>12} {'(dict)':>8}"
+    )
+    for count in [10_000, 100_000]:
+        for set_count in [0, 5, 20]:
+            print(
+                f"{count:>8} {set_count:>4} "
+                f"{run(count, set_count, 0, 0):>12.0f} "
+                f"{run(count, set_count, 0, 1):>8.0f} "
+                f"{run(count, set_count, 1, 0):>12.0f} "
+                f"{run(count, set_count, 1, 1):>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        count, set_count, copies, dict_storage = map(int, sys.argv[1:])
+        style_class = DictStyle if dict_storage else Style
+        print(measure(count, set_count, bool(copies), style_class))
+    else:
+        main()
@@ -0,0 +1,143 @@
+"""Per-call cost of common operations on style instances.
+
+Run with::
+
+    $ python benchmarks/style_operations.py
+"""
+
+import sys
+from dataclasses import dataclass
+from timeit import repeat
+
+from travertino.declaration import (
+    BaseStyle,
+    Choices,
+    directional_property,
+    validated_property,
+)
+
+CHOICES = Choices("a", "b", "c", integer=True)
+PROPERTY_COUNT = 60
+
+
+class Style(BaseStyle):
+    padding = directional_property("padding{}")
+    padding_top = validated_property(CHOICES, initial=0)
+    padding_right = validated_property(CHOICES, initial=0)
+    padding_bottom = validated_property(CHOICES, initial=0)
+    padding_left = validated_property(CHOICES, initial=0)
+
+    def apply(self, property, value):
+        pass
+
+
+for i in range(PROPERTY_COUNT):
+    prop = validated_property(CHOICES, initial="a")
+    setattr(Style, f"prop_{i}", prop)
+    prop.__set_name__(Style, f"prop_{i}")
+
+
+# The same properties, on a style decorated as a dataclass, as Toga's styles are.
+DataclassStyle = type(
+    "DataclassStyle",
+    (BaseStyle,),
+    {
+        "__annotations__": {f"prop_{i}": "int | str" for i in range(PROPERTY_COUNT)},
+        **{
+            f"prop_{i}": validated_property(CHOICES, initial="a")
+            for i in range(PROPERTY_COUNT)
+        },
+        "apply": Style.apply,
+    },
+)
+DataclassStyle = dataclass(
+    **({"kw_only": True} if sys.version_info >= (3, 10) else {"init": False})
+)(DataclassStyle)
+
+
+class HashableStyle(Style, hashable=True):
+    pass
+
+
+def template(set_count):
+    style = Style()
+    for i in range(set_count):
+        style[f"prop_{i * 3}"] = i + 1
+    return style
+
+
+def per_call(func, number=20_000):
+    """Return the best per-call time of ``func()``, in nanoseconds."""
+    return min(repeat(func, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    print(f"{'operation':<24} {'set':>4} {'time':>10}")
+    for set_count in [0, 5, 20]:
+        style = template(set_count)
+        print(f"{'copy':<24} {set_count:>4} {per_call(style.copy):>8.0f}ns")
+
+        def copy_and_write():
+            style.copy().prop_1 = 2
+
+        print(
+            f"{'copy, then write':<24} {set_count:>4} {per_call(copy_and_write):>8.0f}ns"
+        )
+
+    for style_class in [Style, DataclassStyle, HashableStyle]:
+        print(f"\n{style_class.__name__}, 5 properties set")
+        style = style_class(prop_0=1, prop_3=2, prop_6=3, prop_9=4, prop_12=5)
+        same = style.copy()
+        other = style.copy()
+        other.prop_12 = 6
+
+        def construct():
+            return style_class(prop_0=1, prop_3=2, prop_6=3)
+
+        def get():
+            return style.prop_3
+
+        def set():
+            style.prop_3 = 10
+            style.prop_3 = 2
+
+        def hash_after_write():
+            style.prop_3 = 10
+            hash(style)
+            style.prop_3 = 2
+            return hash(style)
+
+        operations = [
+            ("construct (empty)", style_class),
+            ("construct (3 set)", construct),
+            ("copy", style.copy),
+            ("equal (shared copy)", lambda: style == same),
+            ("equal (different)", lambda: style == other),
+            ("get", get),
+            ("set (x2)", set),
+        ]
+        if style_class is HashableStyle:
+            operations += [
+                ("hash (cached)", lambda: hash(style)),
+                ("set, then hash (x2)", hash_after_write),
+            ]
+        for name, func in operations:
+            print(f"{name:<24} {'':>4} {per_call(func):>8.0f}ns")
+
+    print()
+    style = template(5)
+    style.padding = (1, 2)
+
+    def get_directional():
+        return style.padding
+
+    def set_directional():
+        style.padding = (1, 2, 3, 4)
+        style.padding = (1, 2)
+
+    print(f"{'get directional':<24} {'':>4} {per_call(get_directional):>8.0f}ns")
+    print(f"{'set directional (x2)':<24} {'':>4} {per_call(set_directional):>8.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Time taken to find the matching rules for every node in a large tree.
+
+Compares the stylesheet's index with checking every rule against every node.
+
+Run with::
+
+    $ python benchmarks/stylesheet.py
+"""
+
+from time import perf_counter
+
+from travertino.declaration import BaseStyle
+from travertino.layout import BaseBox
+from travertino.node import Node
+from travertino.size import BaseIntrinsicSize
+from travertino.stylesheet import Stylesheet
+
+RULE_COUNT = 300
+NODE_COUNT = 20_000
+
+
+class Style(BaseStyle):
+    IntrinsicSize = BaseIntrinsicSize
+    Box = BaseBox
+
+    def apply(self, property, value):
+        pass
+
+
+class Widget(Node):
+    def __init__(self, index):
+        self.id = f"widget-{index}"
+        self.classes = [f"class-{index % 50}"]
+        super().__init__(style=Style(), children=[])
+
+
+def stylesheet():
+    sheet = Stylesheet()
+    for i in range(RULE_COUNT):
+        kind = i % 3
+        if kind == 0:
+            sheet.add(f"#widget-{i * 7}", {})
+        elif kind == 1:
+            sheet.add(f"Widget .class-{i % 50}", {})
+        else:
+            sheet.add(f".class-{i % 50}.other", {})
+    return sheet
+
+
+def tree():
+    root = Widget(0)
+    nodes = [root]
+    for i in range(1, NODE_COUNT):
+        node = Widget(i)
+        nodes[(i - 1) // 10].add(node)
+        nodes.append(node)
+    return nodes
+
+
+def main():
+    sheet = stylesheet()
+    nodes = tree()
+
+    start = perf_counter()
+    indexed = [sheet.matching(node) for node in nodes]
+    indexed_time = perf_counter() - start
+
+    start = perf_counter()
+    brute = [[rule for rule in sheet if rule.selector.matches(node)] for node in nodes]
+    brute_time = perf_counter() - start
+
+    assert [len(rules) for rules in indexed] == [len(rules) for rules in brute]
+    print(f"{RULE_COUNT} rules, {NODE_COUNT} nodes")
+    print(f"every rule: {brute_time * 1000:8.1f}ms")
+    print(f"indexed:    {indexed_time * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,52 @@
-try:
-    # Read version from SCM metadata
-    # This will only exist in a development environment
-    from setuptools_scm import get_version
-
-    # Excluded from coverage because a pure test environment (such as the one
-    # used by tox in CI) won't have setuptools_scm
-    __version__ = get_version("../..", relative_to=__file__)  # pragma: no cover
-except (ModuleNotFoundError, LookupError):
-    # If setuptools_scm isn't in the environment, the call to import will fail.
-    # If it *is* in the environment, but the code isn't a git checkout (e.g.,
-    # it's been pip installed non-editable) the call to get_version() will fail.
-    # If either of these occurs, read version from the installer metadata.
-
-    from importlib.metadata import version
-
-    __version__ = version("travertino")
+# Submodules, and the version, are only loaded when they're first used, so that
+# importing the package itself is as cheap as possible.
+_SUBMODULES = {
+    "colors",
+    "constants",
+    "declaration",
+    "fonts",
+    "layout",
+    "node",
+    "parser",
+    "size",
+    "stylesheet",
+}
+
+
+def _get_version():
+    try:
+        # Read version from SCM metadata
+        # This will only exist in a development environment
+        from setuptools_scm import get_version
+
+        # Excluded from coverage because a pure test environment (such as the one
+        # used by tox in CI) won't have setuptools_scm
+        return get_version("../..", relative_to=__file__)  # pragma: no cover
+    except (ModuleNotFoundError, LookupError):
+        # If setuptools_scm isn't in the environment, the call to import will fail.
+        # If it *is* in the environment, but the code isn't a git checkout (e.g.,
+        # it's been pip installed non-editable) the call to get_version() will fail.
+        # If either of these occurs, read version from the installer metadata.
+
+        from importlib.metadata import version
+
+        return version("travertino")
+
+
+def __getattr__(name):
+    if name == "__version__":
+        value = _get_version()
+    elif name in _SUBMODULES:
+        from importlib import import_module
+
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Store the value, so this isn't called again for the same name.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | {"__version__"})
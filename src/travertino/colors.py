@@ -232,162 +232,164 @@ def color(value):
                 pass
         else:
             try:
-                return NAMED_COLOR[value.lower()]
+                return _named_colors()[value.lower()]
             except KeyError:
                 pass
 
     raise ValueError("Unknown color %s" % value)
 
 
-NAMED_COLOR = {
-    ALICEBLUE: rgb(0xF0, 0xF8, 0xFF),
-    ANTIQUEWHITE: rgb(0xFA, 0xEB, 0xD7),
-    AQUA: rgb(0x00, 0xFF, 0xFF),
-    AQUAMARINE: rgb(0x7F, 0xFF, 0xD4),
-    AZURE: rgb(0xF0, 0xFF, 0xFF),
-    BEIGE: rgb(0xF5, 0xF5, 0xDC),
-    BISQUE: rgb(0xFF, 0xE4, 0xC4),
-    BLACK: rgb(0x00, 0x00, 0x00),
-    BLANCHEDALMOND: rgb(0xFF, 0xEB, 0xCD),
-    BLUE: rgb(0x00, 0x00, 0xFF),
-    BLUEVIOLET: rgb(0x8A, 0x2B, 0xE2),
-    BROWN: rgb(0xA5, 0x2A, 0x2A),
-    BURLYWOOD: rgb(0xDE, 0xB8, 0x87),
-    CADETBLUE: rgb(0x5F, 0x9E, 0xA0),
-    CHARTREUSE: rgb(0x7F, 0xFF, 0x00),
-    CHOCOLATE: rgb(0xD2, 0x69, 0x1E),
-    CORAL: rgb(0xFF, 0x7F, 0x50),
-    CORNFLOWERBLUE: rgb(0x64, 0x95, 0xED),
-    CORNSILK: rgb(0xFF, 0xF8, 0xDC),
-    CRIMSON: rgb(0xDC, 0x14, 0x3C),
-    CYAN: rgb(0x00, 0xFF, 0xFF),
-    DARKBLUE: rgb(0x00, 0x00, 0x8B),
-    DARKCYAN: rgb(0x00, 0x8B, 0x8B),
-    DARKGOLDENROD: rgb(0xB8, 0x86, 0x0B),
-    DARKGRAY: rgb(0xA9, 0xA9, 0xA9),
-    DARKGREY: rgb(0xA9, 0xA9, 0xA9),
-    DARKGREEN: rgb(0x00, 0x64, 0x00),
-    DARKKHAKI: rgb(0xBD, 0xB7, 0x6B),
-    DARKMAGENTA: rgb(0x8B, 0x00, 0x8B),
-    DARKOLIVEGREEN: rgb(0x55, 0x6B, 0x2F),
-    DARKORANGE: rgb(0xFF, 0x8C, 0x00),
-    DARKORCHID: rgb(0x99, 0x32, 0xCC),
-    DARKRED: rgb(0x8B, 0x00, 0x00),
-    DARKSALMON: rgb(0xE9, 0x96, 0x7A),
-    DARKSEAGREEN: rgb(0x8F, 0xBC, 0x8F),
-    DARKSLATEBLUE: rgb(0x48, 0x3D, 0x8B),
-    DARKSLATEGRAY: rgb(0x2F, 0x4F, 0x4F),
-    DARKSLATEGREY: rgb(0x2F, 0x4F, 0x4F),
-    DARKTURQUOISE: rgb(0x00, 0xCE, 0xD1),
-    DARKVIOLET: rgb(0x94, 0x00, 0xD3),
-    DEEPPINK: rgb(0xFF, 0x14, 0x93),
-    DEEPSKYBLUE: rgb(0x00, 0xBF, 0xFF),
-    DIMGRAY: rgb(0x69, 0x69, 0x69),
-    DIMGREY: rgb(0x69, 0x69, 0x69),
-    DODGERBLUE: rgb(0x1E, 0x90, 0xFF),
-    FIREBRICK: rgb(0xB2, 0x22, 0x22),
-    FLORALWHITE: rgb(0xFF, 0xFA, 0xF0),
-    FORESTGREEN: rgb(0x22, 0x8B, 0x22),
-    FUCHSIA: rgb(0xFF, 0x00, 0xFF),
-    GAINSBORO: rgb(0xDC, 0xDC, 0xDC),
-    GHOSTWHITE: rgb(0xF8, 0xF8, 0xFF),
-    GOLD: rgb(0xFF, 0xD7, 0x00),
-    GOLDENROD: rgb(0xDA, 0xA5, 0x20),
-    GRAY: rgb(0x80, 0x80, 0x80),
-    GREY: rgb(0x80, 0x80, 0x80),
-    GREEN: rgb(0x00, 0x80, 0x00),
-    GREENYELLOW: rgb(0xAD, 0xFF, 0x2F),
-    HONEYDEW: rgb(0xF0, 0xFF, 0xF0),
-    HOTPINK: rgb(0xFF, 0x69, 0xB4),
-    INDIANRED: rgb(0xCD, 0x5C, 0x5C),
-    INDIGO: rgb(0x4B, 0x00, 0x82),
-    IVORY: rgb(0xFF, 0xFF, 0xF0),
-    KHAKI: rgb(0xF0, 0xE6, 0x8C),
-    LAVENDER: rgb(0xE6, 0xE6, 0xFA),
-    LAVENDERBLUSH: rgb(0xFF, 0xF0, 0xF5),
-    LAWNGREEN: rgb(0x7C, 0xFC, 0x00),
-    LEMONCHIFFON: rgb(0xFF, 0xFA, 0xCD),
-    LIGHTBLUE: rgb(0xAD, 0xD8, 0xE6),
-    LIGHTCORAL: rgb(0xF0, 0x80, 0x80),
-    LIGHTCYAN: rgb(0xE0, 0xFF, 0xFF),
-    LIGHTGOLDENRODYELLOW: rgb(0xFA, 0xFA, 0xD2),
-    LIGHTGRAY: rgb(0xD3, 0xD3, 0xD3),
-    LIGHTGREY: rgb(0xD3, 0xD3, 0xD3),
-    LIGHTGREEN: rgb(0x90, 0xEE, 0x90),
-    LIGHTPINK: rgb(0xFF, 0xB6, 0xC1),
-    LIGHTSALMON: rgb(0xFF, 0xA0, 0x7A),
-    LIGHTSEAGREEN: rgb(0x20, 0xB2, 0xAA),
-    LIGHTSKYBLUE: rgb(0x87, 0xCE, 0xFA),
-    LIGHTSLATEGRAY: rgb(0x77, 0x88, 0x99),
-    LIGHTSLATEGREY: rgb(0x77, 0x88, 0x99),
-    LIGHTSTEELBLUE: rgb(0xB0, 0xC4, 0xDE),
-    LIGHTYELLOW: rgb(0xFF, 0xFF, 0xE0),
-    LIME: rgb(0x00, 0xFF, 0x00),
-    LIMEGREEN: rgb(0x32, 0xCD, 0x32),
-    LINEN: rgb(0xFA, 0xF0, 0xE6),
-    MAGENTA: rgb(0xFF, 0x00, 0xFF),
-    MAROON: rgb(0x80, 0x00, 0x00),
-    MEDIUMAQUAMARINE: rgb(0x66, 0xCD, 0xAA),
-    MEDIUMBLUE: rgb(0x00, 0x00, 0xCD),
-    MEDIUMORCHID: rgb(0xBA, 0x55, 0xD3),
-    MEDIUMPURPLE: rgb(0x93, 0x70, 0xDB),
-    MEDIUMSEAGREEN: rgb(0x3C, 0xB3, 0x71),
-    MEDIUMSLATEBLUE: rgb(0x7B, 0x68, 0xEE),
-    MEDIUMSPRINGGREEN: rgb(0x00, 0xFA, 0x9A),
-    MEDIUMTURQUOISE: rgb(0x48, 0xD1, 0xCC),
-    MEDIUMVIOLETRED: rgb(0xC7, 0x15, 0x85),
-    MIDNIGHTBLUE: rgb(0x19, 0x19, 0x70),
-    MINTCREAM: rgb(0xF5, 0xFF, 0xFA),
-    MISTYROSE: rgb(0xFF, 0xE4, 0xE1),
-    MOCCASIN: rgb(0xFF, 0xE4, 0xB5),
-    NAVAJOWHITE: rgb(0xFF, 0xDE, 0xAD),
-    NAVY: rgb(0x00, 0x00, 0x80),
-    OLDLACE: rgb(0xFD, 0xF5, 0xE6),
-    OLIVE: rgb(0x80, 0x80, 0x00),
-    OLIVEDRAB: rgb(0x6B, 0x8E, 0x23),
-    ORANGE: rgb(0xFF, 0xA5, 0x00),
-    ORANGERED: rgb(0xFF, 0x45, 0x00),
-    ORCHID: rgb(0xDA, 0x70, 0xD6),
-    PALEGOLDENROD: rgb(0xEE, 0xE8, 0xAA),
-    PALEGREEN: rgb(0x98, 0xFB, 0x98),
-    PALETURQUOISE: rgb(0xAF, 0xEE, 0xEE),
-    PALEVIOLETRED: rgb(0xDB, 0x70, 0x93),
-    PAPAYAWHIP: rgb(0xFF, 0xEF, 0xD5),
-    PEACHPUFF: rgb(0xFF, 0xDA, 0xB9),
-    PERU: rgb(0xCD, 0x85, 0x3F),
-    PINK: rgb(0xFF, 0xC0, 0xCB),
-    PLUM: rgb(0xDD, 0xA0, 0xDD),
-    POWDERBLUE: rgb(0xB0, 0xE0, 0xE6),
-    PURPLE: rgb(0x80, 0x00, 0x80),
-    REBECCAPURPLE: rgb(0x66, 0x33, 0x99),
-    RED: rgb(0xFF, 0x00, 0x00),
-    ROSYBROWN: rgb(0xBC, 0x8F, 0x8F),
-    ROYALBLUE: rgb(0x41, 0x69, 0xE1),
-    SADDLEBROWN: rgb(0x8B, 0x45, 0x13),
-    SALMON: rgb(0xFA, 0x80, 0x72),
-    SANDYBROWN: rgb(0xF4, 0xA4, 0x60),
-    SEAGREEN: rgb(0x2E, 0x8B, 0x57),
-    SEASHELL: rgb(0xFF, 0xF5, 0xEE),
-    SIENNA: rgb(0xA0, 0x52, 0x2D),
-    SILVER: rgb(0xC0, 0xC0, 0xC0),
-    SKYBLUE: rgb(0x87, 0xCE, 0xEB),
-    SLATEBLUE: rgb(0x6A, 0x5A, 0xCD),
-    SLATEGRAY: rgb(0x70, 0x80, 0x90),
-    SLATEGREY: rgb(0x70, 0x80, 0x90),
-    SNOW: rgb(0xFF, 0xFA, 0xFA),
-    SPRINGGREEN: rgb(0x00, 0xFF, 0x7F),
-    STEELBLUE: rgb(0x46, 0x82, 0xB4),
-    TAN: rgb(0xD2, 0xB4, 0x8C),
-    TEAL: rgb(0x00, 0x80, 0x80),
-    THISTLE: rgb(0xD8, 0xBF, 0xD8),
-    TOMATO: rgb(0xFF, 0x63, 0x47),
-    TURQUOISE: rgb(0x40, 0xE0, 0xD0),
-    VIOLET: rgb(0xEE, 0x82, 0xEE),
-    WHEAT: rgb(0xF5, 0xDE, 0xB3),
-    WHITE: rgb(0xFF, 0xFF, 0xFF),
-    WHITESMOKE: rgb(0xF5, 0xF5, 0xF5),
-    YELLOW: rgb(0xFF, 0xFF, 0x00),
-    YELLOWGREEN: rgb(0x9A, 0xCD, 0x32),
+# The (red, green, blue) components of each named color. The rgb instances are only
+# created the first time a named color is needed.
+_NAMED_COLOR_RGB = {
+    ALICEBLUE: (0xF0, 0xF8, 0xFF),
+    ANTIQUEWHITE: (0xFA, 0xEB, 0xD7),
+    AQUA: (0x00, 0xFF, 0xFF),
+    AQUAMARINE: (0x7F, 0xFF, 0xD4),
+    AZURE: (0xF0, 0xFF, 0xFF),
+    BEIGE: (0xF5, 0xF5, 0xDC),
+    BISQUE: (0xFF, 0xE4, 0xC4),
+    BLACK: (0x00, 0x00, 0x00),
+    BLANCHEDALMOND: (0xFF, 0xEB, 0xCD),
+    BLUE: (0x00, 0x00, 0xFF),
+    BLUEVIOLET: (0x8A, 0x2B, 0xE2),
+    BROWN: (0xA5, 0x2A, 0x2A),
+    BURLYWOOD: (0xDE, 0xB8, 0x87),
+    CADETBLUE: (0x5F, 0x9E, 0xA0),
+    CHARTREUSE: (0x7F, 0xFF, 0x00),
+    CHOCOLATE: (0xD2, 0x69, 0x1E),
+    CORAL: (0xFF, 0x7F, 0x50),
+    CORNFLOWERBLUE: (0x64, 0x95, 0xED),
+    CORNSILK: (0xFF, 0xF8, 0xDC),
+    CRIMSON: (0xDC, 0x14, 0x3C),
+    CYAN: (0x00, 0xFF, 0xFF),
+    DARKBLUE: (0x00, 0x00, 0x8B),
+    DARKCYAN: (0x00, 0x8B, 0x8B),
+    DARKGOLDENROD: (0xB8, 0x86, 0x0B),
+    DARKGRAY: (0xA9, 0xA9, 0xA9),
+    DARKGREY: (0xA9, 0xA9, 0xA9),
+    DARKGREEN: (0x00, 0x64, 0x00),
+    DARKKHAKI: (0xBD, 0xB7, 0x6B),
+    DARKMAGENTA: (0x8B, 0x00, 0x8B),
+    DARKOLIVEGREEN: (0x55, 0x6B, 0x2F),
+    DARKORANGE: (0xFF, 0x8C, 0x00),
+    DARKORCHID: (0x99, 0x32, 0xCC),
+    DARKRED: (0x8B, 0x00, 0x00),
+    DARKSALMON: (0xE9, 0x96, 0x7A),
+    DARKSEAGREEN: (0x8F, 0xBC, 0x8F),
+    DARKSLATEBLUE: (0x48, 0x3D, 0x8B),
+    DARKSLATEGRAY: (0x2F, 0x4F, 0x4F),
+    DARKSLATEGREY: (0x2F, 0x4F, 0x4F),
+    DARKTURQUOISE: (0x00, 0xCE, 0xD1),
+    DARKVIOLET: (0x94, 0x00, 0xD3),
+    DEEPPINK: (0xFF, 0x14, 0x93),
+    DEEPSKYBLUE: (0x00, 0xBF, 0xFF),
+    DIMGRAY: (0x69, 0x69, 0x69),
+    DIMGREY: (0x69, 0x69, 0x69),
+    DODGERBLUE: (0x1E, 0x90, 0xFF),
+    FIREBRICK: (0xB2, 0x22, 0x22),
+    FLORALWHITE: (0xFF, 0xFA, 0xF0),
+    FORESTGREEN: (0x22, 0x8B, 0x22),
+    FUCHSIA: (0xFF, 0x00, 0xFF),
+    GAINSBORO: (0xDC, 0xDC, 0xDC),
+    GHOSTWHITE: (0xF8, 0xF8, 0xFF),
+    GOLD: (0xFF, 0xD7, 0x00),
+    GOLDENROD: (0xDA, 0xA5, 0x20),
+    GRAY: (0x80, 0x80, 0x80),
+    GREY: (0x80, 0x80, 0x80),
+    GREEN: (0x00, 0x80, 0x00),
+    GREENYELLOW: (0xAD, 0xFF, 0x2F),
+    HONEYDEW: (0xF0, 0xFF, 0xF0),
+    HOTPINK: (0xFF, 0x69, 0xB4),
+    INDIANRED: (0xCD, 0x5C, 0x5C),
+    INDIGO: (0x4B, 0x00, 0x82),
+    IVORY: (0xFF, 0xFF, 0xF0),
+    KHAKI: (0xF0, 0xE6, 0x8C),
+    LAVENDER: (0xE6, 0xE6, 0xFA),
+    LAVENDERBLUSH: (0xFF, 0xF0, 0xF5),
+    LAWNGREEN: (0x7C, 0xFC, 0x00),
+    LEMONCHIFFON: (0xFF, 0xFA, 0xCD),
+    LIGHTBLUE: (0xAD, 0xD8, 0xE6),
+    LIGHTCORAL: (0xF0, 0x80, 0x80),
+    LIGHTCYAN: (0xE0, 0xFF, 0xFF),
+    LIGHTGOLDENRODYELLOW: (0xFA, 0xFA, 0xD2),
+    LIGHTGRAY: (0xD3, 0xD3, 0xD3),
+    LIGHTGREY: (0xD3, 0xD3, 0xD3),
+    LIGHTGREEN: (0x90, 0xEE, 0x90),
+    LIGHTPINK: (0xFF, 0xB6, 0xC1),
+    LIGHTSALMON: (0xFF, 0xA0, 0x7A),
+    LIGHTSEAGREEN: (0x20, 0xB2, 0xAA),
+    LIGHTSKYBLUE: (0x87, 0xCE, 0xFA),
+    LIGHTSLATEGRAY: (0x77, 0x88, 0x99),
+    LIGHTSLATEGREY: (0x77, 0x88, 0x99),
+    LIGHTSTEELBLUE: (0xB0, 0xC4, 0xDE),
+    LIGHTYELLOW: (0xFF, 0xFF, 0xE0),
+    LIME: (0x00, 0xFF, 0x00),
+    LIMEGREEN: (0x32, 0xCD, 0x32),
+    LINEN: (0xFA, 0xF0, 0xE6),
+    MAGENTA: (0xFF, 0x00, 0xFF),
+    MAROON: (0x80, 0x00, 0x00),
+    MEDIUMAQUAMARINE: (0x66, 0xCD, 0xAA),
+    MEDIUMBLUE: (0x00, 0x00, 0xCD),
+    MEDIUMORCHID: (0xBA, 0x55, 0xD3),
+    MEDIUMPURPLE: (0x93, 0x70, 0xDB),
+    MEDIUMSEAGREEN: (0x3C, 0xB3, 0x71),
+    MEDIUMSLATEBLUE: (0x7B, 0x68, 0xEE),
+    MEDIUMSPRINGGREEN: (0x00, 0xFA, 0x9A),
+    MEDIUMTURQUOISE: (0x48, 0xD1, 0xCC),
+    MEDIUMVIOLETRED: (0xC7, 0x15, 0x85),
+    MIDNIGHTBLUE: (0x19, 0x19, 0x70),
+    MINTCREAM: (0xF5, 0xFF, 0xFA),
+    MISTYROSE: (0xFF, 0xE4, 0xE1),
+    MOCCASIN: (0xFF, 0xE4, 0xB5),
+    NAVAJOWHITE: (0xFF, 0xDE, 0xAD),
+    NAVY: (0x00, 0x00, 0x80),
+    OLDLACE: (0xFD, 0xF5, 0xE6),
+    OLIVE: (0x80, 0x80, 0x00),
+    OLIVEDRAB: (0x6B, 0x8E, 0x23),
+    ORANGE: (0xFF, 0xA5, 0x00),
+    ORANGERED: (0xFF, 0x45, 0x00),
+    ORCHID: (0xDA, 0x70, 0xD6),
+    PALEGOLDENROD: (0xEE, 0xE8, 0xAA),
+    PALEGREEN: (0x98, 0xFB, 0x98),
+    PALETURQUOISE: (0xAF, 0xEE, 0xEE),
+    PALEVIOLETRED: (0xDB, 0x70, 0x93),
+    PAPAYAWHIP: (0xFF, 0xEF, 0xD5),
+    PEACHPUFF: (0xFF, 0xDA, 0xB9),
+    PERU: (0xCD, 0x85, 0x3F),
+    PINK: (0xFF, 0xC0, 0xCB),
+    PLUM: (0xDD, 0xA0, 0xDD),
+    POWDERBLUE: (0xB0, 0xE0, 0xE6),
+    PURPLE: (0x80, 0x00, 0x80),
+    REBECCAPURPLE: (0x66, 0x33, 0x99),
+    RED: (0xFF, 0x00, 0x00),
+    ROSYBROWN: (0xBC, 0x8F, 0x8F),
+    ROYALBLUE: (0x41, 0x69, 0xE1),
+    SADDLEBROWN: (0x8B, 0x45, 0x13),
+    SALMON: (0xFA, 0x80, 0x72),
+    SANDYBROWN: (0xF4, 0xA4, 0x60),
+    SEAGREEN: (0x2E, 0x8B, 0x57),
+    SEASHELL: (0xFF, 0xF5, 0xEE),
+    SIENNA: (0xA0, 0x52, 0x2D),
+    SILVER: (0xC0, 0xC0, 0xC0),
+    SKYBLUE: (0x87, 0xCE, 0xEB),
+    SLATEBLUE: (0x6A, 0x5A, 0xCD),
+    SLATEGRAY: (0x70, 0x80, 0x90),
+    SLATEGREY: (0x70, 0x80, 0x90),
+    SNOW: (0xFF, 0xFA, 0xFA),
+    SPRINGGREEN: (0x00, 0xFF, 0x7F),
+    STEELBLUE: (0x46, 0x82, 0xB4),
+    TAN: (0xD2, 0xB4, 0x8C),
+    TEAL: (0x00, 0x80, 0x80),
+    THISTLE: (0xD8, 0xBF, 0xD8),
+    TOMATO: (0xFF, 0x63, 0x47),
+    TURQUOISE: (0x40, 0xE0, 0xD0),
+    VIOLET: (0xEE, 0x82, 0xEE),
+    WHEAT: (0xF5, 0xDE, 0xB3),
+    WHITE: (0xFF, 0xFF, 0xFF),
+    WHITESMOKE: (0xF5, 0xF5, 0xF5),
+    YELLOW: (0xFF, 0xFF, 0x00),
+    YELLOWGREEN: (0x9A, 0xCD, 0x32),
 }
 
 
@@ -400,4 +402,23 @@ __all__ = [
     "color",
     "NAMED_COLOR",
     "TRANSPARENT",
-] + [name.upper() for name in NAMED_COLOR.keys()]
+] + [name.upper() for name in _NAMED_COLOR_RGB.keys()]
+
+
+def _named_colors():
+    global NAMED_COLOR
+    try:
+        return NAMED_COLOR
+    except NameError:
+        NAMED_COLOR = {
+            name: rgb(*rgb_values) for name, rgb_values in _NAMED_COLOR_RGB.items()
+        }
+        return NAMED_COLOR
+
+
+def __getattr__(name):
+    # NAMED_COLOR is built on first access; after that, it's an ordinary module
+    # attribute and this isn't called for it again.
+    if name == "NAMED_COLOR":
+        return _named_colors()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,32 @@
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from collections.abc import Mapping, Sequence
+from contextlib import contextmanager
+from functools import lru_cache
 from warnings import filterwarnings, warn
+from weakref import WeakValueDictionary
 
-from .colors import color
+from .colors import Color, color, hsl, hsla, rgb, rgba
 from .constants import BOTTOM, LEFT, RIGHT, TOP
 
 # Make sure deprecation warnings are shown by default
 filterwarnings("default", category=DeprecationWarning)
 
+# Sentinel for a missing value, where None is a legitimate value.
+_MISSING = object()
+
+
+class ImmutableList(Sequence):
+    """An immutable, hashable list of values, as held by a list property.
+
+    Compares equal to lists and other ImmutableLists with the same items.
+    """
+
+    __slots__ = ("_data", "_validated_by")
 
-class ImmutableList:
     def __init__(self, iterable):
-        self._data = list(iterable)
+        self._data = tuple(iterable)
+        # The choices that the items have been validated by, if any.
+        self._validated_by = None
 
     def __getitem__(self, index):
         return self._data[index]
@@ -23,13 +38,54 @@ class ImmutableList:
         return iter(self._data)
 
     def __eq__(self, other):
-        return self._data == other
+        if isinstance(other, ImmutableList):
+            return self._data == other._data
+        elif isinstance(other, list):
+            return list(self._data) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._data)
 
     def __str__(self):
-        return str(self._data)
+        return str(list(self._data))
 
     def __repr__(self):
-        return repr(self._data)
+        return repr(list(self._data))
+
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # pragma: no cover
+    # Python < 3.10
+    def _popcount(mask):
+        return bin(mask).count("1")
+
+
+def _slots_in(mask):
+    # Yield the index of each bit that is set in a mask, lowest first.
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def _create_fn(cls, name, args, body, namespace):
+    # Create a method from source code, in the style of dataclasses, and mark it as
+    # generated so it can be replaced if the class's properties change.
+    source = f"def {name}({args}):\n" + "".join(f"    {line}\n" for line in body)
+    exec(source, namespace)
+    fn = namespace[name]
+    fn.__qualname__ = f"{cls.__qualname__}.{name}"
+    fn._generated = True
+    return fn
+
+
+class StyleDiff(namedtuple("StyleDiff", ["changed", "added", "removed"])):
+    "The differences between two styles; see BaseStyle.diff()."
+
+    def __bool__(self):
+        return bool(self.changed or self.added or self.removed)
 
 
 class Choices:
@@ -43,7 +99,19 @@ class Choices:
         integer=False,
         number=False,
         color=False,
+        cache_size=None,
     ):
+        """Define the values that a property will accept.
+
+        :param constants: The literal values that are accepted.
+        :param string: Accept any string.
+        :param integer: Accept any value that can be converted to an integer.
+        :param number: Accept any value that can be converted to a float.
+        :param color: Accept any value that can be interpreted as a color.
+        :param cache_size: If provided, memoize the result of validating up to this
+            many distinct values. Unhashable values are validated without being
+            cached.
+        """
         if default is not None:
             warn(
                 "The `default` argument to Choices.__init__ is deprecated. "
@@ -69,7 +137,38 @@ class Choices:
         if self.color:
             self._options.append("<color>")
 
-    def validate(self, value):
+        # Compile a validator specialized to the flags that have been enabled.
+        self.validate = self._compile()
+
+        if cache_size is None:
+            self._cached = None
+        else:
+            self._cached = lru_cache(maxsize=cache_size, typed=True)(self.validate)
+            self.validate = self._validate_cached
+
+    def _validate_cached(self, value):
+        try:
+            return self._cached(value)
+        except TypeError:
+            # The value is unhashable, so it can't be cached.
+            return self._cached.__wrapped__(value)
+
+    def cache_info(self):
+        """Report statistics on the validation cache.
+
+        :returns: A named tuple of hits, misses, maxsize and currsize, as returned by
+            :func:`functools.lru_cache`; or ``None`` if caching isn't enabled.
+        """
+        return None if self._cached is None else self._cached.cache_info()
+
+    def cache_clear(self):
+        "Discard all cached validation results."
+        if self._cached is not None:
+            self._cached.cache_clear()
+
+    def _validate_generic(self, value):
+        # The general form of validation, used for any type that doesn't have a
+        # specialized path.
         if self.string:
             try:
                 return value.strip()
@@ -96,19 +195,129 @@ class Choices:
 
         raise ValueError(f"{value!r} is not a valid value")
 
+    def _compile(self):
+        """Build a validation function for this set of choices.
+
+        The function is generated from source, so that the checks for the types
+        that can't possibly be accepted are omitted entirely, values of the most
+        common types are handled inline, and constants are found with a single
+        dictionary lookup.
+        """
+        # Precompute the result of validating each constant. Since the result is
+        # exactly what the generic path would produce, it's safe to look constants
+        # up before attempting any conversion.
+        str_constants = {}
+        other_constants = {}
+        for const in self.constants:
+            if isinstance(const, str):
+                str_constants[const] = self._validate_generic(const)
+            elif isinstance(const, (int, float, Color)):
+                other_constants[const] = self._validate_generic(const)
+
+        # Any value that falls through to the end of the generated function is
+        # handled by the generic path, which is also responsible for raising an
+        # error for invalid values.
+        find_other = [
+            "if value in other_constants:",
+            "    return other_constants[value]",
+        ]
+        if self.integer:
+            int_body = ["return value"]
+            bool_body = ["return int(value)"]
+        elif self.number:
+            int_body = bool_body = ["return float(value)"]
+        else:
+            int_body = bool_body = find_other if other_constants else []
+
+        if self.integer:
+            float_body = ["try:", "    return int(value)", "except ValueError:"]
+            # NaN can't be converted to an integer.
+            float_body.append("    return value" if self.number else "    pass")
+        elif self.number:
+            float_body = ["return value"]
+        else:
+            float_body = find_other if other_constants else []
+
+        if self.string:
+            # A string constant is returned stripped by the generic path, so
+            # there's no need to look it up.
+            str_body = ["return value.strip()"]
+        else:
+            str_body = [
+                "if value in str_constants:",
+                "    return str_constants[value]",
+            ]
+            for flag, convert in [
+                (self.integer, "int"),
+                (self.number, "float"),
+                (self.color, "color"),
+            ]:
+                if flag:
+                    str_body.extend(
+                        [
+                            "try:",
+                            f"    return {convert}(value)",
+                            "except ValueError:",
+                            "    pass",
+                        ]
+                    )
+            str_body.append("raise ValueError(f'{value!r} is not a valid value')")
+
+        branches = [
+            ("str", str_body),
+            ("int", int_body),
+            ("float", float_body),
+            ("bool", bool_body),
+        ]
+        body = ["cls = value.__class__"]
+        for type_name, type_body in branches:
+            if type_body:
+                body.append(f"if cls is {type_name}:")
+                body.extend(f"    {line}" for line in type_body)
+        if self.color:
+            body.append("if cls is rgb or cls is hsl or cls is rgba or cls is hsla:")
+            body.append("    return value")
+        body.append("return generic(value)")
+
+        source = "def validate(value):\n" + "".join(f"    {line}\n" for line in body)
+        namespace = {
+            "color": color,
+            "rgb": rgb,
+            "rgba": rgba,
+            "hsl": hsl,
+            "hsla": hsla,
+            "str_constants": str_constants,
+            "other_constants": other_constants,
+            "generic": self._validate_generic,
+        }
+        exec(source, namespace)
+        return namespace["validate"]
+
     def __str__(self):
         return ", ".join(self._options)
 
 
 class validated_property:
-    def __init__(self, choices, initial=None):
+    # The instance attributes, holding cached values derived from this property, to
+    # discard when its value changes.
+    _dependents = ()
+
+    def __init__(self, choices, initial=None, inherited=False, affects_layout=True):
         """Define a simple validated property attribute.
 
         :param choices: The available choices.
         :param initial: The initial value for the property.
+        :param inherited: If True, a node whose style doesn't set the property takes
+            its value from its parent; see :attr:`Node.computed_style`.
+        :param affects_layout: If True (the default), changing the property marks the
+            layout of the style's node as dirty, so it's laid out again on the next
+            refresh. Properties that only affect appearance, like colors, can set this
+            to False.
         """
         self.choices = choices
         self.initial = None
+        self.inherited = inherited
+        self.affects_layout = affects_layout
 
         try:
             # If an initial value has been provided, it must be consistent with
@@ -124,15 +333,27 @@ class validated_property:
 
     def __set_name__(self, owner, name):
         self.name = name
+        self.slot = owner._allocate_slot(name)
+        self._bit = 1 << self.slot
+        # The bits of the slots before this one; the number of them that are set is
+        # the position of this property's value in a style's storage.
+        self._below = self._bit - 1
         owner._BASE_PROPERTIES[owner].add(name)
         owner._BASE_ALL_PROPERTIES[owner].add(name)
+        owner._add_aliases(name, self)
+        if owner.__dict__.get("_METHODS_GENERATED"):
+            # The property has been added after the class was created.
+            owner._generate_methods()
+            owner._update_subclasses()
 
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
 
-        value = getattr(obj, f"_{self.name}", None)
-        return self.initial if value is None else value
+        mask = obj._set_mask
+        if mask & self._bit:
+            return obj._values[_popcount(mask & self._below)]
+        return self.initial
 
     def __set__(self, obj, value):
         if value is self:
@@ -148,17 +369,56 @@ class validated_property:
 
         value = self.validate(value)
 
-        if value != getattr(obj, f"_{self.name}", self.initial):
-            setattr(obj, f"_{self.name}", value)
-            obj.apply(self.name, value)
+        mask = obj._set_mask
+        values = obj._values
+        index = _popcount(mask & self._below)
+        is_set = mask & self._bit
+        if is_set:
+            current = values[index]
+        elif self.inherited:
+            # An unset inherited property takes its value from the node's parent, so
+            # setting it to its initial value is still a change.
+            current = _MISSING
+        else:
+            current = self.initial
+
+        if value != current:
+            # The storage may be shared, so it's replaced rather than modified.
+            values = list(values)
+            if is_set:
+                values[index] = value
+            else:
+                values.insert(index, value)
+                obj._set_mask = mask | self._bit
+            obj._values = tuple(values)
+            for dependent in self._dependents:
+                obj.__dict__.pop(dependent, None)
+            if self.inherited:
+                obj._inherited_changed(self.name)
+            if self.affects_layout and obj._node is not None:
+                obj._node.layout.dirty()
+            obj._apply(self.name, value, self._bit)
 
     def __delete__(self, obj):
-        try:
-            delattr(obj, f"_{self.name}")
-        except AttributeError:
-            pass
-        else:
-            obj.apply(self.name, self.initial)
+        mask = obj._set_mask
+        if mask & self._bit:
+            values = list(obj._values)
+            del values[_popcount(mask & self._below)]
+            obj._values = tuple(values)
+            obj._set_mask = mask & ~self._bit
+            for dependent in self._dependents:
+                obj.__dict__.pop(dependent, None)
+            if self.inherited:
+                obj._inherited_changed(self.name)
+            if self.affects_layout and obj._node is not None:
+                obj._node.layout.dirty()
+            obj._apply(self.name, self.initial, self._bit)
+
+    def _copy(self):
+        # A copy of the property, which can be given a name and slot of its own.
+        dup = object.__new__(self.__class__)
+        dup.__dict__.update(self.__dict__)
+        return dup
 
     @property
     def _name_if_set(self, default=""):
@@ -174,11 +434,15 @@ class validated_property:
             )
 
     def is_set_on(self, obj):
-        return hasattr(obj, f"_{self.name}")
+        return bool(obj._set_mask & self._bit)
 
 
 class list_property(validated_property):
     def validate(self, value):
+        if type(value) is ImmutableList and value._validated_by is self.choices:
+            # Already validated by the same choices.
+            return value
+
         if isinstance(value, str):
             value = [value]
         elif not isinstance(value, Sequence):
@@ -206,7 +470,9 @@ class list_property(validated_property):
                 )
             result.append(item)
 
-        return ImmutableList(result)
+        result = ImmutableList(result)
+        result._validated_by = self.choices
+        return result
 
 
 class directional_property:
@@ -226,19 +492,48 @@ class directional_property:
             be replaced with "_top", etc.
         """
         self.name_format = name_format
+        self._sides_by_class = {}
 
     def __set_name__(self, owner, name):
         self.name = name
         owner._BASE_ALL_PROPERTIES[owner].add(self.name)
+        owner._add_aliases(self.name, self)
+
+        # The instance attribute in which the tuple of values is cached.
+        self._cache_name = f"_{name}_cached"
 
     def format(self, direction):
         return self.name_format.format(f"_{direction}")
 
+    def _sides(self, cls):
+        # The descriptors of the properties for each direction, in order. They're
+        # looked up on first use, since they may be defined after this property.
+        try:
+            return self._sides_by_class[cls]
+        except KeyError:
+            pass
+
+        sides = tuple(
+            getattr(cls, self.format(direction)) for direction in self.DIRECTIONS
+        )
+        for side in sides:
+            if self._cache_name not in side._dependents:
+                side._dependents += (self._cache_name,)
+        self._sides_by_class[cls] = sides
+        return sides
+
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
 
-        return tuple(obj[self.format(direction)] for direction in self.DIRECTIONS)
+        try:
+            return obj.__dict__[self._cache_name]
+        except KeyError:
+            pass
+
+        value = tuple(side.__get__(obj) for side in self._sides(type(obj)))
+        obj.__dict__[self._cache_name] = value
+        return value
 
     def __set__(self, obj, value):
         if value is self:
@@ -250,21 +545,39 @@ class directional_property:
             value = (value,)
 
         if order := self.ASSIGNMENT_SCHEMES.get(len(value)):
-            for direction, index in zip(self.DIRECTIONS, order):
-                obj[self.format(direction)] = value[index]
+            for side, index in zip(self._sides(type(obj)), order):
+                side.__set__(obj, value[index])
         else:
             raise ValueError(
                 f"Invalid value for '{self.name}'; value must be a number, or a 1-4 tuple."
             )
 
     def __delete__(self, obj):
-        for direction in self.DIRECTIONS:
-            del obj[self.format(direction)]
+        for side in self._sides(type(obj)):
+            side.__delete__(obj)
 
     def is_set_on(self, obj):
-        return any(
-            hasattr(obj, self.format(direction)) for direction in self.DIRECTIONS
-        )
+        return any(side.is_set_on(obj) for side in self._sides(type(obj)))
+
+
+def applies(*names):
+    """Register a style method as the way to apply one or more properties.
+
+    The decorated method is called with the new value whenever one of the named
+    properties needs to be applied, instead of the style's generic ``apply()``
+    method. Properties without a registered method are still passed to ``apply()``.
+
+    :param names: The names of the properties the method applies. They must be
+        properties of the style class, or a :class:`NameError` is raised when the
+        class is created. Directional properties can't be registered, since only
+        their sides are ever applied.
+    """
+
+    def decorator(method):
+        method._applies_to = tuple(name.replace("-", "_") for name in names)
+        return method
+
+    return decorator
 
 
 class BaseStyle:
@@ -274,32 +587,345 @@ class BaseStyle:
     with @dataclass(kw_only=True), which most IDEs should be able to interpret and
     provide autocompletion of argument names. On Python < 3.10, init=False can be used
     to still get the keyword-only behavior from the included __init__.
+
+    Each subclass is given its own copy() and __eq__ methods, specialized for its
+    properties, unless it (or a parent) defines them itself; since they are in place
+    before the decorator runs, @dataclass leaves them alone. Styles compare equal if
+    they are of the same class and all their properties have the same values. As with
+    dataclasses, they aren't hashable, unless the class is defined with
+    ``hashable=True``; or, with ``eq=False``, they keep comparing and hashing by
+    identity::
+
+        class Pack(BaseStyle, hashable=True):
+            ...
     """
 
     _BASE_PROPERTIES = defaultdict(set)
     _BASE_ALL_PROPERTIES = defaultdict(set)
+    _BASE_ALIASES = defaultdict(dict)
+
+    # The names of the properties stored in each slot of the value storage.
+    _SLOTS = ()
+
+    # The values of the properties that have been set, in slot order; so the value
+    # of a property is found by counting the set slots before its own. Only set
+    # values take up space, and since the storage is never modified in place, it can
+    # be shared with copies of the style.
+    _values = ()
+
+    # A bitmask of the slots of the properties that have been set.
+    _set_mask = 0
+
+    # Changes waiting to be applied at the end of a batch; None if no batch is open.
+    _batched_changes = None
+
+    _assigned_applicator = None
+
+    # The node this style belongs to, if any; it's told when the value of an inherited
+    # property changes.
+    _node = None
+
+    # The methods registered with @applies, keyed by the name of the property they
+    # apply.
+    _APPLY_HANDLERS = {}
+
+    # The applicator that the whole style was last applied with, and a bitmask of the
+    # slots of properties that may have changed since then without being applied.
+    _synced_with = None
+    _unsynced_mask = 0
+
+    # Whether instances of the class compare by value, and whether they can then be
+    # hashed; see __init_subclass__.
+    _EQ = True
+    _HASHABLE = False
+
+    def __init_subclass__(cls, hashable=None, eq=None):
+        """Set up a new style class.
+
+        :param hashable: If True, styles of this class (and its subclasses) can be
+            hashed, so they can be used as dict keys or set members. The hash is
+            based on the style's values, so a style mustn't be modified while it's
+            being used as a key. If not specified, the parent class's setting is
+            used; by default, styles aren't hashable.
+        :param eq: If False, styles of this class (and its subclasses) aren't given
+            an __eq__ method, so they compare and hash by identity, and ``hashable``
+            has no effect. If not specified, the parent class's setting is used; by
+            default, styles compare by value.
+        """
+        if hashable is not None:
+            cls._HASHABLE = hashable
+        if eq is not None:
+            cls._EQ = eq
+
+        # Whether the style can lay out part of a tree; see layout_subtree().
+        cls._LAYOUT_SUBTREE = cls.layout_subtree is not BaseStyle.layout_subtree
 
-    def __init_subclass__(cls):
-        # Give the subclass a direct reference to its properties.
+        # Give the subclass a direct reference to its properties, including those
+        # inherited from its parent.
         cls._PROPERTIES = cls._BASE_PROPERTIES[cls]
         cls._ALL_PROPERTIES = cls._BASE_ALL_PROPERTIES[cls]
+        cls._ALIASES = cls._BASE_ALIASES[cls]
+        cls._inherit_properties()
+
+        # Build the table of apply handlers. A method only counts if it's still the
+        # one the class resolves to, so overriding a handler without re-registering
+        # it falls back to apply().
+        handlers = {}
+        for base in reversed(cls.__mro__):
+            for attr, method in base.__dict__.items():
+                for name in getattr(method, "_applies_to", ()):
+                    if name in cls._PROPERTIES:
+                        handlers[name] = attr
+                    elif name in cls._ALL_PROPERTIES:
+                        # A directional property is never applied itself; its sides
+                        # are.
+                        raise NameError(
+                            f"Directional style {name} registered by "
+                            f"{cls.__name__}.{attr}; register each of its sides "
+                            "instead"
+                        )
+                    else:
+                        raise NameError(
+                            f"Unknown style {name} registered by "
+                            f"{cls.__name__}.{attr}"
+                        )
+        cls._APPLY_HANDLERS = {
+            name: getattr(cls, attr)
+            for name, attr in handlers.items()
+            if name in getattr(getattr(cls, attr), "_applies_to", ())
+        }
+
+        cls._generate_methods()
+        cls._METHODS_GENERATED = True
+
+    def _equal_values(self, other):
+        # Compare the values of the properties set on this style or another style of
+        # the same class; the general form of the generated __eq__. An unset property
+        # is taken to have its initial value, unless it's inherited; then, being unset
+        # means taking the value from the parent, so it's different from any value.
+        slots = self._SLOTS
+        aliases = self._ALIASES
+        mine = self._set_mask
+        theirs = other._set_mask
+        return not any(
+            aliases[slots[slot]].inherited for slot in _slots_in(mine ^ theirs)
+        ) and all(
+            self[slots[slot]] == other[slots[slot]] for slot in _slots_in(mine | theirs)
+        )
+
+    @classmethod
+    def _can_generate(cls, name):
+        # A method can be generated unless the class, or one of its ancestors, has
+        # defined its own.
+        attr = cls.__dict__.get(name)
+        if attr is None:
+            attr = getattr(cls, name)
+            return attr is getattr(BaseStyle, name) or hasattr(attr, "_generated")
+        return hasattr(attr, "_generated")
+
+    @classmethod
+    def _generate_methods(cls):
+        # Generate copy and __eq__ methods specialized for the class's properties, in
+        # the style of dataclasses. They are stored on the class itself, so a
+        # @dataclass decorator won't replace them with its own. The constructor is
+        # left alone, so that @dataclass can still generate one.
+        namespace = {
+            "BaseStyle": BaseStyle,
+            "MISSING": _MISSING,
+            "new": object.__new__,
+            "init": BaseStyle.__init__,
+        }
+
+        if hasattr(cls, "__post_init__"):
+            if cls._can_generate("copy"):
+                # The constructor does more than set values, so copies must call it.
+                cls.copy = BaseStyle.copy
+        elif cls._can_generate("copy"):
+            # Nothing the base constructor does needs repeating, so a copy can be
+            # created without calling it, as long as the class (or a decorator) hasn't
+            # replaced it.
+            body = [
+                "if applicator is not None or self.__class__.__init__ is not init:",
+                "    return BaseStyle.copy(self, applicator)",
+                "dup = new(self.__class__)",
+                "dup._values = self._values",
+                "dup._set_mask = self._set_mask",
+                "return dup",
+            ]
+            cls.copy = _create_fn(cls, "copy", "self, applicator=None", body, namespace)
+
+        if not cls._EQ:
+            if cls._can_generate("__eq__"):
+                # Undo any value comparison inherited from a parent class.
+                cls.__eq__ = object.__eq__
+                cls.__hash__ = object.__hash__
+        elif cls._can_generate("__eq__"):
+            # Styles with the same properties set can compare their storage directly;
+            # otherwise, see _equal_values().
+            body = [
+                "if other.__class__ is not self.__class__:",
+                "    return NotImplemented",
+                "if self._set_mask == other._set_mask:",
+                "    return (a := self._values) is (b := other._values) or a == b",
+                "return self._equal_values(other)",
+            ]
+            cls.__eq__ = _create_fn(cls, "__eq__", "self, other", body, namespace)
+
+            hash_method = cls.__dict__.get("__hash__")
+            if hash_method is None or hasattr(hash_method, "_generated"):
+                if cls._HASHABLE:
+                    cls.__hash__ = cls._generate_hash(namespace)
+                else:
+                    # As with dataclasses, styles that compare by value are
+                    # unhashable.
+                    cls.__hash__ = None
+
+    @classmethod
+    def _generate_hash(cls, namespace):
+        # The hash is calculated from the properties that are set to something other
+        # than their initial value, so that it's consistent with __eq__; an inherited
+        # property counts whenever it's set. It's cached until one of the properties
+        # changes.
+        for name in cls._SLOTS:
+            prop = cls._ALIASES[name]
+            if "_hash_cached" not in prop._dependents:
+                prop._dependents += ("_hash_cached",)
+
+        namespace["slots_in"] = _slots_in
+        namespace["initials"] = tuple(
+            _MISSING if prop.inherited else prop.initial
+            for prop in map(cls._ALIASES.get, cls._SLOTS)
+        )
+        body = [
+            "try:",
+            "    return self.__dict__['_hash_cached']",
+            "except KeyError:",
+            "    pass",
+            "result = self.__dict__['_hash_cached'] = hash(",
+            "    frozenset(",
+            "        (slot, value)",
+            "        for slot, value in zip(slots_in(self._set_mask), self._values)",
+            "        if value != initials[slot]",
+            "    )",
+            ")",
+            "return result",
+        ]
+        return _create_fn(cls, "__hash__", "self", body, namespace)
+
+    @classmethod
+    def _add_aliases(cls, name, prop):
+        # Map every accepted spelling of a property name to its descriptor.
+        aliases = cls._BASE_ALIASES[cls]
+        aliases[name] = prop
+        aliases[name.replace("_", "-")] = prop
+
+    def _lookup(self, name):
+        # Find the descriptor for a name that isn't one of the standard spellings.
+        # Mixed spellings (e.g., "a-b_c") are accepted, as long as they normalize to
+        # the name of a property.
+        name = name.replace("-", "_")
+        try:
+            return self._ALIASES[name]
+        except KeyError:
+            raise KeyError(name) from None
+
+    @classmethod
+    def _inherit_properties(cls):
+        # Add the properties of the class's parents to its own.
+        for base in cls.__mro__[1:]:
+            if issubclass(base, BaseStyle) and base is not BaseStyle:
+                cls._PROPERTIES.update(base._PROPERTIES)
+                cls._ALL_PROPERTIES.update(base._ALL_PROPERTIES)
+                for name, prop in base._ALIASES.items():
+                    cls._ALIASES.setdefault(name, prop)
+
+        # Slots are numbered following on from those of the first parent, so a
+        # property inherited from any other parent (or added to a parent after this
+        # class was created) may have a slot that this class uses for something else.
+        # The class gets its own copy of any such property, in a slot of its own.
+        for base in cls.__mro__[1:]:
+            for name in base.__dict__.get("_SLOTS", ()):
+                prop = getattr(cls, name)
+                if not isinstance(prop, validated_property):
+                    continue
+                slots = cls._SLOTS
+                if prop.slot >= len(slots) or slots[prop.slot] != name:
+                    prop = prop._copy()
+                    setattr(cls, name, prop)
+                    prop.__set_name__(cls, name)
+
+    @classmethod
+    def _update_subclasses(cls):
+        # A property has been added to the class; pass it on to any subclasses that
+        # have already been created.
+        for subclass in cls.__subclasses__():
+            subclass._inherit_properties()
+            subclass._generate_methods()
+            subclass._update_subclasses()
+
+    @classmethod
+    def _allocate_slot(cls, name):
+        # Assign the next storage slot to a property. Slots are numbered following
+        # on from those of the parent class, so inherited properties keep working.
+        if "_SLOTS" not in cls.__dict__:
+            cls._SLOTS = list(cls._SLOTS)
+        cls._SLOTS.append(name)
+        return len(cls._SLOTS) - 1
+
+    def _replace_values(self, values, mask):
+        # Replace the values of all the properties at once, discarding anything that
+        # has been cached from the values the style had before.
+        self._values = values
+        self._set_mask = mask
+        cache = self.__dict__
+        for name in self._SLOTS:
+            for dependent in self._ALIASES[name]._dependents:
+                cache.pop(dependent, None)
+
+    def _set_slots(self):
+        # Map the slot of each property that has been set to its value.
+        return dict(zip(_slots_in(self._set_mask), self._values))
 
     # Fallback in case subclass isn't decorated as subclass (probably from using
     # previous API) or for pre-3.10, before kw_only argument existed.
     def __init__(self, **style):
-        self.update(**style)
+        if style:
+            self.update(**style)
+        if hasattr(self, "__post_init__"):
+            self.__post_init__()
 
     @property
     def _applicator(self):
-        return getattr(self, "_assigned_applicator", None)
+        return self._assigned_applicator
 
     @_applicator.setter
     def _applicator(self, value):
-        self._assigned_applicator = value
+        self._assign_applicator(value)
+
+    def _assign_applicator(self, applicator, previous=None):
+        """Assign an applicator, and apply the style with it.
 
-        if value is not None:
+        :param applicator: The applicator to assign.
+        :param previous: A style of the same class that has previously been applied
+            using the same applicator. If provided, only the properties that differ
+            from it are applied; otherwise, the whole style is reapplied.
+        """
+        self._assigned_applicator = applicator
+
+        if applicator is not None:
             try:
-                self.reapply()
+                if previous is None:
+                    self.reapply()
+                else:
+                    if previous._synced_with is applicator:
+                        # Whatever was in sync for the previous style is in sync for
+                        # this one, except for the differences applied below.
+                        self._synced_with = applicator
+                        self._unsynced_mask = previous._unsynced_mask
+                    with self.batch():
+                        aliases = self._ALIASES
+                        for name, value in self._changes_from(previous):
+                            self._apply(name, value, aliases[name]._bit)
             # This is backwards compatibility for Toga, which (at least as of
             # 0.4.8), assigns style and applicator before the widget's
             # implementation is available.
@@ -310,7 +936,7 @@ class BaseStyle:
                     "sufficiently initialized to apply its style before it is assigned "
                     "an applicator. This will be an exception in a future version.",
                     RuntimeWarning,
-                    stacklevel=2,
+                    stacklevel=3,
                 )
 
     ######################################################################
@@ -327,27 +953,239 @@ class BaseStyle:
             "Style must define a layout method"
         )  # pragma: no cover
 
+    ######################################################################
+    # Optional interface that style declarations can override
+    ######################################################################
+
+    def apply_many(self, changes):
+        """Apply a group of property changes at once.
+
+        Called at the end of a batch of changes, with a mapping of property names to
+        their new values. By default, each change is applied in turn, by the method
+        registered for it with ``@applies`` or by ``apply()``; styles whose backends
+        support bulk updates can override this to apply the whole group with a single
+        call.
+
+        :param changes: A dict mapping property names to values, in the order in
+            which they were first changed.
+        """
+        dispatch = self._dispatch if self._APPLY_HANDLERS else self.apply
+        for name, value in changes.items():
+            dispatch(name, value)
+
+    def layout_subtree(self, viewport):
+        """Lay out the contents of the style's node, without moving or resizing it.
+
+        This is called instead of ``layout()`` on the node's style when something
+        inside a relayout boundary (see :attr:`BaseBox.is_relayout_boundary`) has
+        changed, but nothing outside it has. The node's own box has already been laid
+        out, and must be left as it is; only the boxes of its descendants, positioned
+        relative to its content box, need to be laid out again.
+
+        Styles that don't override this can't be laid out a part at a time, so their
+        nodes are never relayout boundaries: any change causes the whole tree to be
+        laid out from its root.
+
+        :param viewport: The space available to the node's children: the size of the
+            node's content box.
+        """
+        raise NotImplementedError(
+            "Style must define a layout_subtree method to support relayout boundaries"
+        )  # pragma: no cover
+
+    ######################################################################
+    # Batching of changes
+    ######################################################################
+
+    def _apply(self, name, value, bit):
+        # All property changes are routed through here, so that they can be deferred
+        # if a batch is open, and so that changes that haven't been successfully
+        # applied can be tracked. The bit is the one for the property's slot.
+        if self._batched_changes is not None:
+            self._batched_changes[name] = value
+            return
+
+        # If the style hasn't been applied in full, there's nothing to keep in sync.
+        tracked = self._synced_with is not None
+        if tracked:
+            self._unsynced_mask |= bit
+
+        # Most styles don't register any handlers, so they can skip looking for one.
+        if self._APPLY_HANDLERS:
+            self._dispatch(name, value)
+        else:
+            self.apply(name, value)
+
+        if tracked and self._synced_with is self._assigned_applicator:
+            self._unsynced_mask &= ~bit
+
+    def _inherited_changed(self, name):
+        # Computed values that were derived from this property are now stale.
+        if self._node is not None:
+            self._node._invalidate_computed(name)
+
+    def _dispatch(self, name, value):
+        # Apply a single property, with its registered handler if it has one.
+        handler = self._APPLY_HANDLERS.get(name)
+        if handler is None:
+            self.apply(name, value)
+        else:
+            handler(self, value)
+
+    def _is_synced(self):
+        # Is the applicator in sync with this style, other than for the properties in
+        # the unsynced mask?
+        return (
+            self._synced_with is not None
+            and self._synced_with is self._assigned_applicator
+        )
+
+    @contextmanager
+    def batch(self):
+        """Defer application of changes until the end of a block.
+
+        Inside the block, properties can be set, changed and deleted as normal, but
+        the changes aren't applied immediately. Multiple changes to the same property
+        are coalesced, and when the block exits, all the changes are passed in a
+        single call to ``apply_many()``. The changes are applied even if the block
+        raises an exception, since the style's values have already been modified.
+
+        Batches can be nested; changes are applied when the outermost block exits.
+        """
+        if self._batched_changes is not None:
+            yield self
+            return
+
+        self._batched_changes = {}
+        try:
+            yield self
+        finally:
+            changes = self._batched_changes
+            del self._batched_changes
+            if changes:
+                mask = 0
+                for name in changes:
+                    mask |= self._ALIASES[name]._bit
+                self._unsynced_mask |= mask
+                self.apply_many(changes)
+                if self._is_synced():
+                    self._unsynced_mask &= ~mask
+
     ######################################################################
     # Provide a dict-like interface
     ######################################################################
 
-    def reapply(self):
-        for name in self._PROPERTIES:
-            self.apply(name, self[name])
+    def reapply(self, force=False):
+        """Apply the style's properties.
+
+        If the style has already been applied in full with its current applicator,
+        only the properties that have changed since then, without being successfully
+        applied, are applied again.
+
+        :param force: If True, apply every property, whether it has changed or not.
+        """
+        applicator = self._assigned_applicator
+        if force or applicator is None or applicator is not self._synced_with:
+            # Every property needs to be applied; from here on, track what is
+            # applied successfully with the current applicator.
+            names = self._PROPERTIES
+            self._synced_with = applicator
+            self._unsynced_mask = (1 << len(self._SLOTS)) - 1
+        else:
+            slots = self._SLOTS
+            names = [slots[slot] for slot in _slots_in(self._unsynced_mask)]
+
+        aliases = self._ALIASES
+        for name in names:
+            prop = aliases[name]
+            self._apply(name, prop.__get__(self), prop._bit)
+
+    def update(self, batch=False, **styles):
+        """Set multiple styles on the style definition.
+
+        :param batch: If True, the changes are applied as a single batch; see
+            :meth:`batch`.
+        """
+        if batch:
+            with self.batch():
+                self.update(**styles)
+            return
 
-    def update(self, **styles):
-        "Set multiple styles on the style definition."
         for name, value in styles.items():
-            name = name.replace("-", "_")
-            if name not in self._ALL_PROPERTIES:
-                raise NameError(f"Unknown style {name}")
+            try:
+                prop = self._ALIASES.get(name) or self._lookup(name)
+            except KeyError as error:
+                raise NameError(f"Unknown style {error.args[0]}") from None
+            prop.__set__(self, value)
+
+    def diff(self, other):
+        """Compare this style with another style of the same class.
+
+        :param other: The style to compare with.
+        :returns: A :class:`StyleDiff` describing how to turn this style into
+            ``other``. ``changed`` maps the properties that are set on both styles,
+            with different values, to their value in ``other``; ``added`` maps the
+            properties only set on ``other`` to their values; and ``removed`` is the
+            set of names of properties that are only set on this style.
+        """
+        if other.__class__ is not self.__class__:
+            raise TypeError(
+                f"Can't compare {self.__class__.__name__} with "
+                f"{other.__class__.__name__}"
+            )
 
-            self[name] = value
+        mine = self._set_mask
+        theirs = other._set_mask
+        if self._values is other._values and mine == theirs:
+            # The styles share storage, so they can't differ.
+            return StyleDiff({}, {}, set())
+
+        slots = self._SLOTS
+        values = self._set_slots()
+        other_values = other._set_slots()
+        return StyleDiff(
+            changed={
+                slots[slot]: other_values[slot]
+                for slot in _slots_in(mine & theirs)
+                if values[slot] != other_values[slot]
+            },
+            added={
+                slots[slot]: other_values[slot] for slot in _slots_in(theirs & ~mine)
+            },
+            removed={slots[slot] for slot in _slots_in(mine & ~theirs)},
+        )
+
+    def _changes_from(self, previous):
+        # Yield the name and value of each property whose value differs from its
+        # value in a previous style of the same class, including properties whose
+        # value differs only because one of the styles is using the initial value.
+        # An inherited property that is only set on one of the styles always differs,
+        # since the other takes its value from the parent.
+        changes = previous.diff(self)
+        aliases = self._ALIASES
+        yield from changes.changed.items()
+        for name, value in changes.added.items():
+            if aliases[name].inherited or value != previous[name]:
+                yield name, value
+        for name in changes.removed:
+            value = self[name]
+            if aliases[name].inherited or value != previous[name]:
+                yield name, value
 
     def copy(self, applicator=None):
-        "Create a duplicate of this style declaration."
+        """Create a duplicate of this style declaration.
+
+        The values in this style have already been validated, so they are transferred
+        to the duplicate directly. The two styles share storage until either of them
+        is modified.
+        """
         dup = self.__class__()
-        dup.update(**self)
+        if dup._set_mask:
+            # The constructor has set some properties of its own; copy over them the
+            # long way, so the result is the same as setting each property in turn.
+            dup.update(**self)
+        else:
+            dup._replace_values(self._values, self._set_mask)
 
         if applicator is not None:
             warn(
@@ -360,42 +1198,78 @@ class BaseStyle:
 
         return dup
 
+    def freeze(self):
+        """Create an immutable, hashable snapshot of the properties that are set.
+
+        Snapshots are interned: freezing two styles of the same class with the same
+        properties set to the same values returns the same :class:`FrozenStyle`
+        object, for as long as that snapshot is in use.
+        """
+        values = self._values
+        key = (
+            self.__class__,
+            self._set_mask,
+            values,
+            tuple(type(value) for value in values),
+        )
+        try:
+            return _FROZEN_STYLES[key]
+        except KeyError:
+            frozen = _FROZEN_STYLES[key] = FrozenStyle(key, values)
+            return frozen
+
+    @classmethod
+    def from_frozen(cls, frozen):
+        """Create a new style from a snapshot created by :meth:`freeze`.
+
+        :param frozen: The snapshot. It must have been created from an instance of
+            this class.
+        """
+        if frozen.style_class is not cls:
+            raise TypeError(
+                f"Can't create {cls.__name__} from a snapshot of "
+                f"{frozen.style_class.__name__}"
+            )
+
+        style = cls()
+        if style._set_mask:
+            style.update(**frozen)
+        else:
+            style._replace_values(frozen._values, frozen._mask)
+        return style
+
     def __getitem__(self, name):
-        name = name.replace("-", "_")
-        if name in self._ALL_PROPERTIES:
-            return getattr(self, name)
-        raise KeyError(name)
+        prop = self._ALIASES.get(name) or self._lookup(name)
+        return prop.__get__(self)
 
     def __setitem__(self, name, value):
-        name = name.replace("-", "_")
-        if name in self._ALL_PROPERTIES:
-            setattr(self, name, value)
-        else:
-            raise KeyError(name)
+        prop = self._ALIASES.get(name) or self._lookup(name)
+        prop.__set__(self, value)
 
     def __delitem__(self, name):
-        name = name.replace("-", "_")
-        if name in self._ALL_PROPERTIES:
-            delattr(self, name)
-        else:
-            raise KeyError(name)
+        prop = self._ALIASES.get(name) or self._lookup(name)
+        prop.__delete__(self)
+
+    def _set_names(self):
+        # Yield the names of the properties that have been set, in slot order.
+        slots = self._SLOTS
+        for slot in _slots_in(self._set_mask):
+            yield slots[slot]
 
     def keys(self):
-        return {name for name in self._PROPERTIES if name in self}
+        return set(self._set_names())
 
     def items(self):
-        return [(name, self[name]) for name in self._PROPERTIES if name in self]
+        return list(zip(self._set_names(), self._values))
 
     def __len__(self):
-        return sum(1 for name in self._PROPERTIES if name in self)
+        return len(self._values)
 
     def __contains__(self, name):
-        return name in self._ALL_PROPERTIES and (
-            getattr(self.__class__, name).is_set_on(self)
-        )
+        return name in self._ALL_PROPERTIES and self._ALIASES[name].is_set_on(self)
 
     def __iter__(self):
-        yield from (name for name in self._PROPERTIES if name in self)
+        yield from self._set_names()
 
     def __or__(self, other):
         if isinstance(other, BaseStyle):
@@ -455,3 +1329,55 @@ class BaseStyle:
         prop = directional_property(name_format)
         setattr(cls, name, prop)
         prop.__set_name__(cls, name)
+
+
+# Snapshots of styles, indexed by their content; see BaseStyle.freeze().
+_FROZEN_STYLES = WeakValueDictionary()
+
+
+class FrozenStyle(Mapping):
+    """An immutable snapshot of the properties set on a style.
+
+    Behaves as a read-only mapping of property names to values. Snapshots with the
+    same content are the same object, so they can be compared and hashed cheaply.
+    Create them with :meth:`BaseStyle.freeze`, and turn them back into a style with
+    :meth:`BaseStyle.from_frozen`.
+    """
+
+    __slots__ = ("_key", "_hash", "_values", "_mask", "__weakref__")
+
+    def __init__(self, key, values):
+        self._key = key
+        self._hash = hash(key)
+        self._values = values
+        self._mask = key[1]
+
+    @property
+    def style_class(self):
+        """The class of style this is a snapshot of."""
+        return self._key[0]
+
+    def __getitem__(self, name):
+        prop = self.style_class._ALIASES.get(name)
+        if not isinstance(prop, validated_property) or not self._mask & prop._bit:
+            raise KeyError(name)
+        return self._values[_popcount(self._mask & prop._below)]
+
+    def __iter__(self):
+        slots = self.style_class._SLOTS
+        for slot in _slots_in(self._mask):
+            yield slots[slot]
+
+    def __len__(self):
+        return len(self._values)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenStyle):
+            return self is other or self._key == other._key
+        return super().__eq__(other)
+
+    def __repr__(self):
+        return f"<FrozenStyle {self.style_class.__name__}: {dict(self)}>"
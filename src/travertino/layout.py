@@ -1,3 +1,6 @@
+from .constants import NONE
+
+
 class Viewport:
     """
     A viewport is a description of surface onto which content will be
@@ -43,6 +46,14 @@ class BaseBox:
 
     def __init__(self, node):
         self.node = node
+
+        # Whether this box needs to be laid out, whether any box it contains does
+        # (up to the nearest relayout boundary), and whether any relayout boundary
+        # it contains does; see dirty().
+        self._dirty = True
+        self._dirty_descendants = False
+        self._dirty_boundaries = False
+
         self._reset()
 
     def __repr__(self):
@@ -81,6 +92,76 @@ class BaseBox:
         self._origin_top = 0
         self._origin_left = 0
 
+    ######################################################################
+    # Invalidation
+    ######################################################################
+    def dirty(self, **changes):
+        """Mark the box as needing to be laid out again.
+
+        This is called when anything that affects the geometry of the box changes:
+        its intrinsic size, a property of its style, or its children. Each ancestor
+        of the box, up to the nearest relayout boundary (see
+        :attr:`is_relayout_boundary`), is flagged as containing a box that needs
+        layout; ancestors beyond the boundary are only flagged as containing a
+        boundary that needs layout. A refresh can then tell which parts of the tree
+        need to be laid out.
+
+        :param changes: What has changed, e.g. ``intrinsic_width=10``.
+        """
+        self._dirty = True
+        self._flag_ancestors()
+
+    def _flag_ancestors(self):
+        # Flag the ancestors of the box to show what it needs. If an ancestor has
+        # already been flagged, so have all of its ancestors.
+        node = self.node._parent
+        if self._dirty or self._dirty_descendants:
+            while node is not None:
+                box = node.layout
+                if box._dirty_descendants:
+                    return
+                box._dirty_descendants = True
+                node = node._parent
+                if box.is_relayout_boundary:
+                    break
+
+        while node is not None and not node.layout._dirty_boundaries:
+            node.layout._dirty_boundaries = True
+            node = node._parent
+
+    @property
+    def needs_layout(self):
+        """Does this box, or any box it contains, need to be laid out?
+
+        A layout algorithm can keep the existing layout of any box for which this is
+        False, as long as the space available to it hasn't changed.
+        """
+        return self._dirty or self._dirty_descendants or self._dirty_boundaries
+
+    @property
+    def is_relayout_boundary(self):
+        """Is this box a relayout boundary?
+
+        The size of a relayout boundary doesn't depend on its contents, so when a box
+        inside it needs layout, the boundary can be laid out again without its
+        ancestors. A box is a boundary if its node's style supports laying out its
+        contents on their own, by defining :meth:`BaseStyle.layout_subtree`, and
+        either the node declares itself to be a boundary, by setting
+        ``relayout_boundary`` to True, or its style gives it an explicit ``width``
+        and ``height``.
+
+        Changes to the boundary itself still affect its ancestors.
+        """
+        node = self.node
+        style = node.style
+        if not getattr(type(style), "_LAYOUT_SUBTREE", False):
+            return False
+        if getattr(node, "relayout_boundary", False):
+            return True
+        return all(
+            name in style and style[name] != NONE for name in ("width", "height")
+        )
+
     ######################################################################
     # Origin handling
     ######################################################################
@@ -1,20 +1,186 @@
+from collections import deque
+from collections.abc import Mapping
+
+from .layout import Viewport
+
+# Incremented whenever any node's parent changes. Each node caches its root along
+# with the generation at which it was found; a cached root from an earlier
+# generation might be out of date, so it's found again from the parent chain.
+_generation = 0
+
+# The number of children a node must have before finding a child's position uses a
+# _ChildIndex, rather than searching the list of children.
+_INDEX_THRESHOLD = 128
+
+
+class _ChildIndex:
+    """The positions of the children of a node, found without searching for them.
+
+    Each child is given a slot number, with slots in the same order as the children.
+    A Fenwick tree counts the slots that are in use, so a child's position is the
+    number of slots in use before its own; it can be found, and a slot freed, in
+    O(log n) time. There are unused slots at both ends, so children can also be
+    added at either end in O(log n) time; adding a child anywhere else, or running
+    out of slots, means the index has to be rebuilt.
+
+    Slots are keyed by the id of each child, so any object can be a child. An id can
+    be reused once its object has gone, so a position found for a child must be
+    checked against the list of children before it's used.
+
+    :param children: The list of children, in order.
+    """
+
+    __slots__ = ("_slots", "_tree", "_first", "_next")
+
+    def __init__(self, children):
+        count = len(children)
+        headroom = count // 2 + 16
+        self._first = headroom
+        self._next = headroom + count
+        self._slots = {id(child): slot for slot, child in enumerate(children, headroom)}
+
+        # Build the tree in linear time, rather than adding the slots one at a time.
+        size = count + 2 * headroom
+        tree = [0] * (headroom + 1) + [1] * count + [0] * headroom
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def position(self, child):
+        """The position of the child, or None if it isn't in the index."""
+        slot = self._slots.get(id(child))
+        if slot is None:
+            return None
+
+        tree = self._tree
+        position = 0
+        while slot:
+            position += tree[slot]
+            slot &= slot - 1
+        return position
+
+    def _update(self, slot, delta):
+        tree = self._tree
+        size = len(tree) - 1
+        slot += 1
+        while slot <= size:
+            tree[slot] += delta
+            slot += slot & -slot
+
+    def append(self, child):
+        """Add a child after all the others.
+
+        :returns: False if there's no room, and the index needs to be rebuilt.
+        """
+        if self._next == len(self._tree) - 1:
+            return False
+        self._slots[id(child)] = self._next
+        self._update(self._next, 1)
+        self._next += 1
+        return True
+
+    def prepend(self, child):
+        """Add a child before all the others.
+
+        :returns: False if there's no room, and the index needs to be rebuilt.
+        """
+        if self._first == 0:
+            return False
+        self._first -= 1
+        self._slots[id(child)] = self._first
+        self._update(self._first, 1)
+        return True
+
+    def discard(self, child):
+        """Remove a child from the index, if it's there."""
+        slot = self._slots.pop(id(child), None)
+        if slot is not None:
+            self._update(slot, -1)
+
+
+def _nothing_computed(node):
+    return not node._computed
+
+
+def _layout_clean(node):
+    box = node.layout
+    return not (box._dirty_descendants or box._dirty_boundaries)
+
+
+def _layout_region_found(node):
+    # Stop at nodes that need to be laid out themselves, and at nodes with nothing
+    # below them that does.
+    box = node.layout
+    return box._dirty or box._dirty_descendants or not box._dirty_boundaries
+
+
+class ComputedStyle(Mapping):
+    """A read-only view of a node's style, with inherited properties resolved.
+
+    Properties that aren't inherited have the same value as in the node's style.
+    Inherited properties that aren't set on the node's style take their value from
+    the node's parent, and so on up the tree; if no ancestor sets them, the initial
+    value of the property is used. Values can be looked up by name (with either
+    underscores or hyphens) or as attributes.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    def __getitem__(self, name):
+        return self._node._computed_value(name)
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self):
+        return iter(sorted(self._node.style._PROPERTIES))
+
+    def __len__(self):
+        return len(self._node.style._PROPERTIES)
+
+
 class Node:
+    # Set to True to make this node a relayout boundary, so that changes inside it
+    # don't cause its ancestors to be laid out again; see
+    # BaseBox.is_relayout_boundary. This is only appropriate if its size doesn't
+    # depend on its contents.
+    relayout_boundary = False
+
     def __init__(self, style, applicator=None, children=None):
         # Parent needs to be primed before style is (potentially) applied with
         # assignment of applicator.
         self._parent = None
-        self._root = None
+        self._cached_root = None
+        self._cached_root_generation = -1
+        self._children = None
 
-        # Explicitly set the internal attribute first, since the setter for style will
-        # access the applicator property.
+        # Positions of the children, if there are enough of them to need it; see
+        # _position.
+        self._index = None
+
+        # Cache of resolved values of inherited properties; see computed_style.
+        self._computed = {}
+
+        # Explicitly set the internal attributes first, since the setter for style will
+        # access the applicator property and any previous style.
         self._applicator = None
+        self._style = None
+
+        # The size of the viewport the tree was last laid out in, if this is a root.
+        self._viewport_size = None
 
         self.style = style
         self.applicator = applicator
 
-        if children is None:
-            self._children = None
-        else:
+        if children is not None:
             self._children = []
             for child in children:
                 self.add(child)
@@ -24,18 +190,96 @@ class Node:
         """The node's style.
 
         Assigning a style triggers an application of that style if an applicator has
-        already been assigned.
+        already been assigned. If the node's previous style was of the same class, only
+        the properties whose values differ from it are applied.
         """
         return self._style
 
     @style.setter
     def style(self, style):
+        previous = self._style
+        if previous is not None:
+            previous._node = None
         self._style = style.copy()
-        self.intrinsic = self.style.IntrinsicSize()
+        self._style._node = self
+        self._invalidate_computed()
         self.layout = self.style.Box(self)
+        self.intrinsic = self.style.IntrinsicSize(layout=self.layout)
+        self.layout.dirty()
 
         if self.applicator:
-            self.style._applicator = self.applicator
+            if (
+                previous is not None
+                and previous.__class__ is self._style.__class__
+                and previous._applicator is self.applicator
+            ):
+                # The previous style has already been applied, so only the
+                # differences need to be applied.
+                self.style._assign_applicator(self.applicator, previous=previous)
+            else:
+                self.style._applicator = self.applicator
+
+    @property
+    def computed_style(self):
+        """The node's style, with inherited properties resolved from its ancestors.
+
+        Returns:
+            A read-only :class:`ComputedStyle` mapping.
+        """
+        return ComputedStyle(self)
+
+    def _computed_value(self, name):
+        style = self._style
+        prop = style._ALIASES.get(name) or style._lookup(name)
+        if not getattr(prop, "inherited", False):
+            return getattr(style, prop.name)
+
+        name = prop.name
+        try:
+            return self._computed[name]
+        except KeyError:
+            pass
+
+        # Walk up the tree until a node with a cached value, or a node that sets the
+        # property, is found. Every node passed on the way inherits that value, so
+        # cache it on all of them.
+        chain = []
+        node = self
+        while True:
+            if name in node._computed:
+                value = node._computed[name]
+                break
+            chain.append(node)
+            node_style = node._style
+            node_prop = node_style._ALIASES.get(name)
+            if node_prop is not None:
+                prop = node_prop
+                if node_style._set_mask & prop._bit:
+                    value = prop.__get__(node_style)
+                    break
+            if node._parent is None:
+                # No ancestor sets the property.
+                value = prop.initial
+                break
+            node = node._parent
+
+        for node in chain:
+            node._computed[name] = value
+        return value
+
+    def _invalidate_computed(self, name=None):
+        # Discard cached computed values of this node and its descendants; either for a
+        # single property, or (if name is None) for all of them. A node's cached value
+        # can only have been derived from an ancestor if every node in between also
+        # cached it, so there's no need to descend past nodes with nothing cached.
+        if name is None:
+            for node in self.walk_preorder(prune=_nothing_computed):
+                node._computed.clear()
+        else:
+            for node in self.walk_preorder(
+                prune=lambda node: name not in node._computed
+            ):
+                node._computed.pop(name, None)
 
     @property
     def applicator(self):
@@ -61,6 +305,7 @@ class Node:
         self._applicator = applicator
         # This triggers style.reapply():
         self.style._applicator = applicator
+        self.layout.dirty()
 
     @property
     def root(self):
@@ -69,7 +314,33 @@ class Node:
         Returns:
             The root node. Returns self if this node *is* the root node.
         """
-        return self._root if self._root else self
+        if self._cached_root_generation == _generation:
+            return self._cached_root
+
+        # Walk up the tree until the root, or an ancestor whose cached root is still
+        # valid, is found; every node passed on the way has the same root.
+        chain = []
+        node = self
+        while node._cached_root_generation != _generation:
+            chain.append(node)
+            if node._parent is None:
+                root = node
+                break
+            node = node._parent
+        else:
+            root = node._cached_root
+
+        for node in chain:
+            node._cached_root = root
+            node._cached_root_generation = _generation
+        return root
+
+    @property
+    def _root(self):
+        # The root of the tree, or None if this node is the root; kept for code that
+        # used to read the attribute that the root was stored in.
+        root = self.root
+        return None if root is self else root
 
     @property
     def parent(self):
@@ -103,6 +374,102 @@ class Node:
         """
         return self._children is not None
 
+    def ancestors(self):
+        """Iterate over the ancestors of this node.
+
+        Returns:
+            An iterator of the node's parent, then its parent's parent, and so on up
+            to the root of the tree.
+        """
+        node = self._parent
+        while node is not None:
+            yield node
+            node = node._parent
+
+    def walk_preorder(self, prune=None):
+        """Iterate over this node and its descendants, each before its children.
+
+        The tree is walked without recursion, so it can be of any depth. The tree
+        shouldn't be changed while it's being walked, except for the node that has
+        just been produced, which can be changed in any way other than changing its
+        children.
+
+        Args:
+            prune: An optional callable, which is passed each node that has
+                children, before it's produced. If it returns True, the node is
+                produced but its descendants aren't. Nodes without children are
+                produced without being passed to it.
+
+        Returns:
+            An iterator of nodes, in depth-first order, starting with this node.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            children = node._children
+            if children and (prune is None or not prune(node)):
+                stack.extend(reversed(children))
+            yield node
+
+    def walk_postorder(self, prune=None):
+        """Iterate over this node and its descendants, each after its children.
+
+        The tree is walked without recursion, so it can be of any depth. The tree
+        shouldn't be changed while it's being walked.
+
+        Args:
+            prune: An optional callable, which is passed each node that has
+                children, before they're visited. If it returns True, the node is
+                produced but its descendants aren't. Nodes without children are
+                produced without being passed to it.
+
+        Returns:
+            An iterator of nodes, in depth-first order, ending with this node.
+        """
+        if not self._children or (prune is not None and prune(self)):
+            yield self
+            return
+
+        # The nodes whose children are being visited, and an iterator over the
+        # children of each of them.
+        parents = [self]
+        stack = [iter(self._children)]
+        while stack:
+            for child in stack[-1]:
+                if child._children and (prune is None or not prune(child)):
+                    parents.append(child)
+                    stack.append(iter(child._children))
+                    break
+                yield child
+            else:
+                stack.pop()
+                yield parents.pop()
+
+    def walk_breadth_first(self, prune=None):
+        """Iterate over this node and its descendants, level by level.
+
+        The tree shouldn't be changed while it's being walked, except for the node
+        that has just been produced, which can be changed in any way other than
+        changing its children.
+
+        Args:
+            prune: An optional callable, which is passed each node that has
+                children, before it's produced. If it returns True, the node is
+                produced but its descendants aren't. Nodes without children are
+                produced without being passed to it.
+
+        Returns:
+            An iterator of nodes, starting with this node, then its children, then
+            its grandchildren, and so on.
+        """
+        queue = deque([self])
+        while queue:
+            node = queue.popleft()
+            children = node._children
+            if children and (prune is None or not prune(node)):
+                queue.extend(children)
+            yield node
+
     def add(self, child):
         """Add a node as a child of this one.
         Args:
@@ -115,8 +482,9 @@ class Node:
             raise ValueError("Cannot add children")
 
         self._children.append(child)
-        child._parent = self
-        self._set_root(child, self.root)
+        if self._index is not None and not self._index.append(child):
+            self._index = None
+        self._set_parent((child,), self)
 
     def insert(self, index, child):
         """Insert a node as a child of this one.
@@ -130,9 +498,8 @@ class Node:
         if self._children is None:
             raise ValueError("Cannot insert child")
 
-        self._children.insert(index, child)
-        child._parent = self
-        self._set_root(child, self.root)
+        self._insert(index, child)
+        self._set_parent((child,), self)
 
     def remove(self, child):
         """Remove child from this node.
@@ -145,9 +512,8 @@ class Node:
         if self._children is None:
             raise ValueError("Cannot remove children")
 
-        self._children.remove(child)
-        child._parent = None
-        self._set_root(child, None)
+        self._take(child)
+        self._set_parent((child,), None)
 
     def clear(self):
         """Clear all children from this node.
@@ -159,38 +525,266 @@ class Node:
             # This is a leaf, so do nothing.
             return
 
-        for child in self._children:
-            child._parent = None
-            self._set_root(child, None)
+        self._set_parent(self._children, None)
         self._children = []
+        self._index = None
+
+    def extend(self, children):
+        """Add several nodes as children of this one, after any existing children.
+
+        This is equivalent to calling :meth:`add` for each child, but the children
+        are re-parented in a single pass.
+
+        Args:
+            children: An iterable of nodes to add as children to this node.
+
+        Raises:
+            ValueError: If this node is a leaf, and cannot have children.
+        """
+        if self._children is None:
+            raise ValueError("Cannot add children")
+
+        children = list(children)
+        self._children.extend(children)
+        self._index = None
+        self._set_parent(children, self)
+
+    def replace_children(self, children):
+        """Replace all the children of this node.
+
+        Nodes that are children both before and after the replacement keep their
+        place in the tree, and aren't re-parented; only the nodes that are removed or
+        added are. This is equivalent to, but much cheaper than, calling
+        :meth:`clear` and then adding each of the new children.
+
+        Args:
+            children: An iterable of the nodes that will be the children of this
+                node, in order.
+
+        Raises:
+            ValueError: If this node is a leaf, and cannot have children.
+            TypeError: If any of the children isn't a node. The node's children are
+                left unchanged.
+        """
+        if self._children is None:
+            raise ValueError("Cannot replace children")
+
+        children = list(children)
+        previous = self._children
+
+        # Work out which nodes are added and removed, by identity, before anything
+        # is changed.
+        kept = {id(child) for child in previous}
+        new = set()
+        added = []
+        for child in children:
+            if not isinstance(child, Node):
+                raise TypeError(f"{child!r} is not a node")
+            if id(child) not in new:
+                new.add(id(child))
+                if id(child) not in kept:
+                    added.append(child)
+        removed = [child for child in previous if id(child) not in new]
+
+        self._children = children
+        self._index = None
+        self._set_parent(removed, None)
+        self._set_parent(added, self)
+        self.layout.dirty()
+
+    def move(self, child, index):
+        """Move a child of this node to a different position among its children.
+
+        The child isn't re-parented, so this is much cheaper than removing and
+        re-inserting it.
+
+        Args:
+            child: The child to move.
+            index: The position to move the child to, as for :meth:`list.insert`.
+
+        Raises:
+            ValueError: If this node is a leaf, and cannot have children, or if the
+                node isn't one of its children.
+        """
+        if self._children is None:
+            raise ValueError("Cannot move children")
+
+        self._take(child)
+        self._insert(index, child)
+        self.layout.dirty()
+
+    def index_of(self, child):
+        """Find the position of a child of this node.
+
+        Nodes with many children keep an index of their positions, so this doesn't
+        need to search the list of children.
+
+        Args:
+            child: The child to find.
+
+        Returns:
+            The index of the child in :attr:`children`.
+
+        Raises:
+            ValueError: If the node isn't one of this node's children.
+        """
+        if not self._children:
+            raise ValueError(f"{child!r} is not a child of {self!r}")
+        return self._position(child)
+
+    def _position(self, child):
+        # The position of a child. The children of a wide node are found using an
+        # index, which is built when it's first needed; if it's found to be out of
+        # date, it's rebuilt.
+        children = self._children
+        if len(children) < _INDEX_THRESHOLD:
+            try:
+                return children.index(child)
+            except ValueError:
+                raise ValueError(f"{child!r} is not a child of {self!r}") from None
+
+        # Children are often added and removed at the ends.
+        if children[-1] is child:
+            return len(children) - 1
+        elif children[0] is child:
+            return 0
+
+        if self._index is not None:
+            position = self._index.position(child)
+            if (
+                position is not None
+                and position < len(children)
+                and children[position] is child
+            ):
+                return position
+
+        self._index = _ChildIndex(children)
+        position = self._index.position(child)
+        if position is None:
+            raise ValueError(f"{child!r} is not a child of {self!r}")
+        return position
+
+    def _take(self, child):
+        # Remove a child from the list of children, without re-parenting it.
+        del self._children[self._position(child)]
+        if self._index is not None:
+            self._index.discard(child)
+
+    def _insert(self, index, child):
+        # Insert a child into the list of children, without re-parenting it. The
+        # index is kept up to date if the child is added at either end.
+        count = len(self._children)
+        self._children.insert(index, child)
+        if self._index is not None:
+            if index < 0:
+                index += count
+            if index >= count:
+                added = self._index.append(child)
+            elif index <= 0:
+                added = self._index.prepend(child)
+            else:
+                added = False
+            if not added:
+                self._index = None
 
     def refresh(self, viewport):
-        """Refresh the layout and appearance of the tree this node is contained in."""
-        if self._root:
-            self._root.refresh(viewport)
-        else:
-            if self.applicator:
-
-                ######################################################################
-                # 2024-12: Backwards compatibility for Toga <= 0.4.8
-                ######################################################################
-                # Accommodate the earlier signature of layout(), which included the node
-                # as a parameter.
-                try:
-                    self.style.layout(viewport)
-                except TypeError as error:
-                    if "layout() missing 1 required positional argument:" in str(error):
-                        self.style.layout(self, viewport)
-                    else:
-                        raise
-                ######################################################################
-                # End backwards compatibility
-                ######################################################################
-
-                self.applicator.set_bounds()
-
-    def _set_root(self, node, root):
-        # Propagate a root node change through a tree.
-        node._root = root
-        for child in node.children:
-            self._set_root(child, root)
+        """Refresh the layout and appearance of the tree this node is contained in.
+
+        Only the parts of the tree containing something that affects geometry that
+        has changed since the tree was last laid out (see :meth:`BaseBox.dirty`) are
+        laid out again. Each part is laid out from the nearest relayout boundary
+        above the change (see :attr:`BaseBox.is_relayout_boundary`), with the
+        boundary style's ``layout_subtree()``, given the size of the boundary's
+        content box; or from the root of the tree, with the root style's
+        ``layout()``, given the viewport. If the viewport has changed size, the whole
+        tree is laid out again.
+        """
+        root = self.root
+        if root is not self:
+            root.refresh(viewport)
+        elif self.applicator:
+            size = (viewport.width, viewport.height, getattr(viewport, "dpi", None))
+            if size != self._viewport_size:
+                regions = [self]
+            else:
+                regions = self._layout_regions()
+
+            for node in regions:
+                if node is self:
+                    node._layout(viewport)
+                else:
+                    box = node.layout
+                    node.style.layout_subtree(
+                        Viewport(box.content_width, box.content_height, dpi=size[2])
+                    )
+                node.applicator.set_bounds()
+
+            self._viewport_size = size
+            if regions:
+                self._layout_done()
+
+    def _layout(self, viewport):
+        ######################################################################
+        # 2024-12: Backwards compatibility for Toga <= 0.4.8
+        ######################################################################
+        # Accommodate the earlier signature of layout(), which included the node
+        # as a parameter.
+        try:
+            self.style.layout(viewport)
+        except TypeError as error:
+            if "layout() missing 1 required positional argument:" in str(error):
+                self.style.layout(self, viewport)
+            else:
+                raise
+        ######################################################################
+        # End backwards compatibility
+        ######################################################################
+
+    def _layout_regions(self):
+        # The nodes to lay out, starting from this one, the root of the tree, so that
+        # every box that needs layout is laid out. Each is either the root, or a
+        # relayout boundary with an applicator; laying one out lays out everything
+        # inside it.
+        regions = []
+        for node in self.walk_preorder(prune=_layout_region_found):
+            box = node.layout
+            if box._dirty or box._dirty_descendants:
+                # If the node is no longer a boundary, lay out the part of the tree
+                # it's in instead.
+                while node is not self and not (
+                    node.applicator and node.layout.is_relayout_boundary
+                ):
+                    node = node._parent
+                if node not in regions:
+                    regions.append(node)
+        return regions
+
+    def _layout_done(self):
+        # Clear the dirty flags of the boxes in this subtree; boxes that weren't
+        # flagged, and their descendants, are left untouched.
+        for node in self.walk_preorder(prune=_layout_clean):
+            box = node.layout
+            box._dirty = box._dirty_descendants = box._dirty_boundaries = False
+
+    def _set_parent(self, nodes, parent):
+        # Changing a node's parent changes the root of every node in its subtree.
+        # Rather than visiting them all, invalidate every cached root, once for the
+        # whole batch; each one is found again, from the parent chain, the next time
+        # it's needed. Values inherited from the old parent are also discarded.
+        global _generation
+        if not nodes:
+            return
+        for node in nodes:
+            node._parent = parent
+            if node._computed:
+                node._invalidate_computed()
+        _generation += 1
+
+        # The node's geometry has changed. So has that of each re-parented node, since
+        # it depends on where the node is in the tree; wherever it ends up, it needs
+        # to be laid out again, and if it's now a root, the size of the viewport it was
+        # last laid out in no longer says anything about its layout.
+        self.layout.dirty()
+        for node in nodes:
+            node._viewport_size = None
+            node.layout.dirty()
@@ -0,0 +1,327 @@
+"""Parsing of style declarations and stylesheets written as text.
+
+Declarations are written as ``name: value`` pairs separated by semicolons, e.g.
+``"padding: 5 10; color: #333; font-weight: bold"``. Property names can be written
+with hyphens or underscores. A value is either a single word or quoted string, a
+space-separated sequence of words (for directional properties like ``padding``), or
+a comma-separated list (for list properties like ``font-family``).
+
+A stylesheet is a sequence of rules, each a selector (see
+:mod:`travertino.stylesheet`) followed by a block of declarations in braces, e.g.
+``"Box.toolbar Button { padding: 5; color: red }"``. Comments are written as
+``/* ... */``.
+
+Both are parsed in a single pass, and the source can be provided as a string, a
+file-like object or an iterable of strings; file-like objects are read in chunks,
+so the whole source never needs to be in memory. Values are validated by the
+properties of a style class. Errors are reported, with the line and column at
+which they occur, to an error handler, and parsing carries on after them.
+"""
+
+import re
+from warnings import warn
+
+from .declaration import directional_property, list_property
+from .stylesheet import Selector
+
+# Each token is preceded by any whitespace and comments, which are only of interest
+# as separators. A comment that matches the "comment" group is unterminated.
+_TOKEN = re.compile(
+    r"""
+    (?P<gap>(?:\s+|/\*.*?\*/)*)
+    (?:
+        (?P<comment>/\*.*)
+        |(?P<string>"[^"]*(?:"|\Z)|'[^']*(?:'|\Z))
+        |(?P<punct>[{};:,])
+        |(?P<word>(?:[^\s{};:,"'()/]+|\([^()]*(?:\)|\Z)|/(?!\*))+)
+        |(?P<other>.)
+        |(?P<end>\Z)
+    )
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# The text that would end an incomplete token of each kind, other than a string,
+# which is ended by its closing quote.
+_TERMINATORS = {"comment": "*/", "word": ")"}
+
+
+class ParseError(ValueError):
+    """An error in the text being parsed.
+
+    :param message: A description of the error.
+    :param line: The line on which the error occurred, starting from 1.
+    :param column: The column at which the error occurred, starting from 1.
+    """
+
+    def __init__(self, message, line, column):
+        super().__init__(f"{message} (line {line}, column {column})")
+        self.message = message
+        self.line = line
+        self.column = column
+
+
+def _warn(error):
+    warn(str(error), RuntimeWarning, stacklevel=2)
+
+
+def _chunks(source, chunk_size):
+    if isinstance(source, str):
+        yield source
+    elif hasattr(source, "read"):
+        while chunk := source.read(chunk_size):
+            yield chunk
+    else:
+        yield from source
+
+
+def _tokens(source, chunk_size, report):
+    # Yield (kind, text, line, column, spaced) for each token in the source, where
+    # spaced indicates whether the token was preceded by whitespace or a comment. A
+    # token that reaches the end of a chunk might continue in the next one, so it's
+    # held back and scanned again with the next chunk appended. If it's incomplete,
+    # like the start of a long comment, it isn't scanned again until the text that
+    # would end it turns up.
+    line = column = 1
+    buffer = ""
+    pending = []
+    waiting_for = None
+    tail = ""
+    chunks = _chunks(source, chunk_size)
+    final = False
+    while not final:
+        chunk = next(chunks, None)
+        if chunk is None:
+            final = True
+        else:
+            pending.append(chunk)
+            if waiting_for is not None:
+                # Include the end of the previous chunk, in case the terminator is
+                # split between them.
+                if waiting_for not in tail + chunk:
+                    tail = (tail + chunk)[-1:]
+                    continue
+                waiting_for = None
+
+        buffer += "".join(pending)
+        pending.clear()
+        end = len(buffer)
+        position = 0
+        for match in _TOKEN.finditer(buffer):
+            kind = match.lastgroup
+            text = match.group(kind)
+            if match.end() == end and not final:
+                if _unterminated(kind, text):
+                    waiting_for = _TERMINATORS.get(kind, text[:1])
+                    tail = buffer[-1:]
+                break
+            position = match.end()
+
+            spaced = match.end("gap") > match.start()
+            if spaced:
+                gap = match.group("gap")
+                if "\n" in gap:
+                    line += gap.count("\n")
+                    column = len(gap) - gap.rindex("\n")
+                else:
+                    column += len(gap)
+
+            if kind == "end":
+                break
+            elif position == end and _unterminated(kind, text):
+                report(ParseError(f"Unterminated {kind}", line, column))
+            else:
+                yield kind, text, line, column, spaced
+
+            if "\n" in text:
+                line += text.count("\n")
+                column = len(text) - text.rindex("\n")
+            else:
+                column += len(text)
+
+        buffer = buffer[position:]
+
+
+def _unterminated(kind, text):
+    # Is a token that reaches the end of the source incomplete?
+    if kind == "comment":
+        return True
+    elif kind == "string":
+        return len(text) < 2 or text[-1] != text[0]
+    elif kind == "word":
+        return text.count("(") != text.count(")")
+    return False
+
+
+def _expand(style_class, name, items):
+    # Convert the items of a declaration's value into (name, value) pairs, validated
+    # by the style class's properties.
+    prop = style_class._ALIASES.get(name.replace("-", "_"))
+    if prop is None:
+        raise ValueError(f"Unknown property {name!r}")
+
+    if isinstance(prop, list_property):
+        return [(prop.name, prop.validate([" ".join(words) for words in items]))]
+
+    if len(items) > 1:
+        raise ValueError(f"Property {name!r} doesn't accept a list of values")
+    words = items[0]
+
+    if isinstance(prop, directional_property):
+        order = prop.ASSIGNMENT_SCHEMES.get(len(words))
+        if order is None:
+            raise ValueError(f"Property {name!r} takes 1 to 4 values")
+        return [
+            (
+                prop.format(direction),
+                style_class._ALIASES[prop.format(direction)].validate(words[index]),
+            )
+            for direction, index in zip(prop.DIRECTIONS, order)
+        ]
+
+    value = " ".join(words)
+    validate = getattr(prop, "validate", None)
+    return [(prop.name, value if validate is None else validate(value))]
+
+
+def _parse_block(tokens, style_class, report, opened=None):
+    # Yield the (name, value) pairs declared in a block. If the block was opened by
+    # a brace, at the given (line, column), it ends with the closing brace;
+    # otherwise, it ends at the end of the source.
+    nested = opened is not None
+    name = None
+    items = [[]]
+    colon = False
+    start = None
+    skipping = False
+
+    def declaration():
+        # Validate the declaration that has just ended.
+        if name is None:
+            return []
+        if not colon:
+            report(ParseError(f"Expected ':' after {name!r}", *start))
+            return []
+        if not all(items):
+            report(ParseError(f"Missing value for {name!r}", *start))
+            return []
+        try:
+            return _expand(style_class, name, items)
+        except (ValueError, TypeError) as error:
+            report(ParseError(str(error), *start))
+            return []
+
+    for kind, text, line, column, _ in tokens:
+        if text == ";" or (text == "}" and nested):
+            if not skipping:
+                yield from declaration()
+            if text == "}":
+                return
+            name = None
+            items = [[]]
+            colon = skipping = False
+            start = None
+        elif skipping:
+            continue
+        elif start is None:
+            start = (line, column)
+            if kind == "word":
+                name = text
+            else:
+                report(ParseError(f"Unexpected {text!r}", line, column))
+                skipping = True
+        elif not colon:
+            if text == ":" and name is not None:
+                colon = True
+            else:
+                report(ParseError(f"Expected ':' after {name!r}", line, column))
+                skipping = True
+        elif kind == "word":
+            items[-1].append(text)
+        elif kind == "string":
+            items[-1].append(text[1:-1])
+        elif text == ",":
+            items.append([])
+        else:
+            report(ParseError(f"Unexpected {text!r}", line, column))
+            skipping = True
+
+    if nested:
+        report(ParseError("Unexpected end of input; expected '}'", *opened))
+    if not skipping:
+        yield from declaration()
+
+
+def parse_declarations(source, style_class, on_error=None, chunk_size=65536):
+    """Parse a block of declarations, such as ``"padding: 5 10; color: #333"``.
+
+    :param source: The text to parse; a string, a file-like object, or an iterable
+        of strings.
+    :param style_class: The style class whose properties validate the values.
+    :param on_error: A callable that is passed a :class:`ParseError` for each error
+        found. Declarations containing errors are skipped. By default, each error is
+        issued as a warning.
+    :param chunk_size: The number of characters to read at a time from a file-like
+        source.
+    :returns: A generator of ``(name, value)`` pairs, with directional properties
+        expanded into their individual directions, which can be used to construct
+        or update a style.
+    """
+    report = on_error or _warn
+    tokens = _tokens(source, chunk_size, report)
+    yield from _parse_block(tokens, style_class, report)
+
+
+def parse_stylesheet(source, style_class, on_error=None, chunk_size=65536):
+    """Parse a stylesheet, such as ``"Button.primary { color: red }"``.
+
+    Rules are parsed and produced one at a time, so a large stylesheet can be
+    processed without holding it all in memory.
+
+    :param source: The text to parse; a string, a file-like object, or an iterable
+        of strings.
+    :param style_class: The style class whose properties validate the values.
+    :param on_error: A callable that is passed a :class:`ParseError` for each error
+        found. Declarations containing errors are skipped, as are rules with invalid
+        selectors. By default, each error is issued as a warning.
+    :param chunk_size: The number of characters to read at a time from a file-like
+        source.
+    :returns: A generator of ``(selector, declarations)`` pairs, where
+        ``declarations`` is a dict; a rule with a comma-separated list of selectors
+        produces a pair for each selector. The pairs can be passed directly to
+        :class:`~travertino.stylesheet.Stylesheet`.
+    """
+    report = on_error or _warn
+    tokens = _tokens(source, chunk_size, report)
+
+    selector = []
+    start = None
+    for kind, text, line, column, spaced in tokens:
+        if spaced:
+            selector.append(" ")
+
+        if text == "{":
+            opened = (line, column)
+            declarations = dict(_parse_block(tokens, style_class, report, opened))
+            for part in "".join(selector).split(","):
+                try:
+                    yield Selector(part), dict(declarations)
+                except ValueError:
+                    report(
+                        ParseError(
+                            f"Invalid selector {part.strip()!r}", *(start or opened)
+                        )
+                    )
+            selector = []
+            start = None
+        elif text in {"}", ";"}:
+            report(ParseError(f"Unexpected {text!r}", line, column))
+            selector = []
+            start = None
+        else:
+            if start is None:
+                start = (line, column)
+            selector.append(text)
+
+    if "".join(selector).strip():
+        report(ParseError("Unexpected end of input; expected '{'", *start))
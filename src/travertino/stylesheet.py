@@ -0,0 +1,265 @@
+"""Stylesheets: styles applied to nodes that match selectors.
+
+A selector is a sequence of compound selectors separated by whitespace, each of
+which matches a descendant of a node matching the one before it. A compound
+selector is made of an optional type (or ``*``), followed by any number of ``#id``
+and ``.class`` parts; for example, ``Box.toolbar Button#ok``.
+
+Selectors are matched against nodes as follows:
+
+* a type matches the name of the node's class, or of any of its base classes;
+* an id matches the node's ``id`` attribute;
+* a class matches any of the strings in the node's ``classes`` attribute.
+
+Nodes without ``id`` or ``classes`` attributes only match selectors that don't
+need them.
+"""
+
+import re
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+
+_COMPOUND = re.compile(r"(\*|[A-Za-z_][\w-]*)?((?:[#.][A-Za-z_][\w-]*)*)")
+_PART = re.compile(r"([#.])([\w-]+)")
+
+
+@lru_cache(maxsize=None)
+def _type_names(cls):
+    # The names a type selector can use to match an instance of a class.
+    return frozenset(base.__name__ for base in cls.__mro__ if base is not object)
+
+
+class SimpleSelector(namedtuple("SimpleSelector", ["type", "id", "classes"])):
+    """A compound of a type, an id and classes, all of which a node must match.
+
+    Any of the parts can be empty: ``type`` and ``id`` are None if they aren't
+    specified, and ``classes`` is a (possibly empty) frozenset.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, text):
+        match = _COMPOUND.fullmatch(text)
+        if not text or match is None:
+            raise ValueError(f"Invalid selector {text!r}")
+
+        type_name, parts = match.groups()
+        id = None
+        classes = set()
+        for prefix, name in _PART.findall(parts):
+            if prefix == ".":
+                classes.add(name)
+            elif id is None or id == name:
+                id = name
+            else:
+                # A node can only have one id.
+                raise ValueError(f"Invalid selector {text!r}")
+
+        return cls(None if type_name == "*" else type_name, id, frozenset(classes))
+
+    def matches(self, node):
+        return (
+            (self.type is None or self.type in _type_names(type(node)))
+            and (self.id is None or self.id == getattr(node, "id", None))
+            and self.classes.issubset(getattr(node, "classes", ()))
+        )
+
+    def __str__(self):
+        return (
+            (self.type or ("" if self.id or self.classes else "*"))
+            + (f"#{self.id}" if self.id else "")
+            + "".join(f".{name}" for name in sorted(self.classes))
+        )
+
+
+class Selector:
+    """A selector, made of simple selectors each matching a descendant of the last.
+
+    :param text: The selector, e.g. ``"Box.toolbar Button#ok"``.
+    """
+
+    __slots__ = ("parts", "specificity")
+
+    def __init__(self, text):
+        self.parts = tuple(SimpleSelector.parse(part) for part in text.split())
+        if not self.parts:
+            raise ValueError(f"Invalid selector {text!r}")
+
+        # The number of ids, classes and types in the selector; when more than one
+        # rule sets a property, the one with the highest specificity wins.
+        self.specificity = (
+            sum(part.id is not None for part in self.parts),
+            sum(len(part.classes) for part in self.parts),
+            sum(part.type is not None for part in self.parts),
+        )
+
+    def __repr__(self):
+        return f"<Selector {str(self)!r}>"
+
+    def __str__(self):
+        return " ".join(str(part) for part in self.parts)
+
+    def __eq__(self, other):
+        if not isinstance(other, Selector):
+            return NotImplemented
+        return self.parts == other.parts
+
+    def __hash__(self):
+        return hash(self.parts)
+
+    @property
+    def key(self):
+        """The simple selector that a node must match for this selector to match."""
+        return self.parts[-1]
+
+    def matches(self, node):
+        """Does the node match this selector?"""
+        if not self.key.matches(node):
+            return False
+
+        # Each earlier part must match an ancestor of the node matching the part
+        # after it. Taking the nearest such ancestor each time never rules out a
+        # match that a more distant one would allow.
+        ancestor = node
+        for part in reversed(self.parts[:-1]):
+            ancestor = ancestor.parent
+            while ancestor is not None and not part.matches(ancestor):
+                ancestor = ancestor.parent
+            if ancestor is None:
+                return False
+        return True
+
+
+class Rule(namedtuple("Rule", ["selector", "declarations", "order"])):
+    """A rule in a stylesheet.
+
+    :param selector: The :class:`Selector` of the nodes the rule applies to.
+    :param declarations: A mapping of property names to values.
+    :param order: The position of the rule in its stylesheet; when rules of the same
+        specificity set a property, the later rule wins.
+    """
+
+    __slots__ = ()
+
+    @property
+    def priority(self):
+        return self.selector.specificity, self.order
+
+
+class Stylesheet:
+    """A collection of rules, applied to the nodes that match their selectors.
+
+    Rules are indexed by the part of their selector that a node must match (its
+    id, if it has one, otherwise one of its classes, otherwise its type), so finding
+    the rules for a node only examines rules that could apply to it.
+
+    :param rules: An optional iterable of ``(selector, declarations)`` pairs to add
+        to the stylesheet.
+    """
+
+    def __init__(self, rules=()):
+        self._rules = []
+        self._by_id = defaultdict(list)
+        self._by_class = defaultdict(list)
+        self._by_type = defaultdict(list)
+        self._universal = []
+
+        for selector, declarations in rules:
+            self.add(selector, declarations)
+
+    def __len__(self):
+        return len(self._rules)
+
+    def __iter__(self):
+        return iter(self._rules)
+
+    def add(self, selector, declarations):
+        """Add a rule to the stylesheet.
+
+        :param selector: The selector for the rule, as a :class:`Selector` or a
+            string.
+        :param declarations: A mapping of property names to values; usually a dict,
+            or a style.
+        :returns: The new :class:`Rule`.
+        """
+        if not isinstance(selector, Selector):
+            selector = Selector(selector)
+
+        rule = Rule(selector, declarations, len(self._rules))
+        self._rules.append(rule)
+
+        key = selector.key
+        if key.id is not None:
+            self._by_id[key.id].append(rule)
+        elif key.classes:
+            # Any one of the classes will do; all of them have to match anyway.
+            self._by_class[min(key.classes)].append(rule)
+        elif key.type is not None:
+            self._by_type[key.type].append(rule)
+        else:
+            self._universal.append(rule)
+        return rule
+
+    def update(self, other):
+        """Add all the rules of another stylesheet, after those in this one."""
+        for rule in list(other):
+            self.add(rule.selector, rule.declarations)
+
+    def __or__(self, other):
+        if not isinstance(other, Stylesheet):
+            return NotImplemented
+        result = Stylesheet((rule.selector, rule.declarations) for rule in self._rules)
+        result.update(other)
+        return result
+
+    def __ior__(self, other):
+        if not isinstance(other, Stylesheet):
+            return NotImplemented
+        self.update(other)
+        return self
+
+    def _candidates(self, node):
+        # The rules whose key could match the node. Each rule is in exactly one
+        # index, so there are no duplicates.
+        candidates = list(self._universal)
+
+        node_id = getattr(node, "id", None)
+        if node_id is not None and node_id in self._by_id:
+            candidates.extend(self._by_id[node_id])
+
+        if self._by_class:
+            for name in set(getattr(node, "classes", ())):
+                if name in self._by_class:
+                    candidates.extend(self._by_class[name])
+
+        for name in _type_names(type(node)):
+            if name in self._by_type:
+                candidates.extend(self._by_type[name])
+
+        return candidates
+
+    def matching(self, node):
+        """The rules that apply to a node.
+
+        :returns: A list of rules, in increasing order of priority.
+        """
+        rules = [rule for rule in self._candidates(node) if rule.selector.matches(node)]
+        rules.sort(key=Rule.priority.fget)
+        return rules
+
+    def style_for(self, node):
+        """Compute the style a node would have with this stylesheet applied.
+
+        Starting from a new style of the same class as the node's style, the
+        declarations of the matching rules are merged in order of priority; the
+        properties set on the node's own style are merged last, so they override
+        the stylesheet.
+
+        :returns: A new style; the node's style isn't modified.
+        """
+        style = node.style.__class__()
+        for rule in self.matching(node):
+            style |= rule.declarations
+        style |= node.style
+        return style
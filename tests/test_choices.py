@@ -383,3 +383,120 @@ def test_string_symbol(StyleClass):
     # Both equality and instance checking should work.
     assert_property(style, "string_symbol", TOP)
     assert style.string_symbol is TOP
+
+
+@pytest.mark.parametrize(
+    "choices",
+    [
+        Choices("a", "b", NONE),
+        Choices(1, 2.5, NONE),
+        Choices(NONE, string=True),
+        Choices(NONE, integer=True),
+        Choices(NONE, number=True),
+        Choices(NONE, color=True),
+        Choices("a", "b", NONE, integer=True, number=True),
+        Choices(0, NONE, number=True),
+        Choices("a", "b", NONE, number=True, color=True),
+        Choices(NONE, string=True, integer=True, number=True, color=True),
+    ],
+)
+@pytest.mark.parametrize(
+    "value",
+    [
+        "a",
+        NONE,
+        "  padded  ",
+        "10",
+        "3.5",
+        "#112233",
+        REBECCAPURPLE,
+        10,
+        1,
+        True,
+        3.5,
+        2.5,
+        float("nan"),
+        rgb(10, 20, 30),
+        [1, 2],
+    ],
+)
+def test_compiled_validator(choices, value):
+    """The compiled validator produces the same result as the generic path."""
+    try:
+        expected = choices._validate_generic(value)
+    except ValueError:
+        with pytest.raises(ValueError, match=r"is not a valid value"):
+            choices.validate(value)
+    else:
+        result = choices.validate(value)
+        assert type(result) is type(expected)
+        # NaN isn't equal to itself, so compare representations.
+        assert repr(result) == repr(expected)
+
+
+def test_compiled_validator_constant_identity():
+    """Constants are returned as the constant object, not the value provided."""
+    choices = Choices(TOP, NONE, integer=True)
+    val = "TOP"
+
+    assert choices.validate(val.lower()) is TOP
+
+
+def test_compiled_validator_numeric_constant():
+    """Numeric constants are matched by values of any numeric type."""
+    choices = Choices(1, NONE)
+
+    assert choices.validate(1) == 1
+    assert choices.validate(1.0) == 1
+    assert choices.validate(True) == 1
+
+    with pytest.raises(ValueError):
+        choices.validate(2)
+
+
+def test_validation_cache():
+    """Validation results can be memoized."""
+    choices = Choices(NONE, number=True, color=True, cache_size=2)
+
+    assert choices.cache_info() == (0, 0, 2, 0)
+
+    assert choices.validate("#112233") == rgb(0x11, 0x22, 0x33)
+    assert choices.cache_info() == (0, 1, 2, 1)
+
+    # A repeated value is served from the cache
+    first = choices.validate(REBECCAPURPLE)
+    assert choices.validate(REBECCAPURPLE) is first
+    assert choices.cache_info() == (1, 2, 2, 2)
+
+    # The cache distinguishes values that compare equal, but have different types.
+    assert choices.validate(1) == 1.0
+    assert choices.validate(1.0) == 1.0
+    assert choices.cache_info() == (1, 4, 2, 2)
+
+    # Invalid values aren't cached, and still raise errors.
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            choices.validate("invalid")
+    assert choices.cache_info() == (1, 6, 2, 2)
+
+    choices.cache_clear()
+    assert choices.cache_info() == (0, 0, 2, 0)
+
+
+def test_validation_cache_unhashable():
+    """Unhashable values bypass the cache."""
+    choices = Choices(NONE, string=True, cache_size=10)
+
+    with pytest.raises(ValueError):
+        choices.validate(["a", "b"])
+
+    assert choices.cache_info() == (0, 0, 10, 0)
+
+
+def test_validation_cache_disabled():
+    """Caching isn't enabled by default."""
+    choices = Choices(NONE, number=True)
+
+    assert choices.cache_info() is None
+    # Clearing a cache that doesn't exist is a no-op.
+    choices.cache_clear()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from unittest.mock import call
+import sys
+from unittest.mock import Mock, call
 from warnings import catch_warnings, filterwarnings
+from weakref import WeakKeyDictionary
 
 import pytest
 
@@ -10,6 +12,7 @@ from travertino.declaration import (
     BaseStyle,
     Choices,
     ImmutableList,
+    applies,
     directional_property,
     list_property,
     validated_property,
@@ -126,6 +129,402 @@ def test_create_and_copy(StyleClass):
     assert dup.implicit == VALUE3
 
 
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_copy_on_write(StyleClass):
+    """A copy shares storage with the original until either is modified."""
+    style = StyleClass(explicit_const=VALUE2, implicit=VALUE3)
+
+    dup = style.copy()
+    assert dup._values is style._values
+    assert dup.keys() == {"explicit_const", "implicit"}
+
+    # Values are transferred without being applied again.
+    dup.apply.assert_not_called()
+
+    # Further copies share the same storage.
+    dup2 = style.copy()
+    assert dup2._values is style._values
+
+    # Modifying the copy doesn't affect the original...
+    dup.explicit_const = VALUE3
+    del dup.implicit
+    assert dup._values is not style._values
+    assert dup.explicit_const == VALUE3
+    assert dup.keys() == {"explicit_const"}
+    assert style.explicit_const == VALUE2
+    assert style.implicit == VALUE3
+    assert style.keys() == {"explicit_const", "implicit"}
+
+    # ... and modifying the original doesn't affect other copies.
+    style.explicit_value = 10
+    assert style._values is not dup2._values
+    assert dup2.explicit_value == 0
+    assert dup2.keys() == {"explicit_const", "implicit"}
+
+
+def test_copy_constructor_values():
+    """If the constructor sets properties, copied values are set over them."""
+
+    @prep_style_class
+    class DefaultingStyle(Style):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.explicit_value = 42
+
+    style = DefaultingStyle(explicit_const=VALUE2)
+    del style.explicit_value
+
+    dup = style.copy()
+    assert dup.explicit_const == VALUE2
+    assert dup.explicit_value == 42
+
+
+class PlainStyle(BaseStyle):
+    explicit_const = validated_property(choices=VALUE_CHOICES, initial=VALUE1)
+    implicit = validated_property(choices=DEFAULT_VALUE_CHOICES)
+
+    def apply(self, property, value):
+        pass
+
+
+def test_copy_discards_cached_values():
+    """Values cached by the constructor aren't carried over to a copy."""
+
+    @prep_style_class
+    class CachingStyle(Style, hashable=True):
+        def __post_init__(self):
+            # Reading the properties caches derived values.
+            self.thing
+            hash(self)
+
+    style = CachingStyle(thing=5)
+    for dup in [style.copy(), CachingStyle.from_frozen(style.freeze())]:
+        assert dup.thing == (5, 5, 5, 5)
+        assert dup == style
+        assert hash(dup) == hash(style)
+
+
+def test_generated_methods():
+    """Style classes get copy and __eq__ methods of their own."""
+    for name in ["copy", "__eq__"]:
+        assert PlainStyle.__dict__[name]._generated
+    assert "__init__" not in PlainStyle.__dict__
+
+    # They're defined before @dataclass is applied, so it doesn't replace them.
+    assert Style.__dict__["__eq__"]._generated
+
+    style = PlainStyle(explicit_const=VALUE2, implicit=VALUE3)
+    assert style.explicit_const == VALUE2
+    assert style.implicit == VALUE3
+    with pytest.raises(NameError, match=r"Unknown style bogus"):
+        PlainStyle(bogus=VALUE1)
+
+    # Copies are made without calling the constructor.
+    dup = style.copy()
+    assert dup._values is style._values
+    assert dup.keys() == {"explicit_const", "implicit"}
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Requires kw_only dataclasses")
+def test_dataclass_constructor():
+    """Dataclass styles keep the constructor generated by @dataclass."""
+    assert "__init__" in Style.__dict__
+    assert not hasattr(Style.__init__, "_generated")
+
+    with pytest.raises(TypeError, match=r"unexpected keyword argument 'bogus'"):
+        Style(bogus=VALUE1)
+
+    style = Style(explicit_const=VALUE2)
+    dup = style.copy()
+    assert dup == style
+    assert dup._values is style._values
+
+
+@pytest.mark.parametrize("StyleClass", [PlainStyle, Style, DeprecatedStyle])
+def test_equality(StyleClass):
+    """Styles of the same class are equal if their properties have the same values."""
+    style = StyleClass(explicit_const=VALUE2)
+
+    assert style == style.copy()
+    assert style == StyleClass(explicit_const=VALUE2)
+    assert style != StyleClass(explicit_const=VALUE3)
+    assert style != StyleClass()
+
+    # A property set to its initial value is equal to an unset one.
+    style.explicit_const = VALUE1
+    assert style == StyleClass()
+
+    # Styles of different classes aren't equal.
+    assert style != Sibling()
+    assert style != {}
+
+    # As with dataclasses, styles that compare by value aren't hashable.
+    with pytest.raises(TypeError):
+        hash(style)
+
+
+class HashableStyle(Style, hashable=True):
+    pass
+
+
+def test_hashable():
+    """Styles of hashable classes hash consistently with equality."""
+    style = HashableStyle(explicit_const=VALUE2, thing=(1, 2))
+    same = HashableStyle(explicit_const=VALUE2, thing=(1, 2))
+    assert hash(style) == hash(same)
+    assert {style: "found"}[same] == "found"
+
+    # A property set to its initial value hashes like an unset one.
+    style.explicit_value = 10
+    style.explicit_value = 0
+    assert style == same
+    assert hash(style) == hash(same)
+
+    # The hash is cached, and discarded when a property changes.
+    assert style.__dict__["_hash_cached"] == hash(style)
+    style.thing_left = 5
+    assert "_hash_cached" not in style.__dict__
+    assert hash(style) != hash(same)
+
+    style.thing_left = 2
+    assert hash(style) == hash(same)
+    del style.explicit_const
+    assert hash(style) == hash(HashableStyle(thing=(1, 2)))
+
+    # Copies hash the same, and have their own cache.
+    dup = style.copy()
+    assert hash(dup) == hash(style)
+    dup.explicit_const = VALUE3
+    assert hash(dup) != hash(style)
+    assert hash(style) == hash(HashableStyle(thing=(1, 2)))
+
+    # List values can be hashed.
+    style.list_prop = [1, 2]
+    assert hash(style) == hash(HashableStyle(thing=(1, 2), list_prop=[1, 2]))
+
+
+def test_identity_equality():
+    """With eq=False, styles compare and hash by identity."""
+
+    class IdentityStyle(PlainStyle, eq=False, hashable=True):
+        pass
+
+    class IdentityChild(IdentityStyle):
+        pass
+
+    for style_class in [IdentityStyle, IdentityChild]:
+        style = style_class(explicit_const=VALUE2)
+        assert not hasattr(style_class.__eq__, "_generated")
+        assert style == style
+        assert style != style.copy()
+        assert hash(style) == object.__hash__(style)
+
+        cache = WeakKeyDictionary()
+        cache[style] = "found"
+        assert cache[style] == "found"
+        assert len({style, style_class(explicit_const=VALUE2)}) == 2
+
+
+def test_hashable_inherited():
+    class ChildStyle(HashableStyle):
+        pass
+
+    class UnhashableChildStyle(HashableStyle, hashable=False):
+        pass
+
+    assert hash(ChildStyle()) == hash(ChildStyle())
+    with pytest.raises(TypeError):
+        hash(UnhashableChildStyle())
+    with pytest.raises(TypeError):
+        hash(Style())
+
+
+def test_generated_methods_respect_overrides():
+    """Methods defined on a class or its parent aren't replaced."""
+
+    class CustomStyle(PlainStyle):
+        def __init__(self, **style):
+            super().__init__(**style)
+            self.implicit = VALUE2
+
+        def __eq__(self, other):
+            return True
+
+        def __hash__(self):
+            return 42
+
+    class CustomChild(CustomStyle):
+        pass
+
+    for style_class in [CustomStyle, CustomChild]:
+        assert style_class().implicit == VALUE2
+        assert style_class() == object()
+        assert hash(style_class()) == 42
+
+        # The constructor is still called when copying.
+        style = style_class()
+        del style.implicit
+        assert style.copy().implicit == VALUE2
+
+    class PostInitStyle(PlainStyle):
+        def __post_init__(self):
+            self.implicit = VALUE3
+
+    assert PostInitStyle().implicit == VALUE3
+    style = PostInitStyle()
+    del style.implicit
+    assert style.copy().implicit == VALUE3
+
+
+def test_generated_methods_property_added_later():
+    """Adding a property after the class is created regenerates the methods."""
+
+    class GrowingStyle(PlainStyle):
+        pass
+
+    old = GrowingStyle()
+    with catch_warnings():
+        filterwarnings("ignore", category=DeprecationWarning)
+        GrowingStyle.validated_property("extra", choices=VALUE_CHOICES, initial=0)
+
+    new = GrowingStyle(extra=10)
+    assert new != old
+    assert old == GrowingStyle()
+    new.extra = 0
+    assert new == old
+
+
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_freeze(StyleClass):
+    style = StyleClass(explicit_const=VALUE2, thing=(1, 2))
+    frozen = style.freeze()
+
+    # The snapshot is a read-only mapping of the properties that are set.
+    assert frozen.style_class is StyleClass
+    assert len(frozen) == 5
+    assert dict(frozen) == {
+        "explicit_const": VALUE2,
+        "thing_top": 1,
+        "thing_right": 2,
+        "thing_bottom": 1,
+        "thing_left": 2,
+    }
+    assert frozen["thing-top"] == 1
+    assert "explicit_const" in frozen
+    assert "explicit_value" not in frozen
+    with pytest.raises(KeyError):
+        frozen["explicit_value"]
+    with pytest.raises(KeyError):
+        frozen["thing"]
+    with pytest.raises(KeyError):
+        frozen["no_such_property"]
+    with pytest.raises(TypeError):
+        frozen["explicit_const"] = VALUE3
+
+    # Identical styles produce the same snapshot.
+    other = StyleClass(thing=(1, 2), explicit_const=VALUE2)
+    assert other.freeze() is frozen
+    assert hash(other.freeze()) == hash(frozen)
+
+    # Modifying the style doesn't affect the snapshot.
+    style.explicit_const = VALUE3
+    assert frozen["explicit_const"] == VALUE2
+    assert style.freeze() is not frozen
+    assert style.freeze() != frozen
+
+    # Snapshots compare equal to equivalent mappings.
+    assert frozen == dict(frozen)
+
+
+def test_freeze_distinguishes_types():
+    """Values that are equal but of different types aren't merged."""
+
+    @prep_style_class
+    class NumberStyle(BaseStyle):
+        value: int | float = validated_property(
+            choices=Choices(integer=True), initial=0
+        )
+
+    frozen_int = NumberStyle(value=1).freeze()
+    style = NumberStyle()
+    # Bypass validation to store a float.
+    style._values = (1.0,)
+    style._set_mask = 1
+    frozen_float = style.freeze()
+
+    assert frozen_int is not frozen_float
+    assert NumberStyle.from_frozen(frozen_float).value.__class__ is float
+
+
+def test_freeze_list_property():
+    style = Style(list_prop=[VALUE1, VALUE3])
+    frozen = style.freeze()
+
+    assert Style(list_prop=[VALUE1, VALUE3]).freeze() is frozen
+    assert Style(list_prop=[VALUE3, VALUE1]).freeze() is not frozen
+
+
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_from_frozen(StyleClass):
+    style = StyleClass(explicit_const=VALUE2, implicit=VALUE3)
+    frozen = style.freeze()
+
+    thawed = StyleClass.from_frozen(frozen)
+    assert thawed is not style
+    assert thawed.keys() == {"explicit_const", "implicit"}
+    assert thawed.explicit_const == VALUE2
+
+    # The thawed style can be modified without affecting the snapshot.
+    thawed.explicit_const = VALUE1
+    assert frozen["explicit_const"] == VALUE2
+
+    # Snapshots can only be thawed into the class they were created from.
+    with pytest.raises(TypeError, match=r"Can't create Sibling from a snapshot"):
+        Sibling.from_frozen(frozen)
+
+
+def test_from_frozen_constructor_values():
+    """If the constructor sets properties, snapshot values are set over them."""
+
+    @prep_style_class
+    class DefaultingStyle(Style):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.explicit_value = 42
+
+    frozen = DefaultingStyle(explicit_const=VALUE2).freeze()
+    thawed = DefaultingStyle.from_frozen(frozen)
+    assert thawed.explicit_const == VALUE2
+    assert thawed.explicit_value == 42
+
+
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_diff(StyleClass):
+    style = StyleClass(explicit_const=VALUE2, explicit_value=10, implicit=VALUE1)
+    other = StyleClass(explicit_const=VALUE3, explicit_value=10, thing_top=5)
+
+    diff = style.diff(other)
+    assert diff
+    assert diff.changed == {"explicit_const": VALUE3}
+    assert diff.added == {"thing_top": 5}
+    assert diff.removed == {"implicit"}
+
+    # The reverse diff
+    diff = other.diff(style)
+    assert diff.changed == {"explicit_const": VALUE2}
+    assert diff.added == {"implicit": VALUE1}
+    assert diff.removed == {"thing_top"}
+
+    # Identical styles, and copies, have no differences.
+    assert not style.diff(style)
+    assert not style.diff(style.copy())
+    assert not StyleClass().diff(StyleClass())
+
+    # Styles of different classes can't be compared.
+    with pytest.raises(TypeError, match=r"Can't compare .* with Sibling"):
+        style.diff(Sibling())
+
+
 def test_deprecated_copy():
     style = MockedReapplyStyle()
 
@@ -155,6 +554,169 @@ def test_reapply(StyleClass):
     )
 
 
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_reapply_changes_only(StyleClass):
+    """Once applied with an applicator, reapply only applies what has changed."""
+    style = StyleClass(explicit_const=VALUE2)
+    style.apply.reset_mock()
+
+    # Assigning an applicator applies everything.
+    style._applicator = Mock()
+    assert style.apply.call_count == len(StyleClass._PROPERTIES)
+
+    # With nothing changed, there's nothing to reapply.
+    style.apply.reset_mock()
+    style.reapply()
+    style.apply.assert_not_called()
+
+    # A property that failed to apply is applied again by the next reapply.
+    style.apply.side_effect = RuntimeError("Not ready")
+    with pytest.raises(RuntimeError):
+        style.implicit = VALUE3
+    style.apply.side_effect = None
+    style.apply.reset_mock()
+
+    style.reapply()
+    style.apply.assert_called_once_with("implicit", VALUE3)
+
+    style.apply.reset_mock()
+    style.reapply()
+    style.apply.assert_not_called()
+
+    # Forcing a reapply applies everything.
+    style.reapply(force=True)
+    assert style.apply.call_count == len(StyleClass._PROPERTIES)
+
+
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_reapply_new_applicator(StyleClass):
+    """Changing the applicator makes the next reapply apply everything."""
+    style = StyleClass()
+    style._applicator = Mock()
+    style._applicator = Mock()
+    style.apply.reset_mock()
+
+    style.reapply()
+    style.apply.assert_not_called()
+
+    # Copies aren't applied to anything.
+    style_copy = style.copy()
+    style_copy._assigned_applicator = style._applicator
+    style_copy.apply = Mock()
+    style_copy.reapply()
+    assert style_copy.apply.call_count == len(StyleClass._PROPERTIES)
+
+
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_reapply_batch_failure(StyleClass):
+    """Changes in a batch that fails to apply are applied again by reapply."""
+    style = StyleClass()
+    style._applicator = Mock()
+    style.apply_many = Mock(side_effect=RuntimeError("Not ready"))
+
+    with pytest.raises(RuntimeError):
+        with style.batch():
+            style.implicit = VALUE3
+            style.explicit_value = 10
+
+    style.apply.reset_mock()
+    style.reapply()
+    style.apply.assert_has_calls(
+        [call("implicit", VALUE3), call("explicit_value", 10)], any_order=True
+    )
+    assert style.apply.call_count == 2
+
+
+@prep_style_class
+class HandlerStyle(Style):
+    @applies("explicit_const")
+    def apply_explicit_const(self, value):
+        self.handled("explicit_const", value)
+
+    @applies("thing_top", "thing-left")
+    def apply_thing(self, value):
+        self.handled("thing", value)
+
+
+@prep_style_class
+class OverriddenHandlerStyle(HandlerStyle):
+    # Overriding a handler without registering it unregisters it.
+    def apply_thing(self, value):
+        raise AssertionError("Shouldn't be called")
+
+    @applies("implicit")
+    def apply_implicit(self, value):
+        self.handled("implicit", value)
+
+
+def test_applies():
+    """Properties with a registered handler are applied with it."""
+    style = HandlerStyle()
+    style.handled = Mock()
+
+    style.explicit_const = VALUE2
+    style.thing_top = 10
+    style.thing_left = 20
+    style.implicit = VALUE3
+
+    style.handled.assert_has_calls(
+        [call("explicit_const", VALUE2), call("thing", 10), call("thing", 20)]
+    )
+    style.apply.assert_called_once_with("implicit", VALUE3)
+
+    # Handlers are also used for batches.
+    style.handled.reset_mock()
+    style.apply.reset_mock()
+    with style.batch():
+        style.explicit_const = VALUE1
+        style.thing_bottom = 10
+
+    style.handled.assert_called_once_with("explicit_const", VALUE1)
+    style.apply.assert_called_once_with("thing_bottom", 10)
+
+
+def test_applies_inherited():
+    """Handlers are inherited, and can be overridden."""
+    style = OverriddenHandlerStyle()
+    style.handled = Mock()
+
+    style.explicit_const = VALUE2
+    style.thing_top = 10
+    style.implicit = VALUE3
+
+    style.handled.assert_has_calls(
+        [call("explicit_const", VALUE2), call("implicit", VALUE3)]
+    )
+    style.apply.assert_called_once_with("thing_top", 10)
+
+    # The parent class is unaffected.
+    assert set(HandlerStyle._APPLY_HANDLERS) == {
+        "explicit_const",
+        "thing_top",
+        "thing_left",
+    }
+
+
+def test_applies_unknown_property():
+    """A handler can't be registered for a property the style doesn't have."""
+    with pytest.raises(NameError, match=r"Unknown style colour registered by"):
+
+        class MisspelledStyle(Style):
+            @applies("explicit_const", "colour")
+            def apply_color(self, value):
+                pass
+
+
+def test_applies_directional_property():
+    """A handler can't be registered for a directional property, only its sides."""
+    with pytest.raises(NameError, match=r"Directional style thing registered by"):
+
+        class DirectionalHandlerStyle(Style):
+            @applies("thing")
+            def apply_thing(self, value):
+                pass
+
+
 @pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
 def test_property_with_explicit_const(StyleClass):
     style = StyleClass()
@@ -328,6 +890,51 @@ def test_set_initial_no_apply(StyleClass):
     style.apply.assert_not_called()
 
 
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_directional_property_cache(StyleClass):
+    """The value of a directional property is cached until one of its sides changes."""
+    style = StyleClass(thing=(1, 2))
+    assert style.thing == (1, 2, 1, 2)
+    assert style.thing is style.thing
+
+    style.thing_left = 5
+    assert style.thing == (1, 2, 1, 5)
+
+    style["thing-bottom"] = 6
+    assert style.thing == (1, 2, 6, 5)
+
+    del style.thing_top
+    assert style.thing == (0, 2, 6, 5)
+
+    style.update(thing_right=7)
+    assert style.thing == (0, 7, 6, 5)
+
+    # Copies don't share the cache.
+    copy = style.copy()
+    copy.thing_right = 8
+    assert copy.thing == (0, 8, 6, 5)
+    assert style.thing == (0, 7, 6, 5)
+
+    del style.thing
+    assert style.thing == (0, 0, 0, 0)
+
+
+def test_directional_property_overridden_side():
+    """A subclass can redefine one of the sides of a directional property."""
+
+    @prep_style_class
+    class SubStyle(Style):
+        thing_top: str | int = validated_property(choices=VALUE_CHOICES, initial=3)
+
+    style = SubStyle()
+    assert style.thing == (3, 0, 0, 0)
+    style.thing_top = 4
+    assert style.thing == (4, 0, 0, 0)
+
+    # The parent class is unaffected.
+    assert Style().thing == (0, 0, 0, 0)
+
+
 @pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
 def test_directional_property(StyleClass):
     style = StyleClass()
@@ -600,6 +1207,51 @@ def test_list_property_list_like():
     assert count == 4
 
 
+def test_immutable_list_value():
+    """ImmutableList is a compact, hashable value type."""
+    value = ImmutableList([1, 2, VALUE2])
+
+    assert value == [1, 2, VALUE2]
+    assert value != [1, 2]
+    assert value != (1, 2, VALUE2)
+    assert hash(value) == hash(ImmutableList([1, 2, VALUE2]))
+    assert {value: "found"}[ImmutableList([1, 2, VALUE2])] == "found"
+    assert not hasattr(value, "__dict__")
+
+    assert VALUE2 in value
+    assert value.index(2) == 1
+    assert list(reversed(value)) == [VALUE2, 2, 1]
+
+
+def test_list_property_reuses_validated_value():
+    """A value validated by the same choices isn't validated again."""
+    style = Style(list_prop=[1, VALUE1])
+    value = style.list_prop
+
+    other = Style()
+    other.list_prop = value
+    assert other.list_prop is value
+
+    # A value validated by other choices, or not validated at all, is validated.
+    class OtherStyle(BaseStyle):
+        list_prop = list_property(choices=Choices(VALUE1, integer=True))
+
+        def apply(self, property, value):
+            pass
+
+    other = OtherStyle()
+    other.list_prop = value
+    assert other.list_prop == value
+    assert other.list_prop is not value
+
+    unvalidated = ImmutableList(["1", VALUE1])
+    other.list_prop = unvalidated
+    assert other.list_prop == [1, VALUE1]
+
+    with pytest.raises(ValueError, match=r"Invalid item value 'value3'"):
+        other.list_prop = ImmutableList([VALUE3])
+
+
 @pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
 def test_set_multiple_properties(StyleClass):
     style = StyleClass()
@@ -642,6 +1294,256 @@ def test_set_multiple_properties(StyleClass):
     style.apply.assert_not_called()
 
 
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_slot_storage(StyleClass):
+    """Only the values of properties that have been set are stored, in slot order."""
+    style = StyleClass()
+    other = StyleClass()
+
+    # Each property has its own slot.
+    slots = {getattr(StyleClass, name).slot for name in StyleClass._PROPERTIES}
+    assert slots == set(range(len(StyleClass._PROPERTIES)))
+
+    # Until a value is set, nothing is stored.
+    assert style._values == ()
+    assert other._values == ()
+
+    style.implicit = VALUE3
+    style.explicit_const = VALUE2
+    assert style._values == (VALUE2, VALUE3)
+    assert style.explicit_const == VALUE2
+    assert style.implicit == VALUE3
+
+    # A changed value keeps its position.
+    style.explicit_const = VALUE3
+    assert style._values == (VALUE3, VALUE3)
+
+    # Other instances are unaffected.
+    assert other.explicit_const == VALUE1
+    assert other._values == ()
+
+    # Deleting a property removes its value.
+    del style.explicit_const
+    assert "explicit_const" not in style
+    assert style.explicit_const == VALUE1
+    assert style._values == (VALUE3,)
+    assert style.implicit == VALUE3
+
+
+def test_slot_storage_subclass():
+    """Subclasses number their slots following on from their parent class."""
+
+    @prep_style_class
+    class ExtendedStyle(Style):
+        extra: str | int = validated_property(choices=VALUE_CHOICES, initial=0)
+
+    style = ExtendedStyle(explicit_const=VALUE2, extra=VALUE3)
+    assert ExtendedStyle.extra.slot == len(Style._SLOTS)
+    assert style.explicit_const == VALUE2
+    assert style.extra == VALUE3
+
+    # The parent class is unaffected.
+    assert "extra" not in Style._SLOTS
+
+
+def test_slot_storage_multiple_inheritance():
+    """A class with several parents gives each of their properties its own slot."""
+
+    class First(BaseStyle):
+        first: int = validated_property(choices=VALUE_CHOICES, initial=0)
+
+    class Second(BaseStyle):
+        second: int = validated_property(choices=VALUE_CHOICES, initial=0)
+
+    @mock_attr("apply")
+    class Combined(First, Second):
+        combined: int = validated_property(choices=VALUE_CHOICES, initial=0)
+
+    assert First.first.slot == Second.second.slot == 0
+    slots = {getattr(Combined, name).slot for name in Combined._PROPERTIES}
+    assert slots == {0, 1, 2}
+
+    style = Combined(first=1, second=2, combined=3)
+    assert (style.first, style.second, style.combined) == (1, 2, 3)
+    assert style.keys() == {"first", "second", "combined"}
+    del style.first
+    assert (style.first, style.second, style.combined) == (0, 2, 3)
+
+    # The parents' properties still use their own slots.
+    assert Second.second.slot == 0
+
+
+def test_slot_storage_property_added_to_parent():
+    """A property added to a parent after a subclass is created gets its own slot."""
+    with catch_warnings():
+        filterwarnings("ignore", category=DeprecationWarning)
+
+        class Parent(BaseStyle):
+            pass
+
+        Parent.validated_property("early", choices=VALUE_CHOICES, initial=0)
+
+        @mock_attr("apply")
+        class Child(Parent):
+            own: int = validated_property(choices=VALUE_CHOICES, initial=0)
+
+        Parent.validated_property("late", choices=VALUE_CHOICES, initial=0)
+
+    assert Parent.late.slot == Child.own.slot
+    assert Child.late.slot not in {Child.early.slot, Child.own.slot}
+    assert "late" in Child._PROPERTIES
+
+    style = Child(own=1, late=2)
+    assert (style.early, style.own, style.late) == (0, 1, 2)
+    assert style == Child(late=2, own=1)
+    assert style != Child(own=1)
+
+
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_set_mask(StyleClass):
+    """The style keeps track of which properties have been set."""
+    style = StyleClass()
+    assert style._set_mask == 0
+    assert len(style) == 0
+
+    style.update(explicit_const=VALUE2, thing_left=10)
+    assert style._set_mask == (
+        1 << StyleClass.explicit_const.slot | 1 << StyleClass.thing_left.slot
+    )
+    assert len(style) == 2
+    assert set(style) == style.keys() == {"explicit_const", "thing_left"}
+
+    # Setting a property to its initial value when it isn't set is a no-op.
+    style.explicit_value = 0
+    assert len(style) == 2
+
+    del style.explicit_const
+    assert style._set_mask == 1 << StyleClass.thing_left.slot
+    assert style.items() == [("thing_left", 10)]
+
+
+@pytest.mark.parametrize(
+    "StyleClass, SubclassStyle",
+    [(Style, StyleSubclass), (DeprecatedStyle, DeprecatedStyleSubclass)],
+)
+def test_subclass_properties(StyleClass, SubclassStyle):
+    """Subclasses inherit the properties of their parent."""
+    assert SubclassStyle._PROPERTIES == StyleClass._PROPERTIES
+    assert SubclassStyle._ALL_PROPERTIES == StyleClass._ALL_PROPERTIES
+
+    style = SubclassStyle(explicit_const=VALUE2)
+    style["thing-top"] = 5
+
+    assert style.keys() == {"explicit_const", "thing_top"}
+    assert "explicit_const" in style
+
+    dup = style.copy()
+    assert dup.explicit_const == VALUE2
+    assert dup.thing_top == 5
+
+
+def test_slot_storage_late_property():
+    """A property added to a class after it has been instantiated can be used."""
+    with catch_warnings():
+        filterwarnings("ignore", category=DeprecationWarning)
+
+        @mock_attr("apply")
+        class LateStyle(BaseStyle):
+            pass
+
+        LateStyle.validated_property("early", choices=VALUE_CHOICES, initial=0)
+        style = LateStyle(early=VALUE1)
+        LateStyle.validated_property("late", choices=VALUE_CHOICES, initial=0)
+
+    assert style.early == VALUE1
+    assert style.late == 0
+    assert "late" not in style
+
+    style.late = VALUE2
+    assert style.late == VALUE2
+    assert "late" in style
+
+
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_batch(StyleClass):
+    style = StyleClass()
+
+    with style.batch():
+        style.explicit_const = VALUE2
+        style.thing = (10, 20)
+        style.explicit_value = 5
+        # A second change to the same property is coalesced
+        style.explicit_const = VALUE3
+        del style.explicit_value
+
+        # Nothing is applied until the batch is complete
+        style.apply.assert_not_called()
+
+        # Nested batches are absorbed into the outer batch
+        with style.batch():
+            style.implicit = VALUE1
+
+        style.apply.assert_not_called()
+
+    # Values are visible immediately
+    assert style.explicit_const == VALUE3
+    assert style.explicit_value == 0
+    assert style.thing == (10, 20, 10, 20)
+
+    assert style.apply.call_args_list == [
+        call("explicit_const", VALUE3),
+        call("thing_top", 10),
+        call("thing_right", 20),
+        call("thing_bottom", 10),
+        call("thing_left", 20),
+        call("explicit_value", 0),
+        call("implicit", VALUE1),
+    ]
+
+    # Once the batch is complete, changes are applied immediately again.
+    style.apply.reset_mock()
+    style.explicit_const = VALUE1
+    style.apply.assert_called_once_with("explicit_const", VALUE1)
+
+
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_batch_exception(StyleClass):
+    """Changes made before an exception in a batch are still applied."""
+    style = StyleClass()
+
+    with pytest.raises(ValueError):
+        with style.batch():
+            style.explicit_const = VALUE2
+            style.explicit_value = "invalid"
+
+    assert style.explicit_const == VALUE2
+    style.apply.assert_called_once_with("explicit_const", VALUE2)
+
+
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_batch_update(StyleClass):
+    style = StyleClass()
+    style.apply_many = Mock()
+
+    style.update(explicit_const=VALUE2, thing=5, batch=True)
+
+    style.apply_many.assert_called_once_with(
+        {
+            "explicit_const": VALUE2,
+            "thing_top": 5,
+            "thing_right": 5,
+            "thing_bottom": 5,
+            "thing_left": 5,
+        }
+    )
+    style.apply.assert_not_called()
+
+    # An empty batch doesn't apply anything
+    style.apply_many.reset_mock()
+    style.update(batch=True)
+    style.apply_many.assert_not_called()
+
+
 @pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
 def test_str(StyleClass):
     style = StyleClass()
@@ -701,6 +1603,11 @@ def test_dict(StyleClass):
 
     # Directional properties with one or more of the aliased properties set also count.
     assert "thing" in style
+    del style.thing
+    assert "thing" not in style
+    style.thing_left = 5
+    assert "thing" in style
+    del style.thing_left
 
     # Valid properties that haven't been set are not in the keys.
     assert "implicit" not in style
@@ -742,6 +1649,45 @@ def test_dict(StyleClass):
         del style["no-such-property"]
 
 
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_aliases(StyleClass):
+    """Every spelling of a property name maps directly to its descriptor."""
+    assert StyleClass._ALIASES["explicit_const"] is StyleClass.explicit_const
+    assert StyleClass._ALIASES["explicit-const"] is StyleClass.explicit_const
+    assert StyleClass._ALIASES["thing"] is StyleClass.thing
+    assert StyleClass._ALIASES["thing-top"] is StyleClass.thing_top
+
+    assert set(StyleClass._ALIASES) == StyleClass._ALL_PROPERTIES | {
+        name.replace("_", "-") for name in StyleClass._ALL_PROPERTIES
+    }
+
+
+def test_mixed_spelling():
+    """Names that mix hyphens and underscores are still accepted."""
+
+    @prep_style_class
+    class LongNameStyle(BaseStyle):
+        long_property_name: str | int = validated_property(
+            choices=VALUE_CHOICES, initial=0
+        )
+
+    style = LongNameStyle()
+
+    style["long-property_name"] = 10
+    assert style["long_property-name"] == 10
+    del style["long-property_name"]
+    assert style.long_property_name == 0
+
+    style.update(**{"long_property-name": VALUE2})
+    assert style.long_property_name == VALUE2
+
+    with pytest.raises(KeyError, match=r"long_property_nom"):
+        style["long-property_nom"]
+
+    with pytest.raises(NameError, match=r"Unknown style long_property_nom"):
+        style.update(**{"long-property_nom": VALUE2})
+
+
 @pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
 @pytest.mark.parametrize("instantiate", [True, False])
 def test_union_operators(StyleClass, instantiate):
@@ -0,0 +1,111 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import travertino
+
+# The most time that importing each module may take, including everything it
+# imports, as a multiple of the time taken to import a baseline module from the
+# standard library in the same process. These are deliberately generous, so that
+# noise won't fail them, but they're well below the time it would take if the
+# package were to eagerly import the version machinery or its submodules again.
+BASELINE = "json"
+IMPORT_BUDGETS = {
+    "travertino": 0.5,
+    "travertino.declaration": 2,
+}
+
+
+def run_python(code, *options, env=None):
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def import_times(modules, cache):
+    """The cumulative time, in microseconds, taken to import each module in turn, in
+    a single process, with compiled bytecode cached in a directory."""
+    # Compiling the modules would otherwise take longer than importing them.
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": str(cache)}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = run_python(
+        "; ".join(f"import {module}" for module in modules),
+        "-X",
+        "importtime",
+        env=env,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # Each line is "import time: <self> | <cumulative> | <indented name>"
+        _, cumulative, name = line.rsplit("|", 2)
+        if name.strip() in modules:
+            times[name.strip()] = int(cumulative)
+    for module in modules:
+        if module not in times:
+            raise AssertionError(f"{module} wasn't imported")
+    return [times[module] for module in modules]
+
+
+@pytest.mark.parametrize("module, budget", IMPORT_BUDGETS.items())
+def test_import_time(module, budget, tmp_path):
+    # The first run fills the bytecode cache. After that, the best of a few runs is
+    # used, so that a single slow one doesn't fail the test.
+    import_times([BASELINE, module], tmp_path)
+    ratios = []
+    for _ in range(3):
+        baseline, elapsed = import_times([BASELINE, module], tmp_path)
+        ratios.append(elapsed / baseline)
+    assert min(ratios) < budget
+
+
+def test_import_is_lazy():
+    "Importing the package doesn't import its submodules or its version."
+    result = run_python(
+        "import sys, travertino; "
+        "print(sorted(name for name in sys.modules if name.startswith('travertino')));"
+        "print('setuptools_scm' in sys.modules, 'importlib.metadata' in sys.modules)"
+    )
+    assert result.stdout.splitlines() == ["['travertino']", "False False"]
+
+
+def test_named_colors_are_lazy():
+    "The named color table isn't built until it's needed."
+    result = run_python(
+        "from travertino import colors; "
+        "print('NAMED_COLOR' in vars(colors)); "
+        "colors.color('red'); "
+        "print('NAMED_COLOR' in vars(colors))"
+    )
+    assert result.stdout.splitlines() == ["False", "True"]
+
+
+def test_submodules():
+    "Submodules can be used as attributes of the package."
+    from travertino import colors, stylesheet
+
+    assert travertino.colors is colors
+    assert travertino.stylesheet is stylesheet
+    assert "stylesheet" in dir(travertino)
+
+
+def test_version():
+    "The version can be read from the package."
+    assert isinstance(travertino.__version__, str)
+    assert "__version__" in dir(travertino)
+
+
+def test_unknown_attribute():
+    "Accessing an attribute that doesn't exist raises an error."
+    with pytest.raises(AttributeError, match=r"has no attribute 'unknown'"):
+        travertino.unknown
+
+    from travertino import colors
+
+    with pytest.raises(AttributeError, match=r"has no attribute 'unknown'"):
+        colors.unknown
@@ -1,6 +1,7 @@
 import pytest
 
-from travertino.declaration import BaseStyle
+from travertino.constants import NONE
+from travertino.declaration import BaseStyle, Choices, validated_property
 from travertino.layout import BaseBox, Viewport
 from travertino.node import Node
 from travertino.size import BaseIntrinsicSize
@@ -13,6 +14,26 @@ class Style(BaseStyle):
     class Box(BaseBox):
         pass
 
+    def layout_subtree(self, viewport):
+        pass
+
+
+class SizedStyle(BaseStyle):
+    width: int = validated_property(Choices(NONE, integer=True), initial=NONE)
+    height: int = validated_property(Choices(NONE, integer=True), initial=NONE)
+
+    class IntrinsicSize(BaseIntrinsicSize):
+        pass
+
+    class Box(BaseBox):
+        pass
+
+    def apply(self, property, value):
+        pass
+
+    def layout_subtree(self, viewport):
+        pass
+
 
 def test_viewport_default():
     viewport = Viewport()
@@ -405,3 +426,135 @@ def test_absolute_equalities(box):
         layout.content_top + layout.content_height + layout.content_bottom
         == layout.height
     )
+
+
+def clean(*nodes):
+    for node in nodes:
+        layout = node.layout
+        layout._dirty = layout._dirty_descendants = layout._dirty_boundaries = False
+
+
+def test_new_box_is_dirty(box):
+    # A box that has never been laid out needs layout.
+    assert box.node.layout.needs_layout
+    assert box.grandchild1_1.layout._dirty
+
+
+def test_dirty(box):
+    nodes = [box.node, box.child1, box.child2, box.grandchild1_1, box.grandchild1_2]
+    clean(*nodes)
+    assert not any(node.layout.needs_layout for node in nodes)
+
+    box.grandchild1_1.layout.dirty(intrinsic_width=10)
+
+    # The box is dirty, and its ancestors are flagged as containing a dirty box.
+    assert box.grandchild1_1.layout._dirty
+    assert box.grandchild1_1.layout.needs_layout
+    for node in [box.child1, box.node]:
+        assert not node.layout._dirty
+        assert node.layout._dirty_descendants
+        assert node.layout.needs_layout
+
+    # Other boxes are untouched.
+    for node in [box.child2, box.grandchild1_2]:
+        assert not node.layout.needs_layout
+
+
+def test_dirty_stops_at_flagged_ancestor(box):
+    clean(box.node, box.child1, box.grandchild1_1, box.grandchild1_2)
+
+    # The ancestors of a flagged box are normally flagged too, so propagation stops
+    # at the first flagged ancestor. Break that rule to show that it does.
+    box.child1.layout._dirty_descendants = True
+    box.grandchild1_2.layout.dirty()
+
+    assert box.grandchild1_2.layout._dirty
+    assert not box.node.layout._dirty_descendants
+
+
+def test_intrinsic_size_dirties_layout(box):
+    assert box.child1.intrinsic._layout is box.child1.layout
+    clean(box.node, box.child1)
+
+    box.child1.intrinsic.width = 42
+    assert box.child1.layout._dirty
+    assert box.node.layout._dirty_descendants
+
+
+@pytest.mark.parametrize(
+    "styles, expected",
+    [
+        ({}, False),
+        ({"width": 10}, False),
+        ({"height": 10}, False),
+        ({"width": 10, "height": 20}, True),
+        ({"width": NONE, "height": 20}, False),
+    ],
+)
+def test_relayout_boundary_from_style(styles, expected):
+    node = Node(style=SizedStyle(**styles))
+    assert node.layout.is_relayout_boundary is expected
+
+
+def test_relayout_boundary_declared(box):
+    # A style without width and height properties isn't a boundary, unless the
+    # node says it is.
+    assert not box.child1.layout.is_relayout_boundary
+    box.child1.relayout_boundary = True
+    assert box.child1.layout.is_relayout_boundary
+
+
+def test_relayout_boundary_unsupported():
+    # A style that can't lay out part of a tree can't have boundaries.
+    class WholeTreeStyle(SizedStyle):
+        layout_subtree = BaseStyle.layout_subtree
+
+    node = Node(style=WholeTreeStyle(width=10, height=20))
+    node.relayout_boundary = True
+    assert not node.layout.is_relayout_boundary
+
+
+def test_dirty_stops_at_boundary(box):
+    nodes = [box.node, box.child1, box.child2, box.grandchild1_1, box.grandchild1_2]
+    clean(*nodes)
+    box.child1.relayout_boundary = True
+
+    box.grandchild1_1.layout.dirty()
+
+    # The boundary is flagged as containing a box that needs layout; its ancestors
+    # are only flagged as containing a boundary that does.
+    assert box.child1.layout._dirty_descendants
+    assert not box.child1.layout._dirty
+    assert not box.node.layout._dirty_descendants
+    assert box.node.layout._dirty_boundaries
+    assert box.node.layout.needs_layout
+
+    # A change to the boundary itself goes past it.
+    clean(*nodes)
+    box.child1.layout.dirty()
+    assert box.node.layout._dirty_descendants
+    assert not box.node.layout._dirty_boundaries
+
+
+def test_attach_flags_ancestors(box):
+    clean(box.node, box.child1, box.child2)
+    box.child2.relayout_boundary = True
+
+    # Attaching a subtree containing a boundary that needs layout flags the new
+    # ancestors.
+    inner = Node(style=Style())
+    boundary = Node(style=Style(), children=[inner])
+    boundary.relayout_boundary = True
+    outer = Node(style=Style(), children=[boundary])
+    clean(outer, boundary, inner)
+    inner.layout.dirty()
+    assert outer.layout._dirty_boundaries
+    assert not outer.layout._dirty_descendants
+
+    # The attached subtree needs to be laid out in its new place, so the new
+    # ancestors are flagged as containing a box that needs layout, as far as the
+    # nearest boundary.
+    box.child2.add(outer)
+    assert outer.layout._dirty
+    assert box.child2.layout._dirty_descendants
+    assert box.node.layout.needs_layout
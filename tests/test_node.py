@@ -1,9 +1,11 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 from warnings import catch_warnings, filterwarnings
 
 import pytest
 
 from tests.utils import mock_attr, prep_style_class
+from travertino import node as node_module
+from travertino.constants import NONE
 from travertino.declaration import BaseStyle, Choices, validated_property
 from travertino.layout import BaseBox, Viewport
 from travertino.node import Node
@@ -66,6 +68,60 @@ class BrokenStyle(BaseStyle):
         self._applicator.node.layout.content_height = viewport.height * 2
 
 
+@prep_style_class
+class DiffStyle(BaseStyle):
+    int_prop: int = validated_property(Choices(integer=True), initial=0)
+    other_prop: int = validated_property(Choices(integer=True), initial=0)
+    extra_prop: int = validated_property(Choices(integer=True), initial=0)
+    str_prop: str = validated_property(Choices(string=True), initial="")
+
+    class IntrinsicSize(BaseIntrinsicSize):
+        pass
+
+    class Box(BaseBox):
+        pass
+
+
+class NotReadyStyle(BaseStyle):
+    int_prop: int = validated_property(Choices(integer=True), initial=0)
+
+    class IntrinsicSize(BaseIntrinsicSize):
+        pass
+
+    class Box(BaseBox):
+        pass
+
+    def apply(self, property, value):
+        if self._applicator:
+            raise AttributeError(
+                "Missing attribute, node not ready for style application"
+            )
+
+
+@prep_style_class
+class InheritStyle(BaseStyle):
+    color: str = validated_property(
+        Choices(string=True), initial="black", inherited=True
+    )
+    size: int = validated_property(Choices(integer=True), initial=0)
+
+    class IntrinsicSize(BaseIntrinsicSize):
+        pass
+
+    class Box(BaseBox):
+        pass
+
+
+class TreeStyle(BaseStyle):
+    """A style without mocks, for building large trees quickly."""
+
+    class IntrinsicSize(BaseIntrinsicSize):
+        pass
+
+    class Box(BaseBox):
+        pass
+
+
 class AttributeTestStyle(BaseStyle):
     class IntrinsicSize(BaseIntrinsicSize):
         pass
@@ -207,6 +263,326 @@ def test_refresh(StyleClass):
     assert child3.applicator.tasks == []
 
 
+class LayoutStyle(BaseStyle):
+    size: int = validated_property(Choices(integer=True), initial=0)
+    width: int = validated_property(Choices(NONE, integer=True), initial=NONE)
+    height: int = validated_property(Choices(NONE, integer=True), initial=NONE)
+    color: str = validated_property(
+        Choices(string=True), initial="black", affects_layout=False
+    )
+
+    class IntrinsicSize(BaseIntrinsicSize):
+        pass
+
+    class Box(BaseBox):
+        pass
+
+    def apply(self, property, value):
+        pass
+
+    def layout(self, viewport):
+        self._applicator.node.laid_out.append((viewport.width, viewport.height))
+
+    def layout_subtree(self, viewport):
+        self._applicator.node.laid_out.append(
+            ("subtree", viewport.width, viewport.height)
+        )
+
+
+class CountingApplicator:
+    def __init__(self):
+        self.node = None
+        self.bounds_set = 0
+
+    def set_bounds(self):
+        self.bounds_set += 1
+
+
+def make_layout_tree():
+    """A root with two children, the first of which has a child of its own."""
+    grandchild = Node(style=LayoutStyle(), applicator=CountingApplicator())
+    child1 = Node(
+        style=LayoutStyle(size=1),
+        applicator=CountingApplicator(),
+        children=[grandchild],
+    )
+    child2 = Node(style=LayoutStyle(), applicator=CountingApplicator())
+    root = Node(
+        style=LayoutStyle(),
+        applicator=CountingApplicator(),
+        children=[child1, child2],
+    )
+    for node in [root, child1, child2, grandchild]:
+        node.laid_out = []
+    return root, child1, child2, grandchild
+
+
+def refreshed(root, viewport):
+    """Refresh a tree, and report whether it was laid out."""
+    before = len(root.laid_out)
+    root.refresh(viewport)
+    return len(root.laid_out) > before
+
+
+def test_refresh_only_when_dirty():
+    """A tree is only laid out again if something has changed"""
+    root, child1, child2, grandchild = make_layout_tree()
+    viewport = Viewport(width=100, height=200)
+
+    # A new tree needs to be laid out.
+    assert refreshed(root, viewport)
+    assert root.applicator.bounds_set == 1
+
+    # Afterwards, nothing needs layout.
+    for node in [root, child1, child2, grandchild]:
+        assert not node.layout.needs_layout
+
+    # Nothing has changed, so the tree isn't laid out again.
+    assert not refreshed(root, viewport)
+    grandchild.refresh(Viewport(width=100, height=200))
+    assert root.laid_out == [(100, 200)]
+    assert root.applicator.bounds_set == 1
+
+    # A change to the viewport's size means it is.
+    assert refreshed(root, Viewport(width=100, height=300))
+    assert not refreshed(root, Viewport(width=100, height=300))
+    assert refreshed(root, Viewport(width=100, height=300, dpi=96))
+    assert root.laid_out == [(100, 200), (100, 300), (100, 300)]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda nodes: setattr(nodes[3].intrinsic, "width", 10),
+        lambda nodes: setattr(nodes[3].intrinsic, "height", 10),
+        lambda nodes: setattr(nodes[3].intrinsic, "ratio", 0.5),
+        lambda nodes: setattr(nodes[3].style, "size", 10),
+        lambda nodes: delattr(nodes[1].style, "size"),
+        lambda nodes: nodes[1].add(Node(style=LayoutStyle())),
+        lambda nodes: nodes[1].remove(nodes[3]),
+        lambda nodes: nodes[0].move(nodes[2], 0),
+        lambda nodes: nodes[0].replace_children([nodes[2], nodes[1]]),
+        lambda nodes: setattr(nodes[3], "style", LayoutStyle(size=5)),
+        lambda nodes: setattr(nodes[3], "applicator", CountingApplicator()),
+    ],
+)
+def test_refresh_after_change(change):
+    """Changes that affect geometry mean the tree is laid out again"""
+    nodes = make_layout_tree()
+    root = nodes[0]
+    viewport = Viewport(width=100, height=200)
+    assert refreshed(root, viewport)
+
+    # Setting the size to its current value isn't a change.
+    nodes[1].style.size = 1
+    assert not refreshed(root, viewport)
+
+    change(nodes)
+    assert root.layout.needs_layout
+    assert refreshed(root, viewport)
+    assert not any(node.layout.needs_layout for node in root.walk_preorder())
+
+
+def test_refresh_after_reparenting():
+    """A node that has been moved out of a tree is laid out again as a root"""
+    root, child1, child2, grandchild = make_layout_tree()
+    node = Node(style=LayoutStyle(), applicator=CountingApplicator())
+    node.laid_out = []
+    viewport = Viewport(width=100, height=200)
+    assert refreshed(node, viewport)
+
+    root.add(node)
+    assert node.layout.needs_layout
+    assert refreshed(root, viewport)
+    assert not node.layout.needs_layout
+
+    # The viewport is the same size as when the node was last laid out as a root,
+    # but it has been laid out as part of another tree since then.
+    root.remove(node)
+    bounds_set = node.applicator.bounds_set
+    assert refreshed(node, viewport)
+    assert node.laid_out == [(100, 200), (100, 200)]
+    assert node.applicator.bounds_set == bounds_set + 1
+
+
+def test_refresh_after_appearance_change():
+    """Changes that don't affect geometry don't need the tree to be laid out"""
+    root, child1, child2, grandchild = make_layout_tree()
+    viewport = Viewport(width=100, height=200)
+    assert refreshed(root, viewport)
+
+    grandchild.style.color = "red"
+    del grandchild.style.color
+    assert not root.layout.needs_layout
+    assert not refreshed(root, viewport)
+
+
+def test_refresh_leaves_clean_boxes():
+    """Refreshing only touches the dirty parts of the tree"""
+    root, child1, child2, grandchild = make_layout_tree()
+    viewport = Viewport(width=100, height=200)
+    assert refreshed(root, viewport)
+
+    child2.layout.dirty()
+    assert root.layout._dirty_descendants
+    assert not child1.layout.needs_layout
+
+    # Clearing the dirty flags after layout doesn't visit clean subtrees; this would
+    # be reset if it were.
+    grandchild.layout._dirty_descendants = "untouched"
+
+    assert refreshed(root, viewport)
+    assert not root.layout.needs_layout
+    assert not child2.layout.needs_layout
+    assert grandchild.layout._dirty_descendants == "untouched"
+
+
+def test_refresh_from_boundary():
+    """A change inside a relayout boundary only lays out the boundary"""
+    root, child1, child2, grandchild = make_layout_tree()
+    child1.relayout_boundary = True
+    viewport = Viewport(width=100, height=200)
+    root.refresh(viewport)
+    assert root.laid_out == [(100, 200)]
+    root.applicator.bounds_set = 0
+
+    child1.layout.content_width = 30
+    child1.layout.content_height = 40
+    child1.layout.content_left = 5
+    grandchild.intrinsic.width = 10
+
+    # The boundary is flagged, but its ancestors only know there's a boundary below
+    # them that needs layout.
+    assert child1.layout._dirty_descendants
+    assert not root.layout._dirty_descendants
+    assert root.layout._dirty_boundaries
+    assert root.layout.needs_layout
+
+    # The contents of the boundary are laid out, in the space inside its content box,
+    # and its applicator sets the bounds of its contents.
+    root.refresh(viewport)
+    assert root.laid_out == [(100, 200)]
+    assert child1.laid_out == [("subtree", 30, 40)]
+    assert child1.applicator.bounds_set == 1
+    assert root.applicator.bounds_set == 0
+    for node in [root, child1, child2, grandchild]:
+        assert not node.layout.needs_layout
+
+    # A change outside the boundary lays out the whole tree.
+    child2.intrinsic.width = 10
+    root.refresh(viewport)
+    assert root.laid_out == [(100, 200), (100, 200)]
+    assert child1.laid_out == [("subtree", 30, 40)]
+
+    # A change to the boundary itself affects its parent, so the whole tree is laid
+    # out again.
+    child1.style.size = 5
+    root.refresh(viewport)
+    assert len(root.laid_out) == 3
+    assert child1.laid_out == [("subtree", 30, 40)]
+
+    # So does a change to the size of the viewport, even if the only change is
+    # inside the boundary.
+    grandchild.intrinsic.width = 20
+    root.refresh(Viewport(width=100, height=300))
+    assert len(root.laid_out) == 4
+    assert child1.laid_out == [("subtree", 30, 40)]
+
+
+def test_refresh_several_boundaries():
+    """Each boundary with changes inside it is laid out"""
+    style = LayoutStyle(width=10, height=20)
+    tiles = [
+        Node(
+            style=style,
+            applicator=CountingApplicator(),
+            children=[Node(style=LayoutStyle())],
+        )
+        for _ in range(4)
+    ]
+    root = Node(style=LayoutStyle(), applicator=CountingApplicator(), children=tiles)
+    for node in [root, *tiles]:
+        node.laid_out = []
+
+    viewport = Viewport(width=100, height=200)
+    root.refresh(viewport)
+    assert root.laid_out == [(100, 200)]
+
+    for tile in tiles[1:3]:
+        tile.layout.content_width = 10
+        tile.layout.content_height = 20
+        tile.children[0].intrinsic.height = 5
+    root.refresh(viewport)
+
+    assert root.laid_out == [(100, 200)]
+    assert [tile.laid_out for tile in tiles] == [
+        [],
+        [("subtree", 10, 20)],
+        [("subtree", 10, 20)],
+        [],
+    ]
+
+
+def test_refresh_boundary_unsupported():
+    """If the style can't lay out part of a tree, the whole tree is laid out"""
+
+    class WholeTreeStyle(LayoutStyle):
+        layout_subtree = BaseStyle.layout_subtree
+
+    grandchild = Node(style=WholeTreeStyle(), applicator=CountingApplicator())
+    child = Node(
+        style=WholeTreeStyle(width=10, height=20),
+        applicator=CountingApplicator(),
+        children=[grandchild],
+    )
+    child.relayout_boundary = True
+    root = Node(
+        style=WholeTreeStyle(), applicator=CountingApplicator(), children=[child]
+    )
+    for node in [root, child, grandchild]:
+        node.laid_out = []
+    viewport = Viewport(width=100, height=200)
+    root.refresh(viewport)
+
+    assert not child.layout.is_relayout_boundary
+    grandchild.intrinsic.width = 10
+    assert root.layout._dirty_descendants
+    root.refresh(viewport)
+    assert root.laid_out == [(100, 200), (100, 200)]
+    assert child.laid_out == []
+
+
+def test_refresh_former_boundary():
+    """If a boundary stops being one, the tree around it is laid out"""
+    root, child1, child2, grandchild = make_layout_tree()
+    child1.relayout_boundary = True
+    viewport = Viewport(width=100, height=200)
+    root.refresh(viewport)
+
+    grandchild.intrinsic.width = 10
+    child1.relayout_boundary = False
+    root.refresh(viewport)
+    assert root.laid_out == [(100, 200), (100, 200)]
+    assert child1.laid_out == []
+    assert not root.layout.needs_layout
+
+
+def test_refresh_boundary_without_applicator():
+    """A boundary without an applicator is laid out as part of the tree around it"""
+    root, child1, child2, grandchild = make_layout_tree()
+    child1.relayout_boundary = True
+    child1.applicator = None
+    viewport = Viewport(width=100, height=200)
+    root.refresh(viewport)
+
+    grandchild.intrinsic.width = 10
+    assert not root.layout._dirty_descendants
+    root.refresh(viewport)
+    assert root.laid_out == [(100, 200), (100, 200)]
+    assert child1.laid_out == []
+    assert not root.layout.needs_layout
+
+
 @pytest.mark.parametrize("StyleClass", [TypeErrorStyle, OldTypeErrorStyle])
 def test_type_error_in_layout(StyleClass):
     """The shim shouldn't hide unrelated TypeErrors."""
@@ -293,6 +669,456 @@ def test_clear():
     assert node.children == []
 
 
+def test_extend():
+    """Several nodes can be added as children at once"""
+    style = Style()
+    child1 = Node(style=style)
+    node = Node(style=style, children=[child1])
+
+    child2 = Node(style=style)
+    child3 = Node(style=style)
+    generation = node_module._generation
+    node.extend(iter([child2, child3]))
+
+    # The children are re-parented as a single batch.
+    assert node_module._generation == generation + 1
+    assert node.children == [child1, child2, child3]
+    for child in node.children:
+        assert child.parent is node
+        assert child.root is node
+
+
+def test_extend_leaf():
+    """A leaf can't be extended"""
+    style = Style()
+    leaf = Node(style=style)
+
+    with pytest.raises(ValueError, match=r"Cannot add children"):
+        leaf.extend([Node(style=style)])
+
+
+def test_replace_children():
+    """The children of a node can be replaced"""
+    style = Style()
+    child1 = Node(style=style)
+    child2 = Node(style=style)
+    child3 = Node(style=style)
+    node = Node(style=style, children=[child1, child2, child3])
+
+    child4 = Node(style=style)
+    generation = node_module._generation
+    node.replace_children([child3, child4, child1])
+
+    # Removing and adding children each takes a single batch.
+    assert node_module._generation == generation + 2
+    assert node.children == [child3, child4, child1]
+    for child in node.children:
+        assert child.parent is node
+        assert child.root is node
+
+    assert child2.parent is None
+    assert child2.root is child2
+
+    # Reordering the existing children doesn't re-parent any of them.
+    generation = node_module._generation
+    node.replace_children([child1, child3, child4])
+    assert node_module._generation == generation
+    assert node.children == [child1, child3, child4]
+
+    # Replacing the children with nothing removes them all.
+    node.replace_children([])
+    assert node.children == []
+    for child in [child1, child3, child4]:
+        assert child.parent is None
+        assert child.root is child
+
+
+def test_replace_children_invalid():
+    """If the new children aren't all nodes, nothing is changed."""
+    style = Style()
+    child1 = Node(style=style)
+    child2 = Node(style=style)
+    node = Node(style=style, children=[child1, child2])
+
+    with pytest.raises(TypeError, match=r"'oops' is not a node"):
+        node.replace_children([child2, "oops"])
+
+    assert node.children == [child1, child2]
+    for child in node.children:
+        assert child.parent is node
+        assert child.root is node
+
+
+def test_replace_children_duplicates():
+    """A node that appears more than once among the new children is added once."""
+    style = Style()
+    child1 = Node(style=style)
+    child2 = Node(style=style)
+    node = Node(style=style, children=[child1])
+
+    generation = node_module._generation
+    node.replace_children([child2, child2])
+
+    # The removal of child1 and the addition of child2 each take a single batch.
+    assert node_module._generation == generation + 2
+    assert child1.parent is None
+    assert child2.parent is node
+
+
+def test_replace_children_leaf():
+    """The children of a leaf can't be replaced"""
+    style = Style()
+    leaf = Node(style=style)
+
+    with pytest.raises(ValueError, match=r"Cannot replace children"):
+        leaf.replace_children([Node(style=style)])
+
+
+def test_replace_children_computed_style():
+    """Only the computed values of re-parented children are invalidated"""
+    kept = Node(style=InheritStyle())
+    removed = Node(style=InheritStyle())
+    added = Node(style=InheritStyle())
+    node = Node(style=InheritStyle(color="red"), children=[kept, removed])
+
+    assert kept.computed_style.color == "red"
+    assert removed.computed_style.color == "red"
+    assert added.computed_style.color == "black"
+
+    node.replace_children([kept, added])
+
+    assert kept._computed == {"color": "red"}
+    assert removed._computed == {}
+    assert added._computed == {}
+    assert removed.computed_style.color == "black"
+    assert added.computed_style.color == "red"
+
+
+def test_move():
+    """A child can be moved to a different position"""
+    style = Style()
+    child1 = Node(style=style)
+    child2 = Node(style=style)
+    child3 = Node(style=style)
+    node = Node(style=style, children=[child1, child2, child3])
+
+    generation = node_module._generation
+    node.move(child1, 2)
+    assert node.children == [child2, child3, child1]
+
+    node.move(child1, 0)
+    assert node.children == [child1, child2, child3]
+
+    node.move(child3, -1)
+    assert node.children == [child1, child3, child2]
+
+    # Moving a child doesn't re-parent it.
+    assert node_module._generation == generation
+    assert child1.parent is node
+    assert child1.root is node
+
+    # Only a child can be moved.
+    with pytest.raises(ValueError):
+        node.move(Node(style=style), 0)
+
+
+def test_move_leaf():
+    """Nothing can be moved in a leaf"""
+    style = Style()
+    leaf = Node(style=style)
+
+    with pytest.raises(ValueError, match=r"Cannot move children"):
+        leaf.move(Node(style=style), 0)
+
+
+@pytest.mark.parametrize("threshold", [4, 1000])
+def test_index_of(monkeypatch, threshold):
+    """The position of a child can be found, with or without an index"""
+    monkeypatch.setattr(node_module, "_INDEX_THRESHOLD", threshold)
+    style = TreeStyle()
+    children = [Node(style=style) for _ in range(10)]
+    node = Node(style=style, children=children)
+
+    for index, child in enumerate(children):
+        assert node.index_of(child) == index
+
+    # A node that isn't a child can't be found.
+    other = Node(style=style)
+    with pytest.raises(ValueError, match=r"is not a child of"):
+        node.index_of(other)
+    with pytest.raises(ValueError, match=r"is not a child of"):
+        node.remove(other)
+
+    # Nothing can be found in a leaf, or a node without children.
+    with pytest.raises(ValueError, match=r"is not a child of"):
+        other.index_of(children[0])
+    with pytest.raises(ValueError, match=r"is not a child of"):
+        Node(style=style, children=[]).index_of(children[0])
+
+
+@pytest.mark.parametrize("threshold", [4, 1000])
+def test_index_follows_changes(monkeypatch, threshold):
+    """Positions are correct after the children are changed in any way"""
+    monkeypatch.setattr(node_module, "_INDEX_THRESHOLD", threshold)
+    style = TreeStyle()
+    children = [Node(style=style) for _ in range(40)]
+    node = Node(style=style, children=children)
+    expected = list(children)
+
+    def check():
+        assert node.children == expected
+        for index, child in enumerate(expected):
+            assert node.index_of(child) == index
+
+    check()
+
+    # Removing from anywhere.
+    for child in [expected[5], expected[0], expected[-1], expected[17]]:
+        node.remove(child)
+        expected.remove(child)
+        check()
+
+    # Adding at either end, and in the middle.
+    for index in [0, len(expected), -1, 100, -100, 7]:
+        child = Node(style=style)
+        node.insert(index, child)
+        expected.insert(index, child)
+        check()
+
+    child = Node(style=style)
+    node.add(child)
+    expected.append(child)
+    check()
+
+    # Moving.
+    for child, index in [(expected[3], 0), (expected[0], -1), (expected[9], 20)]:
+        node.move(child, index)
+        expected.remove(child)
+        expected.insert(index, child)
+        check()
+
+    # Bulk changes.
+    more = [Node(style=style) for _ in range(5)]
+    node.extend(more)
+    expected.extend(more)
+    check()
+
+    expected = expected[::2]
+    node.replace_children(expected)
+    check()
+
+    # Changes made directly to the list of children are noticed.
+    node.children.reverse()
+    expected.reverse()
+    check()
+
+
+def test_index_ends(monkeypatch):
+    """Adding children at the ends doesn't rebuild the index until it's full"""
+    monkeypatch.setattr(node_module, "_INDEX_THRESHOLD", 4)
+    style = TreeStyle()
+    node = Node(style=style, children=[Node(style=style) for _ in range(10)])
+    node.index_of(node.children[5])
+    index = node._index
+
+    for _ in range(21):
+        node.insert(0, Node(style=style))
+        node.add(Node(style=style))
+    assert node._index is index
+    assert node.index_of(node.children[30]) == 30
+
+    # When there's no more room at an end, the index is rebuilt.
+    node.insert(0, Node(style=style))
+    assert node._index is None
+    node.add(Node(style=style))
+    assert node.index_of(node.children[30]) == 30
+    assert node._index is not index
+
+
+def test_remove_wide():
+    """Children of a very wide node can be removed in any order"""
+    style = TreeStyle()
+    children = [Node(style=style) for _ in range(20_000)]
+    node = Node(style=style, children=children)
+
+    # Remove every other child, from the middle outwards.
+    middle = len(children) // 2
+    after = middle + 2
+    removed = children[middle::-2] + children[after::2]
+    for child in removed:
+        node.remove(child)
+        assert child.parent is None
+
+    assert node.children == children[1::2]
+    assert node.index_of(children[-1]) == len(children) // 2 - 1
+
+
+def make_tree():
+    """Create a small tree, with named nodes:
+
+    a
+    ├── b
+    │   ├── d
+    │   └── e
+    │       └── h
+    └── c
+        ├── f
+        └── g
+    """
+    style = TreeStyle()
+    nodes = {name: Node(style=style) for name in "dfgh"}
+    nodes["e"] = Node(style=style, children=[nodes["h"]])
+    nodes["b"] = Node(style=style, children=[nodes["d"], nodes["e"]])
+    nodes["c"] = Node(style=style, children=[nodes["f"], nodes["g"]])
+    nodes["a"] = Node(style=style, children=[nodes["b"], nodes["c"]])
+    for name, node in nodes.items():
+        node.name = name
+    return nodes
+
+
+def names(nodes):
+    return "".join(node.name for node in nodes)
+
+
+@pytest.mark.parametrize(
+    "method, expected, pruned",
+    [
+        ("walk_preorder", "abdehcfg", "abdecfg"),
+        ("walk_postorder", "dhebfgca", "debfgca"),
+        ("walk_breadth_first", "abcdefgh", "abcdefg"),
+    ],
+)
+def test_walk(method, expected, pruned):
+    """A tree can be walked in various orders, optionally pruning subtrees"""
+    nodes = make_tree()
+    assert names(getattr(nodes["a"], method)()) == expected
+
+    # Nodes that are pruned are produced, but their descendants aren't.
+    prune = lambda node: node.name == "e"  # noqa: E731
+    assert names(getattr(nodes["a"], method)(prune=prune)) == pruned
+
+    # Only nodes with children are passed to the prune callable.
+    passed = []
+    list(getattr(nodes["a"], method)(prune=passed.append))
+    assert sorted(names(passed)) == list("abce")
+
+    # Pruning the starting node only produces that node.
+    assert names(getattr(nodes["a"], method)(prune=lambda node: True)) == "a"
+
+    # A walk can start anywhere in the tree.
+    assert names(getattr(nodes["b"], method)()) == "".join(
+        name for name in expected if name in "bdeh"
+    )
+
+    # Walking a leaf, or a node with no children, only produces that node.
+    assert names(getattr(nodes["h"], method)()) == "h"
+    empty = Node(style=TreeStyle(), children=[])
+    assert list(getattr(empty, method)()) == [empty]
+
+
+@pytest.mark.parametrize(
+    "method", ["walk_preorder", "walk_postorder", "walk_breadth_first"]
+)
+def test_walk_deep(method):
+    """A very deep tree can be walked without recursion"""
+    nodes = make_chain(10_000)
+    walked = list(getattr(nodes[0], method)())
+    assert walked == (nodes[::-1] if method == "walk_postorder" else nodes)
+
+
+def test_ancestors():
+    """The ancestors of a node can be iterated over"""
+    nodes = make_tree()
+    assert names(nodes["h"].ancestors()) == "eba"
+    assert names(nodes["c"].ancestors()) == "a"
+    assert list(nodes["a"].ancestors()) == []
+
+    chain = make_chain(10_000)
+    assert list(chain[-1].ancestors()) == chain[-2::-1]
+
+
+def make_chain(depth):
+    """Create a chain of nodes, each the only child of the one before."""
+    style = TreeStyle()
+    nodes = [Node(style=style, children=[]) for _ in range(depth)]
+    # Built from the bottom up, so each add attaches an ever deeper subtree.
+    for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+        parent.add(child)
+    return nodes
+
+
+def test_root_deep_tree():
+    """The root of a very deep tree can be found without recursion."""
+    nodes = make_chain(10_000)
+    top, middle, leaf = nodes[0], nodes[5_000], nodes[-1]
+
+    assert leaf.root is top
+    assert middle.root is top
+
+    # Removing a node makes it the root of its subtree.
+    nodes[4_999].remove(middle)
+    assert leaf.root is middle
+    assert middle.root is middle
+    assert nodes[4_999].root is top
+
+    # Attaching the subtree to another tree changes the root again.
+    other = Node(style=TreeStyle(), children=[])
+    other.add(middle)
+    assert leaf.root is other
+    assert top.root is top
+
+    # Clearing the other tree detaches it again.
+    other.clear()
+    assert leaf.root is middle
+
+
+def test_root_attribute():
+    """_root is still None for a root node, and the root otherwise."""
+    child = Node(style=TreeStyle())
+    parent = Node(style=TreeStyle(), children=[child])
+    assert parent._root is None
+    assert child._root is parent
+
+    # Detached nodes are their own root, even if the root was cached.
+    parent.remove(child)
+    assert child._root is None
+    other = Node(style=TreeStyle(), children=[parent])
+    parent.add(child)
+    assert child._root is other
+    assert parent._root is other
+
+
+def test_root_attach_is_constant_time():
+    """Attaching a subtree doesn't visit the nodes in it."""
+    nodes = make_chain(10_000)
+    leaf = nodes[-1]
+    assert leaf.root is nodes[0]
+    generation = leaf._cached_root_generation
+
+    new_root = Node(style=TreeStyle(), children=[])
+    new_root.add(nodes[0])
+
+    # The leaf's cached root hasn't been touched, but it's known to be out of date.
+    assert leaf._cached_root_generation == generation
+    assert leaf.root is new_root
+
+
+def test_root_wide_tree():
+    """The root of every node in a very wide tree can be found."""
+    style = TreeStyle()
+    children = [Node(style=style, children=[]) for _ in range(10_000)]
+    grandchildren = [Node(style=style) for _ in children]
+    for child, grandchild in zip(children, grandchildren):
+        child.add(grandchild)
+
+    node = Node(style=style, children=children)
+    assert all(grandchild.root is node for grandchild in grandchildren)
+
+    node.remove(children[0])
+    assert grandchildren[0].root is children[0]
+    assert all(grandchild.root is node for grandchild in grandchildren[1:])
+
+
 def test_create_with_no_applicator():
     """A node can be created without an applicator."""
     style = Style(int_prop=5)
@@ -414,7 +1240,40 @@ def test_assign_style_with_applicator():
 
     assert node.style != style_1
 
-    # Since an applicator has already been assigned, assigning style applies the style.
+    # Since an applicator has already been assigned, assigning style applies the
+    # properties that have changed. The style isn't reapplied in full.
+    node.style.apply.assert_called_once_with("int_prop", 10)
+    node.style.reapply.assert_not_called()
+    assert node.style._applicator is node.applicator
+
+
+def test_assign_style_applies_differences():
+    """Assigning a style of the same class only applies what has changed."""
+    node = Node(
+        style=DiffStyle(int_prop=5, str_prop="first", other_prop=1),
+        applicator=Mock(),
+    )
+
+    node.style = DiffStyle(int_prop=5, str_prop="second", extra_prop=0)
+
+    # int_prop is unchanged; other_prop reverts to its initial value; extra_prop
+    # is set, but to its initial value, so is unchanged.
+    assert sorted(node.style.apply.call_args_list) == [
+        call("other_prop", 0),
+        call("str_prop", "second"),
+    ]
+
+    # Assigning an identical style applies nothing.
+    node.style.apply.reset_mock()
+    node.style = node.style
+    node.style.apply.assert_not_called()
+
+
+def test_assign_style_different_class():
+    """Assigning a style of a different class reapplies the whole style."""
+    node = Node(style=DiffStyle(int_prop=5), applicator=Mock())
+
+    node.style = Style(int_prop=5)
     node.style.reapply.assert_called_once()
 
 
@@ -447,9 +1306,17 @@ def test_apply_before_node_is_ready():
         node = Node(style=style)
         node.applicator = applicator
 
+    # A style of a different class is reapplied in full
+    node = Node(style=Style(), applicator=applicator)
     with pytest.warns(RuntimeWarning):
         node.style = BrokenStyle()
 
+    # A failure while applying the differences from the previous style also warns.
+    with pytest.warns(RuntimeWarning):
+        node = Node(style=NotReadyStyle(), applicator=applicator)
+    with pytest.warns(RuntimeWarning):
+        node.style = NotReadyStyle(int_prop=10)
+
     with pytest.warns(RuntimeWarning):
         Node(style=style, applicator=applicator)
 
@@ -465,3 +1332,152 @@ def test_applicator_has_node_reference():
     with catch_warnings():
         filterwarnings("error", category=RuntimeWarning)
         Node(style=AttributeTestStyle(), applicator=Mock())
+
+
+def test_computed_style():
+    """Inherited properties take their value from the nearest ancestor that sets it."""
+    grandchild = Node(style=InheritStyle(size=3))
+    child = Node(style=InheritStyle(), children=[grandchild])
+    root = Node(style=InheritStyle(color="red", size=1), children=[child])
+
+    assert root.computed_style.color == "red"
+    assert child.computed_style["color"] == "red"
+    assert grandchild.computed_style.color == "red"
+
+    # Properties that aren't inherited come from the node's own style.
+    assert child.computed_style.size == 0
+    assert grandchild.computed_style.size == 3
+
+    # Values are cached on the way up the tree.
+    assert child._computed == {"color": "red"}
+
+    # Unknown names can't be looked up.
+    with pytest.raises(KeyError):
+        grandchild.computed_style["unknown"]
+    with pytest.raises(AttributeError):
+        grandchild.computed_style.unknown
+
+    assert dict(grandchild.computed_style) == {"color": "red", "size": 3}
+
+    # Without any ancestor setting it, the property has its initial value.
+    assert Node(style=InheritStyle()).computed_style.color == "black"
+
+
+def test_computed_style_invalidation():
+    """Changing an inherited property invalidates only the affected subtree."""
+    grandchild = Node(style=InheritStyle())
+    child = Node(style=InheritStyle(), children=[grandchild])
+    sibling = Node(style=InheritStyle())
+    root = Node(style=InheritStyle(color="red"), children=[child, sibling])
+
+    assert grandchild.computed_style.color == "red"
+    assert sibling.computed_style.color == "red"
+
+    # Setting the property on the child only affects the child's subtree.
+    child.style.color = "blue"
+    assert "color" in sibling._computed
+    assert grandchild._computed == {}
+    assert grandchild.computed_style.color == "blue"
+    assert sibling.computed_style.color == "red"
+
+    # Changing the root's value affects nodes that inherit it.
+    root.style.color = "green"
+    assert sibling.computed_style.color == "green"
+    assert grandchild.computed_style.color == "blue"
+
+    # Resetting the child's value makes it inherit again.
+    del child.style.color
+    assert grandchild.computed_style.color == "green"
+
+    # Changing a property that isn't inherited doesn't invalidate anything.
+    root.style.size = 5
+    assert grandchild._computed == {"color": "green"}
+
+    # Assigning a new style invalidates the subtree.
+    child.style = InheritStyle(color="yellow")
+    assert grandchild.computed_style.color == "yellow"
+
+
+def test_computed_style_override_with_initial():
+    """An inherited value can be overridden with the property's initial value."""
+    child = Node(style=InheritStyle())
+    other = Node(style=InheritStyle(color="black"))
+    root = Node(style=InheritStyle(color="red"), children=[child, other])
+
+    assert child.computed_style.color == "red"
+    assert other.computed_style.color == "black"
+    assert "color" in other.style
+
+    child.style.color = "black"
+    assert "color" in child.style
+    assert child.computed_style.color == "black"
+
+    # Setting the same value again isn't a change.
+    child.style.apply.reset_mock()
+    child.style.color = "black"
+    child.style.apply.assert_not_called()
+
+    del child.style.color
+    assert child.computed_style.color == "red"
+    assert root.computed_style.color == "red"
+
+
+def test_assign_style_override_with_initial():
+    """An inherited property set to its initial value differs from an unset one."""
+    assert InheritStyle() != InheritStyle(color="black")
+    assert InheritStyle(size=0) == InheritStyle()
+
+    class HashableInheritStyle(InheritStyle, hashable=True):
+        pass
+
+    assert len({HashableInheritStyle(), HashableInheritStyle(color="black")}) == 2
+    assert hash(HashableInheritStyle(size=0)) == hash(HashableInheritStyle())
+
+    # Assigning a style that overrides the inherited value applies it.
+    child = Node(style=InheritStyle(), applicator=Mock())
+    Node(style=InheritStyle(color="red"), children=[child])
+    assert child.computed_style.color == "red"
+
+    child.style = InheritStyle(color="black")
+    child.style.apply.assert_called_once_with("color", "black")
+    assert child.computed_style.color == "black"
+
+    # ... and assigning one that inherits it again applies that too.
+    child.style = InheritStyle()
+    child.style.apply.assert_called_once_with("color", "black")
+    assert child.computed_style.color == "red"
+
+
+def test_computed_style_reparenting():
+    """Moving a node in the tree invalidates its computed values."""
+    child = Node(style=InheritStyle())
+    red = Node(style=InheritStyle(color="red"), children=[child])
+    blue = Node(style=InheritStyle(color="blue"), children=[])
+
+    assert child.computed_style.color == "red"
+
+    red.remove(child)
+    assert child.computed_style.color == "black"
+
+    blue.add(child)
+    assert child.computed_style.color == "blue"
+
+    blue.clear()
+    assert child.computed_style.color == "black"
+
+    red.insert(0, child)
+    assert child.computed_style.color == "red"
+
+
+def test_computed_style_deep():
+    """Resolving a value in a deep tree doesn't recurse."""
+    root = Node(style=InheritStyle(color="red"), children=[])
+    node = root
+    for _ in range(5000):
+        child = Node(style=InheritStyle(), children=[])
+        node.add(child)
+        node = child
+
+    assert node.computed_style.color == "red"
+    root.style.color = "blue"
+    assert node.computed_style.color == "blue"
@@ -0,0 +1,271 @@
+from io import StringIO
+
+import pytest
+
+from tests.utils import prep_style_class
+from travertino import parser
+from travertino.colors import rgb
+from travertino.declaration import (
+    BaseStyle,
+    Choices,
+    directional_property,
+    list_property,
+    validated_property,
+)
+from travertino.parser import ParseError, parse_declarations, parse_stylesheet
+from travertino.stylesheet import Selector, Stylesheet
+
+
+@prep_style_class
+class Style(BaseStyle):
+    padding: int | tuple[int] = directional_property("padding{}")
+    padding_top: int = validated_property(Choices(integer=True), initial=0)
+    padding_right: int = validated_property(Choices(integer=True), initial=0)
+    padding_bottom: int = validated_property(Choices(integer=True), initial=0)
+    padding_left: int = validated_property(Choices(integer=True), initial=0)
+
+    color: str = validated_property(Choices(color=True))
+    font_weight: str = validated_property(Choices("normal", "bold"), initial="normal")
+    font_family: list[str] = list_property(Choices(string=True), initial=("system",))
+
+
+def parse(text, **kwargs):
+    errors = []
+    result = list(parse_declarations(text, Style, on_error=errors.append, **kwargs))
+    return result, [(error.message, error.line, error.column) for error in errors]
+
+
+def test_declarations():
+    result, errors = parse(
+        "padding: 5 10; color: #333; font-weight: bold; "
+        "font_family: 'Times New Roman', serif;"
+    )
+    assert errors == []
+    assert result == [
+        ("padding_top", 5),
+        ("padding_right", 10),
+        ("padding_bottom", 5),
+        ("padding_left", 10),
+        ("color", rgb(0x33, 0x33, 0x33)),
+        ("font_weight", "bold"),
+        ("font_family", ["Times New Roman", "serif"]),
+    ]
+
+    # The result can be used to construct a style.
+    style = Style(**dict(result))
+    assert style.padding == (5, 10, 5, 10)
+
+
+@pytest.mark.parametrize(
+    "text, result",
+    [
+        ("", []),
+        (";;", []),
+        ("color:red", [("color", rgb(255, 0, 0))]),
+        ("color: rgb(1, 2, 3)", [("color", rgb(1, 2, 3))]),
+        ("  color : red ; ", [("color", rgb(255, 0, 0))]),
+        ("/* comment */ color: /* inline */ red", [("color", rgb(255, 0, 0))]),
+        ('font-family: "a, b"', [("font_family", ["a, b"])]),
+        ("font-family: serif", [("font_family", ["serif"])]),
+        (
+            "padding: 1 2 3",
+            [
+                ("padding_top", 1),
+                ("padding_right", 2),
+                ("padding_bottom", 3),
+                ("padding_left", 2),
+            ],
+        ),
+    ],
+)
+def test_declaration_syntax(text, result):
+    assert parse(text) == (result, [])
+
+
+@pytest.mark.parametrize(
+    "text, errors",
+    [
+        ("bogus: 1", [("Unknown property 'bogus'", 1, 1)]),
+        ("color red", [("Expected ':' after 'color'", 1, 7)]),
+        ("color", [("Expected ':' after 'color'", 1, 1)]),
+        ("color:", [("Missing value for 'color'", 1, 1)]),
+        ("color: red,", [("Missing value for 'color'", 1, 1)]),
+        (": red", [("Unexpected ':'", 1, 1)]),
+        ("color: red: blue", [("Unexpected ':'", 1, 11)]),
+        (
+            "color: red, blue",
+            [("Property 'color' doesn't accept a list of values", 1, 1)],
+        ),
+        ("padding: 1 2 3 4 5", [("Property 'padding' takes 1 to 4 values", 1, 1)]),
+        ("padding: x", [("Invalid value 'x' for property padding_top", 1, 1)]),
+        (
+            "color: 'red",
+            [("Unterminated string", 1, 8), ("Missing value for 'color'", 1, 1)],
+        ),
+        (
+            "color: rgb(1, 2",
+            [("Unterminated word", 1, 8), ("Missing value for 'color'", 1, 1)],
+        ),
+    ],
+)
+def test_declaration_errors(text, errors):
+    result, reported = parse(text)
+    assert result == []
+    assert [
+        (message.split(";")[0], line, column) for message, line, column in reported
+    ] == errors
+
+
+def test_unterminated_comment():
+    assert parse("color: red /* x") == (
+        [("color", rgb(255, 0, 0))],
+        [("Unterminated comment", 1, 12)],
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+def test_long_tokens(chunk_size, monkeypatch):
+    """Comments and strings that span many chunks aren't scanned again each time."""
+    scans = []
+    token = parser._TOKEN
+
+    class CountingPattern:
+        def finditer(self, text):
+            scans.append(text)
+            return token.finditer(text)
+
+    monkeypatch.setattr(parser, "_TOKEN", CountingPattern())
+    comment = "/* " + "x * / " * 100 + "*/"
+    family = "Sans " * 99 + "Serif"
+    text = f"{comment} font-family: '{family}'; color: red /* {'x' * 100}"
+
+    assert parse(StringIO(text), chunk_size=chunk_size) == (
+        [
+            ("font_family", [family]),
+            ("color", rgb(255, 0, 0)),
+        ],
+        [("Unterminated comment", 1, len(text) - 102)],
+    )
+    assert len(scans) < 40
+
+
+def test_errors_dont_stop_parsing():
+    result, errors = parse(
+        "color: red;\nbogus: 1;\n  font-weight: heavy;\nfont-weight: bold"
+    )
+    assert result == [("color", rgb(255, 0, 0)), ("font_weight", "bold")]
+    assert [(line, column) for _, line, column in errors] == [(2, 1), (3, 3)]
+
+
+def test_default_error_handler():
+    with pytest.warns(RuntimeWarning, match=r"Unknown property 'bogus' \(line 1"):
+        assert list(parse_declarations("bogus: 1; color: red", Style)) == [
+            ("color", rgb(255, 0, 0))
+        ]
+
+
+def test_parse_error():
+    error = ParseError("Something's wrong", 3, 4)
+    assert isinstance(error, ValueError)
+    assert str(error) == "Something's wrong (line 3, column 4)"
+
+
+STYLESHEET = """\
+/* A stylesheet */
+Box Button, #ok {
+    padding: 5;
+    color: red
+}
+
+.primary { font-weight: bold; font-family: "Comic Sans", serif; }
+Label {}
+"""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 65536])
+def test_stylesheet(chunk_size):
+    padded = {
+        "padding_top": 5,
+        "padding_right": 5,
+        "padding_bottom": 5,
+        "padding_left": 5,
+        "color": rgb(255, 0, 0),
+    }
+    errors = []
+    rules = list(
+        parse_stylesheet(
+            StringIO(STYLESHEET), Style, on_error=errors.append, chunk_size=chunk_size
+        )
+    )
+    assert errors == []
+    assert rules == [
+        (Selector("Box Button"), padded),
+        (Selector("#ok"), padded),
+        (
+            Selector(".primary"),
+            {"font_weight": "bold", "font_family": ["Comic Sans", "serif"]},
+        ),
+        (Selector("Label"), {}),
+    ]
+
+    # Each rule has its own declarations.
+    assert rules[0][1] is not rules[1][1]
+
+    # The rules can be used to build a stylesheet.
+    assert len(Stylesheet(rules)) == 4
+
+
+def test_stylesheet_sources():
+    # An iterable of strings is parsed as one text, even if tokens span chunks.
+    chunks = ["Box { col", "or: r", "ed }"]
+    assert list(parse_stylesheet(chunks, Style)) == [
+        (Selector("Box"), {"color": rgb(255, 0, 0)})
+    ]
+    assert list(parse_stylesheet("".join(chunks), Style)) == [
+        (Selector("Box"), {"color": rgb(255, 0, 0)})
+    ]
+
+
+def test_stylesheet_is_streamed():
+    """Rules are produced before the rest of the source is read."""
+
+    def chunks():
+        yield "Box { color: red }\n"
+        raise AssertionError("Read too far")
+
+    rules = parse_stylesheet(chunks(), Style)
+    # The closing brace is followed by more text, so the rule is complete.
+    assert next(rules) == (Selector("Box"), {"color": rgb(255, 0, 0)})
+
+
+def test_stylesheet_errors():
+    errors = []
+    text = (
+        "Box:hover { color: red }\n"
+        "} Button { bogus: 1; color: blue; }\n"
+        "{ color: red }\n"
+        "Label { color: green"
+    )
+    rules = list(parse_stylesheet(text, Style, on_error=errors.append))
+
+    assert rules == [
+        (Selector("Button"), {"color": rgb(0, 0, 255)}),
+        (Selector("Label"), {"color": rgb(0, 128, 0)}),
+    ]
+    assert [(error.message, error.line, error.column) for error in errors] == [
+        ("Invalid selector 'Box:hover'", 1, 1),
+        ("Unexpected '}'", 2, 1),
+        ("Unknown property 'bogus'", 2, 12),
+        ("Invalid selector ''", 3, 1),
+        ("Unexpected end of input; expected '}'", 4, 7),
+    ]
+
+
+def test_stylesheet_unfinished_selector():
+    errors = []
+    assert list(parse_stylesheet("Box { } Button", Style, on_error=errors.append)) == [
+        (Selector("Box"), {})
+    ]
+    assert [(error.message, error.line, error.column) for error in errors] == [
+        ("Unexpected end of input; expected '{'", 1, 9)
+    ]
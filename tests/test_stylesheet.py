@@ -0,0 +1,167 @@
+import pytest
+
+from tests.utils import prep_style_class
+from travertino.declaration import BaseStyle, Choices, validated_property
+from travertino.layout import BaseBox
+from travertino.node import Node
+from travertino.size import BaseIntrinsicSize
+from travertino.stylesheet import Rule, Selector, SimpleSelector, Stylesheet
+
+
+@prep_style_class
+class Style(BaseStyle):
+    color: str = validated_property(Choices(string=True), initial="black")
+    size: int = validated_property(Choices(integer=True), initial=0)
+
+    class IntrinsicSize(BaseIntrinsicSize):
+        pass
+
+    class Box(BaseBox):
+        pass
+
+
+class Widget(Node):
+    def __init__(self, id=None, classes=(), style=None, children=None):
+        self.id = id
+        self.classes = classes
+        super().__init__(style=style or Style(), children=children)
+
+
+class Box(Widget):
+    def __init__(self, *args, children=(), **kwargs):
+        super().__init__(*args, children=list(children), **kwargs)
+
+
+class Button(Widget):
+    pass
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Button", SimpleSelector("Button", None, frozenset())),
+        ("*", SimpleSelector(None, None, frozenset())),
+        ("#ok", SimpleSelector(None, "ok", frozenset())),
+        (".a.b", SimpleSelector(None, None, frozenset({"a", "b"}))),
+        ("Button#ok.a", SimpleSelector("Button", "ok", frozenset({"a"}))),
+        ("*.a", SimpleSelector(None, None, frozenset({"a"}))),
+    ],
+)
+def test_parse_simple_selector(text, expected):
+    assert SimpleSelector.parse(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "  ", "Button!", "#a#b", ".", "#", "1a", "a>b"])
+def test_invalid_selector(text):
+    with pytest.raises(ValueError, match=r"Invalid selector"):
+        Selector(text)
+
+
+def test_selector():
+    selector = Selector("Box.toolbar  Button#ok")
+    assert str(selector) == "Box.toolbar Button#ok"
+    assert repr(selector) == "<Selector 'Box.toolbar Button#ok'>"
+    assert selector.specificity == (1, 1, 2)
+    assert selector.key == SimpleSelector("Button", "ok", frozenset())
+
+    assert selector == Selector("Box.toolbar Button#ok")
+    assert hash(selector) == hash(Selector("Box.toolbar Button#ok"))
+    assert selector != Selector("Button#ok")
+    assert selector != "Box.toolbar Button#ok"
+
+    assert str(Selector("*")) == "*"
+    assert str(Selector("*.b.a")) == ".a.b"
+
+
+def test_selector_matches():
+    ok = Button(id="ok", classes=["primary"])
+    toolbar = Box(classes=["toolbar"], children=[Box(children=[ok])])
+    root = Box(id="root", children=[toolbar])
+
+    assert Selector("Button").matches(ok)
+    assert Selector("Widget").matches(ok)
+    assert Selector("*").matches(ok)
+    assert Selector("#ok.primary").matches(ok)
+    assert Selector(".toolbar Button").matches(ok)
+    assert Selector("#root .toolbar Box Button").matches(ok)
+    assert Selector("#root Button").matches(ok)
+
+    assert not Selector("Box").matches(ok)
+    assert not Selector("#cancel").matches(ok)
+    assert not Selector(".secondary").matches(ok)
+    assert not Selector(".toolbar #root Button").matches(ok)
+    assert not Selector("Button Button").matches(ok)
+    assert not Selector("Box").matches(Node(style=Style()))
+    assert Selector("Box").matches(root)
+
+
+def test_matching():
+    sheet = Stylesheet(
+        [
+            ("Button", {"color": "red"}),
+            ("#ok", {"color": "green"}),
+            (".primary", {"color": "blue", "size": 2}),
+            ("Button", {"color": "yellow"}),
+            ("Box Button", {"size": 3}),
+            ("*", {"size": 1}),
+            ("#cancel", {"color": "purple"}),
+            (".secondary", {"color": "purple"}),
+            ("Label", {"color": "purple"}),
+            (".other Button", {"color": "purple"}),
+        ]
+    )
+    assert len(sheet) == 10
+
+    ok = Button(id="ok", classes=["primary", "primary"])
+    Box(children=[ok])
+
+    # Rules are ordered by specificity, then by position.
+    assert [str(rule.selector) for rule in sheet.matching(ok)] == [
+        "*",
+        "Button",
+        "Button",
+        "Box Button",
+        ".primary",
+        "#ok",
+    ]
+
+    # Only rules with a matching key are examined.
+    assert len(sheet._candidates(ok)) == 7
+
+    # Properties on the node's own style take precedence.
+    style = sheet.style_for(ok)
+    assert isinstance(style, Style)
+    assert dict(style) == {"color": "green", "size": 2}
+
+    ok.style.size = 10
+    assert dict(sheet.style_for(ok)) == {"color": "green", "size": 10}
+    # The node's style isn't modified.
+    assert dict(ok.style) == {"size": 10}
+
+
+def test_add():
+    sheet = Stylesheet()
+    rule = sheet.add(Selector("Button"), {"color": "red"})
+    assert rule == Rule(Selector("Button"), {"color": "red"}, 0)
+    assert list(sheet) == [rule]
+
+
+def test_merge():
+    first = Stylesheet([("Button", {"color": "red"})])
+    second = Stylesheet([("Button", {"color": "blue"})])
+    button = Button()
+
+    merged = first | second
+    assert len(merged) == 2
+    assert len(first) == 1
+    assert merged.style_for(button).color == "blue"
+    assert (second | first).style_for(button).color == "red"
+
+    first |= second
+    assert len(first) == 2
+    assert first.style_for(button).color == "blue"
+
+    with pytest.raises(TypeError):
+        first | {"color": "red"}
+    with pytest.raises(TypeError):
+        first |= {"color": "red"}